@@ -0,0 +1,333 @@
+"""
+benchmark.py - Benchmark headless từng scene (SDL dummy driver, clock không giới hạn)
+
+Chạy:
+    python benchmark.py                       # in JSON ra stdout
+    python benchmark.py --out bench.json      # ghi file
+    python benchmark.py --compare old.json    # so sánh với lần đo trước
+    python benchmark.py --only gameplay --frames 600 --matrix
+
+Mỗi case chạy GameManager với chuỗi sự kiện kịch bản, dt cố định 1/60 và
+không tick clock — đo thời gian update + draw + flip của từng frame.
+Ranking / progress được ghi vào thư mục tạm (ROBO_SAVES_DIR), không đụng saves/.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+_TMP_DIR = tempfile.mkdtemp(prefix="robo_bench_")
+os.environ.setdefault("ROBO_SAVES_DIR", os.path.join(_TMP_DIR, "saves"))
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pygame
+from src.constants import *
+from src.frame_stats import alloc_counter
+
+
+DT      = 1.0 / 60
+WARMUP  = 30      # Frame chạy trước khi đo (bake atlas, cache text ...)
+SEED    = 1234
+
+
+# ─── Input kịch bản ───────────────────────────────────────────
+
+class ScriptedInput:
+    """
+    Chuột / bàn phím ảo: SDL dummy không cho đặt vị trí chuột thật,
+    nên benchmark thay pygame.mouse.get_pos / key.get_pressed bằng trạng thái này.
+    """
+
+    def __init__(self):
+        self.pos  = (SCREEN_W // 2, SCREEN_H // 2)
+        self.held = set()
+
+    def install(self):
+        pygame.mouse.get_pos     = lambda: self.pos
+        pygame.key.get_pressed   = lambda: _Keys(self.held)
+        pygame.mouse.get_pressed = lambda num_buttons=3: (False,) * num_buttons
+
+    # Sự kiện ----------------------------------------------------
+
+    def move(self, x, y) -> list:
+        old, self.pos = self.pos, (int(x), int(y))
+        return [pygame.event.Event(pygame.MOUSEMOTION, pos=self.pos,
+                                   rel=(self.pos[0] - old[0], self.pos[1] - old[1]),
+                                   buttons=(0, 0, 0))]
+
+    def click(self, x, y) -> list:
+        evs = self.move(x, y)
+        evs.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=self.pos, button=1))
+        evs.append(pygame.event.Event(pygame.MOUSEBUTTONUP,   pos=self.pos, button=1))
+        return evs
+
+    @staticmethod
+    def key(k, text="") -> list:
+        evs = [pygame.event.Event(pygame.KEYDOWN, key=k, mod=0, unicode=text, scancode=0)]
+        if text:
+            evs.append(pygame.event.Event(pygame.TEXTINPUT, text=text))
+        evs.append(pygame.event.Event(pygame.KEYUP, key=k, mod=0, unicode=text, scancode=0))
+        return evs
+
+    @staticmethod
+    def wheel(dy) -> list:
+        return [pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=dy, flipped=False)]
+
+
+class _Keys:
+    def __init__(self, held):
+        self._held = held
+
+    def __getitem__(self, k):
+        return k in self._held
+
+
+# ─── Dữ liệu benchmark ────────────────────────────────────────
+
+def write_question_bank(path: str, n: int = 60):
+    """Bộ câu trắc nghiệm tổng hợp (có câu dài) để kịch bản luôn trả lời được."""
+    rng = random.Random(SEED)
+    words = ("robot năng lượng phản ứng quỹ đạo phân tử tế bào lực hấp dẫn "
+             "phương trình nghiệm đạo hàm tích phân lịch sử triều đại").split()
+    questions = []
+    for i in range(n):
+        length = rng.choice((6, 14, 40))
+        text = " ".join(rng.choice(words) for _ in range(length)).capitalize() + "?"
+        questions.append({
+            "id": f"bench-{i}", "type": Q_MULTIPLE_CHOICE,
+            "difficulty": rng.choice(("easy", "medium", "hard")),
+            "question": text,
+            "choices": {k: " ".join(rng.choice(words) for _ in range(rng.randint(1, 8)))
+                        for k in "ABCD"},
+            "answer": rng.choice("ABCD"), "passage": "", "used": False,
+        })
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"metadata": {"name": "benchmark"}, "questions": questions}, f, ensure_ascii=False)
+
+
+def long_history(n: int = 400) -> list:
+    zones = (ZONE_HEAD_KEY, ZONE_BODY_KEY, ZONE_LIMB_KEY)
+    return [{"question": f"Câu hỏi số {i}: " + "nội dung dài " * (i % 9),
+             "type": Q_MULTIPLE_CHOICE, "zone": zones[i % 3], "correct": i % 3 != 0,
+             "choices": {"A": "a", "B": "b"}, "answer": "A"} for i in range(n)]
+
+
+# ─── Kịch bản từng scene ──────────────────────────────────────
+
+def script_menu(inp, scene, i):
+    # Rà chuột qua các nút (hover animation), không click
+    y = 240 + (i * 3) % 330
+    return inp.move(SCREEN_W // 2 + 40 * np.sin(i * 0.05), y)
+
+
+def script_start(inp, scene, i):
+    if i == 0:
+        return inp.click(SCREEN_W // 2, 306)           # Focus ô nhập tên
+    if i % 6 == 0:
+        ch = "abcdefghij"[(i // 6) % 10]
+        return inp.key(pygame.K_a, ch)
+    return inp.move(SCREEN_W // 2 - 100 + (i * 5) % 200, 420)
+
+
+def script_gameplay(inp, scene, i):
+    """Bắn robot → trả lời đúng câu trắc nghiệm → lặp; rê tâm ngắm giữa các lần."""
+    ov = scene._overlay
+    if ov.is_visible:
+        if i % 20 == 0 and ov._state == ov.STATE_SHOW and ov._question:
+            btn = ov._mc_buttons.get(ov._question.get("answer"))
+            if btn is not None:
+                return inp.click(*btn.rect.center)
+        return []
+    rb = scene._robot
+    if i % 30 == 0:
+        zone = (ZONE_HEAD_KEY, ZONE_BODY_KEY, ZONE_LIMB_KEY)[(i // 30) % 3]
+        rect = rb.hitboxes.get(zone)
+        if rect:
+            return inp.click(*rect.center)
+    return inp.move(rb.cx + 220 * np.sin(i * 0.04), rb.cy - 60 + 80 * np.cos(i * 0.03))
+
+
+def script_multiplayer(inp, scene, i):
+    """P1 giữ phím di chuyển + bắn; P2 bắn; chọn đáp án bằng phím điều hướng."""
+    inp.held = {pygame.K_d} if (i // 60) % 2 == 0 else {pygame.K_a}
+    inp.held |= {pygame.K_RIGHT} if (i // 45) % 2 == 0 else {pygame.K_LEFT}
+    if i % 25 == 0:
+        return inp.key(pygame.K_j)
+    if i % 25 == 12:
+        return inp.key(pygame.K_KP_PLUS)
+    return []
+
+
+def script_result(inp, scene, i):
+    if i % 10 == 0:
+        return inp.move(SCREEN_W // 2, 450) + inp.wheel(-1 if (i // 100) % 2 == 0 else 1)
+    return []
+
+
+# ─── Runner ───────────────────────────────────────────────────
+
+def _percentiles(ms: list) -> dict:
+    a = np.asarray(ms)
+    return {"mean": round(float(a.mean()), 3),
+            "p50":  round(float(np.percentile(a, 50)), 3),
+            "p90":  round(float(np.percentile(a, 90)), 3),
+            "p99":  round(float(np.percentile(a, 99)), 3),
+            "max":  round(float(a.max()), 3)}
+
+
+def _seed():
+    random.seed(SEED)
+    from src import particles
+    particles.rng.bit_generator.state = np.random.default_rng(SEED).bit_generator.state
+
+
+def run_case(manager, inp, scene_id, script, frames, setup=None) -> dict:
+    _seed()
+    manager.go_to(scene_id)
+    manager.update(DT, [])                   # Tạo scene
+    scene = manager._current_scene
+    if setup:
+        setup(scene)
+
+    def step(i):
+        ev = script(inp, scene, i)
+        manager.update(DT, ev)
+        manager.draw()
+        pygame.display.flip()
+
+    for i in range(WARMUP):
+        step(i)
+
+    times, allocs = [], []
+    for i in range(frames):
+        alloc_counter.begin_frame()
+        t0 = time.perf_counter()
+        step(WARMUP + i)
+        times.append((time.perf_counter() - t0) * 1000.0)
+        alloc_counter.end_frame()
+        allocs.append(alloc_counter.last)
+        if manager._current_scene is not scene:
+            break                            # Scene tự chuyển (game over ...)
+
+    total = sum(times) / 1000.0
+    return {
+        "scene":  type(scene).__name__,
+        "frames": len(times),
+        "fps":    round(len(times) / total, 2) if total else 0.0,
+        "frame_ms": _percentiles(times),
+        "alloc_per_frame": {"mean": round(sum(allocs) / len(allocs), 2), "peak": max(allocs)},
+    }
+
+
+def build_cases(matrix: bool) -> list:
+    """(tên, scene_id, script, setup, cấu hình state)."""
+    def gameplay_setup(robot_idx, map_idx):
+        def setup(scene):
+            scene._wave_index = robot_idx
+            scene._spawn_robot(robot_idx)
+            scene._robot_banner_t = 0.0
+            scene._current_map = map_idx
+            scene._env.build(map_idx, scene._wall_lights)
+        return setup
+
+    cases = [
+        ("menu",  SCENE_MENU,  script_menu,  None, {}),
+        ("start", SCENE_START, script_start, None, {"multiplayer_mode": False}),
+    ]
+    if matrix:
+        combos = [(r, m) for m in range(3) for r in range(10)]
+    else:
+        combos = [(r, 0) for r in range(10)] + [(0, 1), (0, 2)]
+    for r, m in combos:
+        cases.append((f"gameplay/robot{r}/map{m}", SCENE_GAMEPLAY, script_gameplay,
+                      gameplay_setup(r, m), {"multiplayer_mode": False, "countdown_mode": False}))
+    cases += [
+        ("multiplayer", SCENE_MULTIPLAYER, script_multiplayer, None, {"multiplayer_mode": True}),
+        ("result/long_history", SCENE_RESULT, script_result, None,
+         {"multiplayer_mode": False, "answered_questions": long_history(),
+          "current_score": 12345, "correct_count": 266, "wrong_count": 134}),
+    ]
+    return cases
+
+
+def compare(report: dict, old_path: str):
+    with open(old_path, encoding="utf-8") as f:
+        old = json.load(f).get("cases", {})
+    print(f"{'case':32s} {'fps old':>9s} {'fps new':>9s} {'Δ%':>7s} {'p99 old':>8s} {'p99 new':>8s}",
+          file=sys.stderr)
+    for name, cur in report["cases"].items():
+        prev = old.get(name)
+        if not prev: continue
+        d = (cur["fps"] / prev["fps"] - 1) * 100 if prev["fps"] else 0.0
+        print(f"{name:32s} {prev['fps']:9.1f} {cur['fps']:9.1f} {d:+6.1f}% "
+              f"{prev['frame_ms']['p99']:8.2f} {cur['frame_ms']['p99']:8.2f}", file=sys.stderr)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="RoboLearn headless scene benchmark")
+    ap.add_argument("--frames",  type=int, default=240, help="Số frame đo mỗi case")
+    ap.add_argument("--only",    default="", help="Lọc case theo tiền tố, phân tách bằng dấu phẩy")
+    ap.add_argument("--matrix",  action="store_true", help="Gameplay: mọi robot × mọi map")
+    ap.add_argument("--out",     default="", help="Ghi JSON ra file thay vì stdout")
+    ap.add_argument("--compare", default="", help="File JSON cũ để so sánh")
+    args = ap.parse_args(argv)
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
+    alloc_counter.install()
+    inp = ScriptedInput()
+    inp.install()
+
+    bank = os.path.join(_TMP_DIR, "bench_questions.json")
+    write_question_bank(bank)
+
+    from src.game_manager import GameManager
+    manager = GameManager(screen)
+    manager.update(DT, [])
+
+    prefixes = [p for p in args.only.split(",") if p]
+    report = {
+        "meta": {
+            "python": platform.python_version(), "pygame": pygame.version.ver,
+            "numpy": np.__version__, "platform": platform.platform(),
+            "machine": platform.machine(), "frames": args.frames, "dt": DT,
+            "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "cases": {},
+    }
+    for name, scene_id, script, setup, state in build_cases(args.matrix):
+        if prefixes and not any(name.startswith(p) for p in prefixes):
+            continue
+        st = manager.state
+        st.player_name = "Bench"
+        st.selected_question_files = [bank]
+        for k, v in state.items():
+            setattr(st, k, v)
+        res = run_case(manager, inp, scene_id, script, args.frames, setup)
+        report["cases"][name] = res
+        print(f"[Bench] {name:32s} {res['fps']:8.1f} fps  p99 {res['frame_ms']['p99']:6.2f} ms  "
+              f"alloc {res['alloc_per_frame']['mean']:.1f}", file=sys.stderr)
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+    if args.compare:
+        compare(report, args.compare)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
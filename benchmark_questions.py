@@ -0,0 +1,183 @@
+"""
+benchmark_questions.py - Benchmark throughput ngân hàng câu hỏi (parse / load / pick / chấm)
+
+Chạy:
+    python benchmark_questions.py                              # 1k, 10k, 100k câu
+    python benchmark_questions.py --sizes 1000,500000 --out q.json
+    python benchmark_questions.py --compare q.json             # so với baseline đã lưu
+    python benchmark_questions.py --only parse,load --repeat 5
+
+Bộ đề sinh bằng create_sample_data.generate_bank (có ~2% block lỗi cố ý), lưu ở
+thư mục tạm. Mỗi case lấy thời gian tốt nhất trong --repeat lần, báo số câu / giây.
+--compare: in Δ% từng case; mã thoát 1 nếu có case chậm hơn baseline quá --tolerance %.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from create_sample_data import generate_bank, generate_bank_lines
+from src.constants import ZONE_HEAD_KEY, ZONE_BODY_KEY, ZONE_LIMB_KEY
+from src.question_parser import QuestionParser
+from src.question_manager import QuestionManager
+from src.question_pack import pack_path_for
+from src.question_dedupe import sig_path_for
+
+
+SEED   = 1234
+ZONES  = (ZONE_HEAD_KEY, ZONE_BODY_KEY, ZONE_LIMB_KEY)
+PICKS  = 50000      # Số lần lấy câu cho case pick (quay vòng pool khi hết)
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _answer_for(q):
+    """Đáp án đúng dạng người chơi nhập (SA số → thêm đơn vị để đi qua normalize)."""
+    if q.type == "multiple_choice":
+        return q.mc_key
+    if q.type == "short_answer":
+        return f"{q.answer} cm" if q.sa_value is not None else q.answer.upper()
+    return dict(q.answer)
+
+
+# ─── Case ─────────────────────────────────────────────────────
+
+def bench_size(n: int, tmp: str, repeat: int, only: list) -> dict:
+    def want(name):
+        return not only or any(name.startswith(p) for p in only)
+
+    cases = {}
+    parser = QuestionParser()
+    docx_path, json_path, valid = generate_bank(n, tmp, SEED)
+
+    if want("parse.lines"):
+        lines = generate_bank_lines(n, SEED)
+        t = _best(lambda: parser._parse_lines(lines), repeat)
+        cases[f"parse.lines/{n}"] = {"n": n, "seconds": t, "per_sec": n / t}
+
+    if want("parse.docx"):
+        t = _best(lambda: parser.parse_docx(docx_path), repeat)
+        cases[f"parse.docx/{n}"] = {"n": n, "seconds": t, "per_sec": n / t}
+
+    qm = QuestionManager()
+    if want("load"):
+        # load.json: chưa có gói .qpk / chữ ký (đọc JSON + ghi lại) · load.pack: mở file đã có
+        def load_cold():
+            qm.close()
+            for p in (pack_path_for(json_path), sig_path_for(json_path)):
+                if os.path.exists(p):
+                    os.remove(p)
+            qm.load_files([json_path])
+        t = _best(load_cold, repeat)
+        cases[f"load.json/{n}"] = {"n": valid, "seconds": t, "per_sec": valid / t}
+        t = _best(lambda: qm.load_files([json_path]), repeat)
+        cases[f"load.pack/{n}"] = {"n": valid, "seconds": t, "per_sec": valid / t}
+    else:
+        qm.load_files([json_path])
+
+    if want("pick"):
+        def pick():
+            random.seed(SEED)
+            qm._rebuild_pool()
+            for i in range(PICKS):
+                qm.get_question_for_zone(ZONES[i % 3])
+        # Pool nhỏ hơn PICKS sẽ in "Pool exhausted" mỗi vòng — tắt stdout khi đo
+        stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+        try:
+            t = _best(pick, repeat)
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+        cases[f"pick/{n}"] = {"n": PICKS, "seconds": t, "per_sec": PICKS / t}
+
+    if want("check"):
+        qs    = [qm.question_at(i) for i in range(len(qm))]
+        pairs = [(q, _answer_for(q)) for q in qs]
+
+        def check():
+            for q, a in pairs:
+                if not q.check(a):
+                    raise AssertionError(f"check sai: {q!r} {a!r}")
+        t = _best(check, repeat)
+        cases[f"check/{n}"] = {"n": len(pairs), "seconds": t, "per_sec": len(pairs) / t}
+
+    qm.close()
+    return cases
+
+
+def compare(report: dict, old_path: str, tolerance: float) -> bool:
+    """In bảng so sánh; True nếu không có case nào chậm hơn quá tolerance %."""
+    with open(old_path, encoding="utf-8") as f:
+        old = json.load(f).get("cases", {})
+    ok = True
+    print(f"{'case':24s} {'q/s old':>12s} {'q/s new':>12s} {'Δ%':>7s}", file=sys.stderr)
+    for name, cur in report["cases"].items():
+        prev = old.get(name)
+        if not prev: continue
+        d = (cur["per_sec"] / prev["per_sec"] - 1) * 100 if prev["per_sec"] else 0.0
+        flag = ""
+        if d < -tolerance:
+            flag, ok = "  ⚠ chậm hơn", False
+        print(f"{name:24s} {prev['per_sec']:12.0f} {cur['per_sec']:12.0f} {d:+6.1f}%{flag}",
+              file=sys.stderr)
+    return ok
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="RoboLearn question bank throughput benchmark")
+    ap.add_argument("--sizes",  default="1000,10000,100000", help="Số câu, phân tách bằng dấu phẩy")
+    ap.add_argument("--only",   default="", help="Lọc case theo tiền tố (parse,load,pick,check)")
+    ap.add_argument("--repeat", type=int, default=3, help="Số lần đo mỗi case (lấy nhanh nhất)")
+    ap.add_argument("--out",    default="", help="Ghi JSON ra file (baseline) thay vì stdout")
+    ap.add_argument("--compare", default="", help="File JSON baseline để so sánh")
+    ap.add_argument("--tolerance", type=float, default=10.0, help="Ngưỡng chậm hơn (%%) khi --compare")
+    args = ap.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    only  = [p for p in args.only.split(",") if p]
+    report = {
+        "meta": {
+            "python": platform.python_version(), "platform": platform.platform(),
+            "machine": platform.machine(), "sizes": sizes, "repeat": args.repeat,
+            "seed": SEED, "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "cases": {},
+    }
+    tmp = tempfile.mkdtemp(prefix="robo_qbench_")
+    try:
+        for n in sizes:
+            for name, res in bench_size(n, tmp, args.repeat, only).items():
+                report["cases"][name] = res
+                print(f"[QBench] {name:24s} {res['per_sec']:12.0f} /s  ({res['seconds'] * 1000:8.1f} ms)",
+                      file=sys.stderr)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+    if args.compare and not compare(report, args.compare, args.tolerance):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,12 +7,18 @@ Chạy script này để tạo:
 3. File JSON mẫu (để test ngay không cần docx)
 
 Chạy: python create_sample_data.py
+
+Bộ đề lớn để benchmark (docx + json, có block lỗi cố ý):
+    python create_sample_data.py --bank 100000 --out /tmp/bank --malformed 0.02
 """
 
 import os
 import sys
 import json
 import uuid
+import random
+import zipfile
+from xml.sax.saxutils import escape
 
 BASE_DIR = os.path.dirname(__file__)
 DATA_DIR = os.path.join(BASE_DIR, "data")
@@ -286,7 +292,126 @@ def create_sample_docx():
     return doc
 
 
+# ─── Bộ đề lớn (benchmark) ──────────────────────────────────
+
+_VI_WORDS = (
+    "học sinh", "giáo viên", "phương trình", "hàm số", "đồ thị", "nguyên tử", "phân tử",
+    "tế bào", "quang hợp", "năng lượng", "vận tốc", "gia tốc", "lực", "khối lượng",
+    "nhiệt độ", "áp suất", "dòng điện", "điện trở", "tam giác", "hình tròn", "diện tích",
+    "chu vi", "lịch sử", "địa lý", "văn học", "bài thơ", "tác giả", "thế kỷ", "triều đại",
+    "sông", "núi", "đồng bằng", "khí hậu", "dân số", "kinh tế", "xã hội", "ngôn ngữ",
+    "máy tính", "thuật toán", "dữ liệu", "mạng", "chương trình", "biến", "vòng lặp",
+    "của", "là", "và", "trong", "được", "có", "không", "nào", "bao nhiêu", "tại sao",
+)
+_DIFFS = ("easy", "medium", "hard")
+
+
+def _vi_sentence(rng, lo=6, hi=14) -> str:
+    words = [rng.choice(_VI_WORDS) for _ in range(rng.randint(lo, hi))]
+    return words[0].capitalize() + " " + " ".join(words[1:])
+
+
+def generate_bank_lines(n: int, seed: int = 0, malformed: float = 0.02,
+                        mix=(0.6, 0.25, 0.15)) -> list:
+    """
+    n block câu hỏi dạng dòng .docx: tỉ lệ MC / SA / FA theo mix, độ khó ngẫu nhiên,
+    khoảng `malformed` block sai định dạng (thiếu đáp án, thiếu lựa chọn, đáp án sai key...).
+    """
+    rng = random.Random(seed)
+    lines = []
+    for i in range(n):
+        diff = rng.choice(_DIFFS)
+        bad  = rng.random() < malformed
+        r    = rng.random()
+        if r < mix[0]:
+            lines += [f"[MC] [{diff}]", f"Câu hỏi: {_vi_sentence(rng)} (câu {i + 1})?"]
+            keys = "ABC" if bad and rng.random() < 0.5 else "ABCD"
+            lines += [f"{k}. {_vi_sentence(rng, 2, 6)}" for k in keys]
+            lines.append("Đáp án: " + ("E" if bad and keys == "ABCD" else rng.choice(keys)))
+        elif r < mix[0] + mix[1]:
+            lines += [f"[SA] [{diff}]", f"Câu hỏi: {_vi_sentence(rng)} (câu {i + 1})?"]
+            if not bad:
+                kind = rng.random()
+                if kind < 0.5:
+                    ans = str(rng.randint(-500, 5000))
+                elif kind < 0.8:
+                    ans = f"{rng.uniform(-100, 100):.{rng.randint(1, 3)}f}".replace(".", rng.choice(".,"))
+                else:
+                    ans = rng.choice(_VI_WORDS)
+                lines.append(f"Đáp án: {ans}")
+        else:
+            lines.append(f"[FA] [{diff}]")
+            if not bad or rng.random() < 0.5:
+                lines.append(f"Dữ kiện: {_vi_sentence(rng, 20, 40)}. {_vi_sentence(rng, 10, 20)} (câu {i + 1}).")
+            lines += [f"{k}. {_vi_sentence(rng, 4, 9)}" for k in "ABCD"]
+            keys = "ABC" if bad else "ABCD"
+            lines.append("Đáp án: " + ",".join(f"{k}-{rng.choice(('Đúng', 'Sai'))}" for k in keys))
+        lines.append("")
+    return lines
+
+
+_DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+_DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/></Relationships>'
+)
+
+
+def write_bank_docx(path: str, lines: list):
+    """
+    Ghi .docx tối giản (1 đoạn / dòng) trực tiếp bằng zipfile — python-docx quá chậm
+    cho hàng trăm nghìn đoạn. Word và python-docx đều mở được.
+    """
+    body = "".join(
+        f'<w:p><w:r><w:t xml:space="preserve">{escape(l)}</w:t></w:r></w:p>' if l else "<w:p/>"
+        for l in lines
+    )
+    doc = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+           '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+           f'<w:body>{body}</w:body></w:document>')
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", _DOCX_CONTENT_TYPES)
+        zf.writestr("_rels/.rels", _DOCX_RELS)
+        zf.writestr("word/document.xml", doc)
+
+
+def write_bank_json(path: str, lines: list, metadata: dict | None = None) -> tuple:
+    """Parse lines bằng QuestionParser (id giống hệt khi import .docx) rồi lưu .json."""
+    sys.path.insert(0, BASE_DIR)
+    from src.question_parser import QuestionParser
+    parser = QuestionParser()
+    questions, errors = parser._parse_lines(lines)
+    parser.save_questions(questions, path, metadata or {})
+    return questions, errors
+
+
+def generate_bank(n: int, out_dir: str, seed: int = 0, malformed: float = 0.02) -> tuple:
+    """Tạo bank_<n>.docx + bank_<n>.json trong out_dir. Trả về (docx, json, số câu hợp lệ)."""
+    os.makedirs(out_dir, exist_ok=True)
+    lines     = generate_bank_lines(n, seed, malformed)
+    docx_path = os.path.join(out_dir, f"bank_{n}.docx")
+    json_path = os.path.join(out_dir, f"bank_{n}.json")
+    write_bank_docx(docx_path, lines)
+    questions, _ = write_bank_json(json_path, lines, {
+        "source_file": os.path.basename(docx_path), "class": "Benchmark", "subject": f"bank_{n}",
+    })
+    return docx_path, json_path, len(questions)
+
+
 def main():
+    if "--bank" in sys.argv:
+        return main_bank()
     print("=" * 60)
     print("  RoboLearn Shooter - Tạo Dữ Liệu Mẫu")
     print("=" * 60)
@@ -331,5 +456,19 @@ def main():
     print("   Dữ liệu mẫu đã được tạo tại: data/Lớp 10/Tổng Hợp/")
 
 
+def main_bank():
+    import argparse
+    ap = argparse.ArgumentParser(description="Tạo bộ đề lớn (docx + json) để benchmark")
+    ap.add_argument("--bank", type=int, required=True, help="Số câu hỏi (vd 1000 .. 500000)")
+    ap.add_argument("--out", default=os.path.join(BASE_DIR, "examples"), help="Thư mục ra")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--malformed", type=float, default=0.02, help="Tỉ lệ block sai định dạng")
+    args = ap.parse_args()
+
+    docx_path, json_path, valid = generate_bank(args.bank, args.out, args.seed, args.malformed)
+    print(f"✓ {docx_path}")
+    print(f"✓ {json_path}  ({valid}/{args.bank} câu hợp lệ)")
+
+
 if __name__ == "__main__":
     main()
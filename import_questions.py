@@ -0,0 +1,62 @@
+"""
+import_questions.py - Import hàng loạt file .docx vào ngân hàng câu hỏi (không mở game)
+
+Chạy:
+    python import_questions.py "De thi/" --class "Lớp 10" --subject "Toán"
+    python import_questions.py a.docx b.docx --class "Lớp 11" --subject "Lý" --workers 4
+    python import_questions.py "De thi/" --class "Lớp 12" --subject "Hoá" --recursive
+
+Mỗi file .docx → data/<lớp>/<môn>/<tên file>.json (ghi đè nếu đã có).
+Parse song song trên nhiều tiến trình; in tóm tắt từng file (câu hợp lệ / block lỗi /
+block lấy lại từ cache import). File không đổi so với lần import trước xong ngay.
+Mã thoát 1 nếu có file lỗi.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.constants import DATA_DIR
+from src.question_importer import find_docx, iter_import, batch_summary
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Import hàng loạt file .docx câu hỏi")
+    ap.add_argument("paths", nargs="+", help="File .docx hoặc thư mục")
+    ap.add_argument("--class", dest="cls", required=True, help="Tên lớp (thư mục trong data/)")
+    ap.add_argument("--subject", required=True, help="Tên môn")
+    ap.add_argument("--workers", type=int, default=None, help="Số tiến trình (mặc định: số CPU)")
+    ap.add_argument("--recursive", action="store_true", help="Tìm .docx trong cả thư mục con")
+    args = ap.parse_args()
+
+    files = find_docx(args.paths, args.recursive)
+    if not files:
+        print("[Import] Không tìm thấy file .docx nào", file=sys.stderr)
+        return 1
+
+    dest_dir = os.path.join(DATA_DIR, args.cls, args.subject)
+    metadata = {"class": args.cls, "subject": args.subject}
+    workers  = args.workers or os.cpu_count() or 1
+    print(f"[Import] {len(files)} file → {dest_dir}  ({min(workers, len(files))} tiến trình)",
+          file=sys.stderr)
+
+    t0 = time.perf_counter()
+    results = []
+    for r in iter_import(files, dest_dir, metadata, workers):
+        results.append(r)
+        if r["error"]:
+            print(f"  ✗ {r['file']:40s} {r['error']}")
+        else:
+            print(f"  ✓ {r['file']:40s} {r['valid']:5d} câu  {r['failed']:4d} lỗi"
+                  f"  {r['reused']:5d} dùng lại")
+    elapsed = time.perf_counter() - t0
+
+    print(f"[Import] {batch_summary(results)}  ({elapsed:.1f}s)", file=sys.stderr)
+    return 1 if any(r["error"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,16 @@
 import sys
 import os
+import multiprocessing
 
 # Thêm thư mục gốc vào sys.path để import module nội bộ
 sys.path.insert(0, os.path.dirname(__file__))
 
 import pygame
-from src.constants import SCREEN_W, SCREEN_H, FPS, TITLE
+from src.constants import SCREEN_W, SCREEN_H, FPS, TITLE, DEBUG_ALLOC
 from src.game_manager import GameManager
+from src.frame_stats import alloc_counter
+from src.profiler import profiler
+from src.persistence import persistence
 
 
 def main():
@@ -22,6 +26,10 @@ def main():
     # GameManager điều phối tất cả các màn hình (scene)
     manager = GameManager(screen)
 
+    # Debug: đếm Surface cấp phát mỗi frame
+    if DEBUG_ALLOC:
+        alloc_counter.install()
+
     running = True
     while running:
         dt = clock.tick(FPS) / 1000.0  
@@ -33,14 +41,28 @@ def main():
                 running = False
 
         # Cập nhật + vẽ scene hiện tại
-        manager.update(dt, events)
-        manager.draw()
+        alloc_counter.begin_frame()
+        profiler.begin_frame()
+        with profiler.stage("update"):
+            manager.update(dt, events)
+        with profiler.stage("draw"):
+            manager.draw()
+        profiler.end_frame()
+        alloc_counter.end_frame()
+        if DEBUG_ALLOC:
+            alloc_counter.draw(screen)      # Profiler F3 tự hiện số alloc trong panel của nó
+        profiler.draw(screen)
 
         pygame.display.flip()
 
+    # Đóng cửa sổ: ghi nốt những gì còn trong hàng đợi
+    persistence.flush(timeout=5.0)
     pygame.quit()
     sys.exit()
 
 
 if __name__ == "__main__":
+    # Bản exe: tiến trình con của import hàng loạt (spawn) chạy lại chính file exe —
+    # freeze_support() cho nó làm việc của worker thay vì mở thêm cửa sổ game
+    multiprocessing.freeze_support()
     main()
@@ -5,10 +5,18 @@ assets.py - Font Manager với hỗ trợ tiếng Việt đầy đủ
 import pygame
 import os
 import sys
+from collections import OrderedDict
 
 from src.constants import (
     FONTS_DIR, FONT_XL, FONT_LG, FONT_MD, FONT_SM, FONT_XS,
 )
+from src.render_utils import display_format
+
+
+# Cache text: ngân sách bộ nhớ (byte, ước lượng 4 byte/pixel) + giới hạn layout
+TEXT_CACHE_BUDGET   = 24 * 1024 * 1024
+LAYOUT_CACHE_MAX    = 512      # Số đoạn văn đã wrap giữ lại
+WORD_WIDTH_MEMO_MAX = 20000    # Số từ đã đo giữ lại cho mỗi font
 
 
 def _find_unicode_font_path() -> str | None:
@@ -113,6 +121,13 @@ class AssetManager:
         self._initialized = True
         self._fonts = {}
         self._path = None
+        # LRU cache: key → surface đã convert (dùng chung giữa các lời gọi)
+        self._text_cache: OrderedDict = OrderedDict()
+        self._text_cache_bytes = 0
+        self._text_cache_budget = TEXT_CACHE_BUDGET
+        self._text_stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._layouts: OrderedDict = OrderedDict()
+        self._word_widths: dict = {}
         self._load()
 
     def _load(self):
@@ -141,7 +156,70 @@ class AssetManager:
         shadow: bool = False,
         shadow_color=(0, 0, 0),
         shadow_offset: int = 2,
+        alpha: int = 255,
     ) -> pygame.Surface:
+        """
+        Render text có cache LRU. Surface trả về được DÙNG CHUNG:
+        không vẽ/fill lên nó, và blit ngay sau khi lấy.
+        Muốn mờ dần thì truyền alpha= (mỗi lần lấy đều đặt lại alpha,
+        nên lời gọi trước không làm hỏng entry trong cache).
+        """
+        key = (text, size, tuple(color), bold, antialias, shadow,
+               tuple(shadow_color) if shadow else None, shadow_offset if shadow else 0)
+        surf = self._text_cache.get(key)
+        if surf is not None:
+            self._text_cache.move_to_end(key)
+            self._text_stats["hits"] += 1
+        else:
+            self._text_stats["misses"] += 1
+            surf = display_format(
+                self._render_text_uncached(text, size, color, bold, antialias,
+                                           shadow, shadow_color, shadow_offset),
+                alpha=True)
+            self._cache_put(key, surf)
+
+        alpha = max(0, min(255, int(alpha)))
+        if surf.get_alpha() != alpha:
+            surf.set_alpha(alpha)
+        return surf
+
+    def _cache_put(self, key, surf: pygame.Surface):
+        nbytes = surf.get_width() * surf.get_height() * 4
+        if nbytes > self._text_cache_budget:
+            return   # Quá lớn → không cache
+        self._text_cache[key] = surf
+        self._text_cache_bytes += nbytes
+        self._evict_to_budget()
+
+    def _evict_to_budget(self):
+        """Bỏ các entry lâu không dùng nhất cho tới khi nằm trong ngân sách."""
+        while self._text_cache and self._text_cache_bytes > self._text_cache_budget:
+            _, old = self._text_cache.popitem(last=False)
+            self._text_cache_bytes -= old.get_width() * old.get_height() * 4
+            self._text_stats["evictions"] += 1
+
+    def text_cache_stats(self) -> dict:
+        """Thống kê cache text: hits, misses, evictions, entries, bytes, hit_rate."""
+        st = dict(self._text_stats)
+        total = st["hits"] + st["misses"]
+        st["entries"]  = len(self._text_cache)
+        st["bytes"]    = self._text_cache_bytes
+        st["budget"]   = self._text_cache_budget
+        st["hit_rate"] = st["hits"] / total if total else 0.0
+        return st
+
+    def set_text_cache_budget(self, nbytes: int):
+        self._text_cache_budget = max(0, int(nbytes))
+        self._evict_to_budget()
+
+    def clear_text_cache(self):
+        self._text_cache.clear()
+        self._text_cache_bytes = 0
+        self._layouts.clear()
+        self._word_widths.clear()
+
+    def _render_text_uncached(self, text, size, color, bold, antialias,
+                              shadow, shadow_color, shadow_offset) -> pygame.Surface:
         f = self.font(size, bold)
         try:
             surf = f.render(text, antialias, color)
@@ -165,36 +243,73 @@ class AssetManager:
 
         return surf
 
-    def render_text_wrapped(
+    # ─── Text layout (wrap) ──────────────────────────────────
+
+    def _word_width(self, size: str, bold: bool, word: str) -> int:
+        """Độ rộng 1 từ (memo theo font) — mỗi từ chỉ đo 1 lần."""
+        fk = (size, bold)
+        widths = self._word_widths.get(fk)
+        if widths is None:
+            widths = self._word_widths[fk] = {}
+        w = widths.get(word)
+        if w is None:
+            if len(widths) > WORD_WIDTH_MEMO_MAX:
+                widths.clear()
+            try:
+                w = self.font(size, bold).size(word)[0]
+            except Exception:
+                w = len(word) * 10
+            widths[word] = w
+        return w
+
+    def layout_text(
         self,
         text: str,
         max_width: int,
         size: str = "sm",
-        color=(255, 255, 255),
         bold: bool = False,
         line_spacing: int = 8,
-    ) -> pygame.Surface:
+    ) -> "TextLayout":
+        """
+        Wrap text theo max_width trong thời gian tuyến tính:
+        cộng dồn độ rộng từ (đã memo) + khoảng trắng thay vì đo lại cả dòng
+        sau mỗi từ.
+        Kết quả được cache theo (text, max_width, size, bold, line_spacing).
+        """
+        key = (text, max_width, size, bold, line_spacing)
+        layout = self._layouts.get(key)
+        if layout is not None:
+            self._layouts.move_to_end(key)
+            return layout
+
         f = self.font(size, bold)
+        space_w = self._word_width(size, bold, " ")
         lines = []
-
         for para in text.split("\n"):
             words = para.split()
             if not words:
                 lines.append("")
                 continue
-            cur = []
+            cur, cur_w = [], 0
             for word in words:
-                test = " ".join(cur + [word])
-                try:
-                    w = f.size(test)[0]
-                except Exception:
-                    w = len(test) * 10
-                if w <= max_width:
+                ww = self._word_width(size, bold, word)
+                if not cur:
+                    cur, cur_w = [word], ww
+                    continue
+                # Tổng độ rộng từng từ luôn >= độ rộng cả dòng → chắc chắn vừa.
+                # Chỉ đo lại cả dòng ở điểm có thể xuống dòng (1 lần mỗi dòng).
+                cand_w = cur_w + space_w + ww
+                if cand_w > max_width:
+                    try:
+                        cand_w = f.size(" ".join(cur) + " " + word)[0]
+                    except Exception:
+                        pass
+                if cand_w <= max_width:
                     cur.append(word)
+                    cur_w = cand_w
                 else:
-                    if cur:
-                        lines.append(" ".join(cur))
-                    cur = [word]
+                    lines.append(" ".join(cur))
+                    cur, cur_w = [word], ww
             if cur:
                 lines.append(" ".join(cur))
 
@@ -202,8 +317,34 @@ class AssetManager:
             lines = [""]
 
         lh = f.get_linesize() + line_spacing
-        surf = pygame.Surface((max(1, max_width), max(1, lh * len(lines))), pygame.SRCALPHA)
-        for i, line in enumerate(lines):
+        layout = TextLayout(lines, lh, max(1, max_width))
+        self._layouts[key] = layout
+        if len(self._layouts) > LAYOUT_CACHE_MAX:
+            self._layouts.popitem(last=False)
+        return layout
+
+    def render_text_wrapped(
+        self,
+        text: str,
+        max_width: int,
+        size: str = "sm",
+        color=(255, 255, 255),
+        bold: bool = False,
+        line_spacing: int = 8,
+    ) -> pygame.Surface:
+        """Render đoạn văn đã wrap. Surface được cache + dùng chung như render_text."""
+        key = ("wrap", text, max_width, size, tuple(color), bold, line_spacing)
+        surf = self._text_cache.get(key)
+        if surf is not None:
+            self._text_cache.move_to_end(key)
+            self._text_stats["hits"] += 1
+            return surf
+        self._text_stats["misses"] += 1
+
+        layout = self.layout_text(text, max_width, size, bold, line_spacing)
+        f = self.font(size, bold)
+        surf = pygame.Surface((layout.width, max(1, layout.height)), pygame.SRCALPHA)
+        for i, line in enumerate(layout.lines):
             if not line:
                 continue
             try:
@@ -211,8 +352,25 @@ class AssetManager:
             except Exception:
                 safe = line.encode("ascii", errors="replace").decode("ascii")
                 rs = f.render(safe, True, color)
-            surf.blit(rs, (0, i * lh))
+            surf.blit(rs, (0, i * layout.line_h))
+        surf = display_format(surf, alpha=True)
+        self._cache_put(key, surf)
         return surf
 
 
+class TextLayout:
+    """Kết quả wrap 1 đoạn văn: các dòng + chiều cao mỗi dòng."""
+
+    __slots__ = ("lines", "line_h", "width")
+
+    def __init__(self, lines: list, line_h: int, width: int):
+        self.lines  = lines
+        self.line_h = line_h
+        self.width  = width
+
+    @property
+    def height(self) -> int:
+        return self.line_h * len(self.lines)
+
+
 assets = AssetManager()
\ No newline at end of file
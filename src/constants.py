@@ -13,7 +13,8 @@ TITLE = "RoboLearn Shooter — Học & Chiến"
 # === ĐƯỜNG DẪN ===
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
-SAVES_DIR = os.path.join(BASE_DIR, "saves")
+# ROBO_SAVES_DIR: ghi ranking/progress ra thư mục khác (benchmark, test)
+SAVES_DIR = os.environ.get("ROBO_SAVES_DIR") or os.path.join(BASE_DIR, "saves")
 ASSETS_DIR = os.path.join(BASE_DIR, "assets")
 FONTS_DIR = os.path.join(ASSETS_DIR, "fonts")
 
@@ -22,7 +23,11 @@ for _dir in [DATA_DIR, SAVES_DIR, ASSETS_DIR, FONTS_DIR]:
 
 # === FILE LƯU TRỮ ===
 RANKING_FILE = os.path.join(SAVES_DIR, "ranking.json")
-PROGRESS_FILE = os.path.join(SAVES_DIR, "progress.json")
+RANKING_LOG_FILE = os.path.join(SAVES_DIR, "ranking.log")     # Nhật ký kết quả chưa gộp vào ranking.json
+PROGRESS_FILE = os.path.join(SAVES_DIR, "progress.db")     # Tiến độ từng người chơi (progress_store)
+CATALOG_FILE = os.path.join(SAVES_DIR, "catalog.json")   # Chỉ mục ngân hàng câu hỏi
+IMPORT_CACHE_FILE = os.path.join(SAVES_DIR, "import_cache.json")   # Kết quả parse .docx theo hash
+QUESTION_STORE_FILE = os.path.join(SAVES_DIR, "questions.db")    # Kho SQLite tìm kiếm câu hỏi
 
 # === MÀU SẮC ===
 BLACK       = (0,   0,   0)
@@ -81,6 +86,13 @@ ZONE_DIFFICULTY = {
     ZONE_LIMB_KEY: "easy",
 }
 
+# Bộ lọc dạng / độ khó (tìm câu hỏi, chọn pool): (giá trị, nhãn) — None = tất cả
+Q_TYPE_FILTERS = [
+    (None, "Tất cả"), (Q_MULTIPLE_CHOICE, "Trắc nghiệm"),
+    (Q_SHORT_ANSWER, "Trả lời ngắn"), (Q_FACT_ANALYSIS, "Phân tích"),
+]
+DIFFICULTY_FILTERS = [(None, "Tất cả"), ("easy", "Dễ"), ("medium", "Trung bình"), ("hard", "Khó")]
+
 # === UI ===
 BUTTON_H        = 52
 BUTTON_RADIUS   = 10
@@ -103,4 +115,8 @@ SCENE_RESULT        = "result"
 SCENE_QUIT          = "quit"
 
 # Multiplayer scene
-SCENE_MULTIPLAYER   = "multiplayer"
\ No newline at end of file
+SCENE_MULTIPLAYER   = "multiplayer"
+
+# === DEBUG ===
+# ROBO_DEBUG_ALLOC=1 → đếm số Surface được tạo mỗi frame (hiện ở góc màn hình)
+DEBUG_ALLOC = os.environ.get("ROBO_DEBUG_ALLOC", "") == "1"
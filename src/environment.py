@@ -0,0 +1,293 @@
+"""
+environment.py - Môi trường FPS theo map (lớp tĩnh bake sẵn + lớp động vẽ mỗi frame)
+"""
+
+import math
+import random
+import pygame
+import pygame.gfxdraw
+from src.constants import *
+from src.render_utils import display_format
+
+
+ENV_FOG = (10, 14, 28)
+
+# ─── Bảng màu từng map ───────────────────────────────────────
+LAB_NEON    = (0, 180, 80)
+SPACE_NEON  = (40, 100, 255)
+JUNGLE_NEON = (20, 200, 60)
+
+LAB_TUBE_COLORS = [(0,220,100),(100,255,180),(0,180,60),(180,255,80)]
+JUNGLE_LEAF_COLORS = [(20,200,60),(30,160,50),(40,220,80)]
+
+
+class EnvironmentRenderer:
+    """
+    Vẽ môi trường cho GameplayScene.
+    - Lớp tĩnh (gradient, lưới sàn, panel, cột, thân cây...) được bake 1 lần
+      vào surface cùng format màn hình mỗi khi đổi map.
+    - Lớp động (đèn nhấp nháy, ống nghiệm, bong bóng, holo, sao, lá, quả)
+      vẽ đè mỗi frame.
+    - Sương mù chân trời là 1 strip bake sẵn, blit cuối cùng.
+    """
+
+    FOG_H = 60
+
+    def __init__(self):
+        self._map         = -1
+        self._wall_lights = []
+        self._static: pygame.Surface | None = None
+        self._fog:    pygame.Surface | None = None
+        self._stars       = []     # [(x, y, sprite, base_alpha)]
+        self._star_sprites= {}
+        self._leaf_sprites= []
+
+    # ─── Build ────────────────────────────────────────────────
+
+    def build(self, map_index: int, wall_lights: list):
+        """Bake lớp tĩnh cho map. Gọi khi vào map hoặc khi đổi map."""
+        self._map         = map_index
+        self._wall_lights = wall_lights
+
+        static = pygame.Surface((SCREEN_W, SCREEN_H))
+        hz = SCREEN_H // 2
+        if   map_index == 1: self._bake_space(static, hz)
+        elif map_index == 2: self._bake_jungle(static, hz)
+        else:                self._bake_lab(static, hz)
+        if map_index != 1:
+            self._bake_wall_bulbs(static)
+        self._static = display_format(static)
+
+        if self._fog is None:
+            self._fog = self._bake_fog()
+
+    def _bake_fog(self) -> pygame.Surface:
+        fog = pygame.Surface((SCREEN_W, self.FOG_H), pygame.SRCALPHA)
+        for y in range(self.FOG_H):
+            a = int(100 * (1 - y / self.FOG_H))
+            fog.fill((*ENV_FOG, a), (0, y, SCREEN_W, 1))
+        return display_format(fog, alpha=True)
+
+    # ─── Draw ─────────────────────────────────────────────────
+
+    def draw(self, surf: pygame.Surface, t: float):
+        if self._static is None:
+            return
+        hz = SCREEN_H // 2
+        surf.blit(self._static, (0, 0))
+
+        m = self._map
+        if   m == 1: self._draw_space_anim(surf, t, hz)
+        elif m == 2: self._draw_jungle_anim(surf, t)
+        else:        self._draw_lab_anim(surf, t)
+        if m != 1:
+            self._draw_wall_light_cones(surf, t)
+
+        surf.blit(self._fog, (0, hz - self.FOG_H // 2))
+
+    # ─── Helpers dùng chung ───────────────────────────────────
+
+    @staticmethod
+    def _bake_gradient(surf, hz, cei, hor, flr):
+        for y in range(hz+1):
+            t = y/hz
+            pygame.draw.line(surf, (
+                int(cei[0]+(hor[0]-cei[0])*t),
+                int(cei[1]+(hor[1]-cei[1])*t),
+                int(cei[2]+(hor[2]-cei[2])*t),
+            ), (0,y),(SCREEN_W,y))
+        for y in range(SCREEN_H-hz):
+            t = y/(SCREEN_H-hz)
+            pygame.draw.line(surf, (
+                int(hor[0]+(flr[0]-hor[0])*t),
+                int(hor[1]+(flr[1]-hor[1])*t),
+                int(hor[2]+(flr[2]-hor[2])*t),
+            ), (0,hz+y),(SCREEN_W,hz+y))
+
+    @staticmethod
+    def _bake_floor_grid(surf, hz, neon, grid):
+        vp_x = SCREEN_W//2
+        for i in range(1,15):
+            t = (i/14)**1.6; y = int(hz+(SCREEN_H-hz)*t)
+            c = neon if i%3==0 else grid
+            pygame.draw.line(surf, c, (0,y),(SCREEN_W,y), 2 if i%3==0 else 1)
+        for i in range(21):
+            angle = (i/20-0.5)*1.8
+            ex = vp_x+int(math.tan(angle)*(SCREEN_H-hz)*1.1)
+            c = neon if i%4==0 else grid
+            pygame.draw.line(surf, c, (vp_x,hz),(ex,SCREEN_H), 2 if i%4==0 else 1)
+
+    @staticmethod
+    def _bake_side_walls(surf, color, edge_color):
+        for side_x in [0, SCREEN_W-70]:
+            pygame.draw.rect(surf, color, (side_x,0,70,SCREEN_H))
+            ex = side_x+(69 if side_x>0 else 0)
+            pygame.draw.line(surf, edge_color, (ex,0),(ex,SCREEN_H), 2)
+
+    def _bake_wall_bulbs(self, surf):
+        """Bóng đèn trần — phần tĩnh của wall lights."""
+        for lt in self._wall_lights:
+            lx, ly = lt["x"], lt["y"]
+            pygame.draw.rect(surf, (50, 55, 70), (lx - 6, ly - 4, 12, 8), border_radius=3)
+            pygame.draw.rect(surf, (200, 210, 255), (lx - 4, ly, 8, 4), border_radius=2)
+
+    def _draw_wall_light_cones(self, surf, t):
+        """Vầng sáng côn nhấp nháy dưới mỗi bóng đèn."""
+        for lt in self._wall_lights:
+            flicker = 0.75 + 0.25 * math.sin(t * 4 + lt["flicker"])
+            intensity = lt["intensity"] * flicker
+            lx, ly   = lt["x"], lt["y"]
+            r, g, b  = lt["color"]
+
+            cone_h = int((SCREEN_H // 2 - ly) * 0.85)
+            for ci in range(6):
+                ct   = ci / 6
+                cw   = int(20 + ct * 120) * intensity
+                ca   = int(40 * (1 - ct) * intensity)
+                if ca <= 0: continue
+                # Ellipse blend trực tiếp lên surface (không cấp phát mỗi frame)
+                rx = int(cw * 2) // 2
+                ry = max(1, int(cone_h * (1 - ct + 0.1))) // 2
+                top = ly + int(cone_h * ct)
+                pygame.gfxdraw.filled_ellipse(surf, lx - int(cw) + rx, top + ry,
+                                              max(1, rx), max(1, ry), (r, g, b, ca))
+
+    # ─── MAP 0: LAB (Phòng thí nghiệm — xanh acid) ───────────
+
+    @staticmethod
+    def _lab_tube_rect(side_x, i):
+        return side_x + 25, 80 + i*110, 20, 55
+
+    def _bake_lab(self, surf, hz):
+        self._bake_gradient(surf, hz, (8,12,22), (18,28,50), (10,18,32))
+        self._bake_floor_grid(surf, hz, LAB_NEON, (18,35,22))
+        self._bake_side_walls(surf, (12,18,30), LAB_NEON)
+        # Vỏ ống nghiệm (chất lỏng vẽ động, nằm gọn bên trong viền)
+        for side_x in [0, SCREEN_W-70]:
+            for i in range(4):
+                tx, ty, tw, th = self._lab_tube_rect(side_x, i)
+                pygame.draw.rect(surf,(15,25,40),(tx,ty,tw,th),border_radius=8)
+                pygame.draw.rect(surf,LAB_NEON,(tx,ty,tw,th),width=1,border_radius=8)
+
+    def _draw_lab_anim(self, surf, t):
+        for side_x in [0, SCREEN_W-70]:
+            for i in range(4):
+                tx, ty, tw, th = self._lab_tube_rect(side_x, i)
+                # Chất lỏng màu
+                liq_h = int(th*0.6)
+                liq_pulse = 0.7+0.3*math.sin(t*2+i)
+                liq_c = tuple(min(255,int(c2*liq_pulse)) for c2 in LAB_TUBE_COLORS[i%4])
+                pygame.draw.rect(surf,liq_c,(tx+2,ty+th-liq_h+2,tw-4,liq_h-4),border_radius=6)
+                # Bubble animation
+                bub_y = ty+th-liq_h+int((t*30+i*20)%(liq_h))
+                pygame.draw.circle(surf,(200,255,220),(tx+tw//2,bub_y),2)
+
+    # ─── MAP 1: SPACE STATION (Trạm vũ trụ — xanh thiên hà) ─────
+
+    def _bake_space(self, surf, hz):
+        surf.fill((4, 6, 16))
+
+        # Nebula cloud background
+        nc_list = [(80,40,120),(40,60,140),(120,60,180)]
+        for ni in range(3):
+            nx = SCREEN_W//4*(ni+1); ny = SCREEN_H//3
+            nr = 80+ni*30
+            ns = pygame.Surface((nr*2,nr*2),pygame.SRCALPHA)
+            pygame.draw.circle(ns,(*nc_list[ni],int(15+ni*8)),(nr,nr),nr)
+            surf.blit(ns,(nx-nr,ny-nr))
+
+        # Horizon line (planet curvature effect)
+        pygame.draw.line(surf,(20,40,80),(0,hz),(SCREEN_W,hz),1)
+
+        # Sàn kim loại không gian
+        for y in range(SCREEN_H-hz):
+            k = y/(SCREEN_H-hz)
+            c = (int(8+k*8),int(10+k*12),int(22+k*18))
+            pygame.draw.line(surf,c,(0,hz+y),(SCREEN_W,hz+y))
+
+        self._bake_floor_grid(surf, hz, SPACE_NEON, (20,35,70))
+
+        # Cột trụ không gian hai bên
+        self._bake_side_walls(surf, (6,10,28), SPACE_NEON)
+        for side_x in [0, SCREEN_W-70]:
+            for i in range(5):
+                py=60+i*90; bx=side_x+8
+                pygame.draw.rect(surf,(10,18,50),(bx,py,54,55),border_radius=4)
+                pygame.draw.circle(surf,(255,100,40),(bx+10,py+45),3)
+
+        self._bake_stars(hz)
+
+    def _bake_stars(self, hz):
+        """Sao nền: chỉ giữ sao lộ ra giữa hai cột và trên chân trời."""
+        if not self._star_sprites:
+            for sr in (1, 2):
+                ss = pygame.Surface((sr*2,sr*2),pygame.SRCALPHA)
+                pygame.draw.circle(ss,(180,200,255,255),(sr,sr),sr)
+                self._star_sprites[sr] = display_format(ss, alpha=True)
+
+        sky = pygame.Rect(70, 0, SCREEN_W-140, hz)
+        rng = random.Random(99)
+        self._stars = []
+        for _ in range(120):
+            sx = rng.randint(0, SCREEN_W); sy = rng.randint(0, SCREEN_H)
+            sr = rng.randint(1,2)
+            base_a = rng.randint(40,180)
+            if sky.colliderect((sx, sy, sr*2, sr*2)):
+                self._stars.append((sx, sy, self._star_sprites[sr], base_a))
+
+    def _draw_space_anim(self, surf, t, hz):
+        # Sao nhấp nháy (clip trong vùng trời để không đè lên sàn/cột)
+        old_clip = surf.get_clip()
+        surf.set_clip(pygame.Rect(70, 0, SCREEN_W-140, hz).clip(old_clip))
+        for sx, sy, sprite, base_a in self._stars:
+            sprite.set_alpha(int(base_a*(0.7+0.3*math.sin(t*0.5+sx*0.02))))
+            surf.blit(sprite, (sx, sy))
+        surf.set_clip(old_clip)
+
+        # Hologram display trên cột
+        for side_x in [0, SCREEN_W-70]:
+            for i in range(5):
+                py=60+i*90; bx=side_x+8
+                holo_c=(40,100,200) if math.sin(t*1.5+i)>0 else (20,60,150)
+                pygame.draw.rect(surf,holo_c,(bx+4,py+4,46,30),border_radius=3)
+                for li in range(3):
+                    lw=int(20+math.sin(t+li)*10)
+                    pygame.draw.line(surf,(80,160,255),(bx+8,py+12+li*7),(bx+8+lw,py+12+li*7),1)
+
+    # ─── MAP 2: JUNGLE BASE (Rừng neon — xanh lá nhiệt đới) ─────
+
+    def _bake_jungle(self, surf, hz):
+        self._bake_gradient(surf, hz, (6,15,8), (14,30,18), (8,20,10))
+        self._bake_floor_grid(surf, hz, JUNGLE_NEON, (15,40,18))
+        self._bake_side_walls(surf, (8,18,10), JUNGLE_NEON)
+        # Thân cây
+        for side_x in [0, SCREEN_W-70]:
+            for i in range(4):
+                ty=50+i*115; tx=side_x+5
+                pygame.draw.rect(surf,(25,45,20),(tx+20,ty,14,70))
+
+        # Hơi nước / fog nền xanh (không chồng lên tán lá)
+        for fi in range(5):
+            fy=hz-20+fi*5; fa=int(30*(1-fi/5))
+            fs=pygame.Surface((SCREEN_W,4),pygame.SRCALPHA)
+            fs.fill((20,200,60,fa))
+            surf.blit(fs,(0,fy))
+
+        if not self._leaf_sprites:
+            for li in range(3):
+                ls=pygame.Surface((55-li*12,28-li*5),pygame.SRCALPHA)
+                pygame.draw.ellipse(ls,(*JUNGLE_LEAF_COLORS[li],255),ls.get_rect())
+                self._leaf_sprites.append(display_format(ls, alpha=True))
+
+    def _draw_jungle_anim(self, surf, t):
+        for side_x in [0, SCREEN_W-70]:
+            for i in range(4):
+                ty=50+i*115; tx=side_x+5
+                # Tán lá neon
+                for li, ls in enumerate(self._leaf_sprites):
+                    ls.set_alpha(int(80*(0.7+0.3*math.sin(t*1.2+i+li))))
+                    surf.blit(ls,(tx+10+li*8,ty+li*20))
+                # Quả phát sáng
+                fp=abs(math.sin(t*2+i))
+                fc=(int(30+fp*220),int(180+fp*60),int(20+fp*40))
+                pygame.draw.circle(surf,fc,(tx+25,ty+55),5)
@@ -0,0 +1,122 @@
+"""
+frame_stats.py - Bộ đếm debug: số Surface được cấp phát mỗi frame
+"""
+
+import sys
+import pygame
+
+
+_TRANSFORM_FUNCS = ("scale", "smoothscale", "rotate", "rotozoom", "flip", "scale2x")
+# Method C trả về Surface mới — không thay được trên kiểu C, đếm qua sys.setprofile
+_SURFACE_METHODS = frozenset(("convert", "convert_alpha", "copy", "subsurface"))
+_FONT_METHODS    = frozenset(("render",))
+
+
+class AllocCounter:
+    """
+    Đếm số pygame.Surface tạo ra trong mỗi frame (xem COUNTED).
+    install() thay pygame.Surface bằng subclass có đếm, bọc các hàm pygame.transform
+    trả về surface mới và đặt sys.setprofile đếm convert / copy / subsurface /
+    Font.render. uninstall() trả lại nguyên trạng. Chỉ dùng khi debug (DEBUG_ALLOC /
+    profiler F3) — có profile hook nên chậm hơn đáng kể.
+    """
+
+    HISTORY = 120   # Số frame giữ lại để tính trung bình
+    COUNTED = ("Surface()", "transform.*", "convert*", "copy", "subsurface", "Font.render")
+
+    def __init__(self):
+        self.installed = False
+        self._count    = 0
+        self.last      = 0
+        self.peak      = 0
+        self._history: list[int] = []
+        self._originals: dict = {}      # (module, tên) → bản gốc, trả lại khi uninstall
+
+    def install(self):
+        if self.installed: return
+        counter = self
+        base    = pygame.Surface
+
+        class CountingSurface(base):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                counter._count += 1
+
+        self._originals[(pygame, "Surface")] = base
+        pygame.Surface = CountingSurface
+
+        for name in _TRANSFORM_FUNCS:
+            fn = getattr(pygame.transform, name, None)
+            if fn is None: continue
+            self._originals[(pygame.transform, name)] = fn
+            setattr(pygame.transform, name, self._wrap(fn))
+        self._surface_type = base
+        self._font_type    = pygame.font.Font
+        sys.setprofile(self.profile_hook)
+        self.installed = True
+
+    def uninstall(self):
+        """Trả lại pygame.Surface / pygame.transform gốc và gỡ profile hook."""
+        if not self.installed: return
+        for (module, name), fn in self._originals.items():
+            setattr(module, name, fn)
+        self._originals.clear()
+        if sys.getprofile() == self.profile_hook:
+            sys.setprofile(None)
+        self.installed = False
+
+    def _wrap(self, fn):
+        def counted(*args, **kwargs):
+            self._count += 1
+            return fn(*args, **kwargs)
+        counted.__name__ = fn.__name__
+        return counted
+
+    def profile_hook(self, frame, event, arg):
+        if event == "c_call":
+            self.count_call(arg)
+
+    def count_call(self, fn):
+        """Gọi từ profile hook (của mình hoặc của profiler) cho mỗi lần gọi hàm C."""
+        name = getattr(fn, "__name__", None)
+        if name in _SURFACE_METHODS:
+            if isinstance(getattr(fn, "__self__", None), self._surface_type):
+                self._count += 1
+        elif name in _FONT_METHODS:
+            if isinstance(getattr(fn, "__self__", None), self._font_type):
+                self._count += 1
+
+    # ─── Frame ────────────────────────────────────────────────
+
+    def begin_frame(self):
+        self._count = 0
+
+    def end_frame(self):
+        self.last = self._count
+        self.peak = max(self.peak, self.last)
+        self._history.append(self.last)
+        if len(self._history) > self.HISTORY:
+            self._history.pop(0)
+
+    @property
+    def average(self) -> float:
+        return sum(self._history) / len(self._history) if self._history else 0.0
+
+    def reset_peak(self):
+        self.peak = 0
+
+    def summary(self) -> str:
+        return f"ALLOC {self.last}/frame  avg {self.average:.1f}  peak {self.peak}"
+
+    def draw(self, surf: pygame.Surface):
+        """Vẽ số liệu ở góc trái trên (gọi sau end_frame để không tự đếm)."""
+        from src.assets import assets
+        c  = (80, 230, 120) if self.last == 0 else (255, 200, 60)
+        ts = assets.render_text(self.summary(), "xs", c, shadow=True)
+        surf.blit(ts, (8, 4))
+        ts = assets.render_text("đếm: " + " ".join(self.COUNTED), "xs", (110, 120, 140), shadow=True)
+        surf.blit(ts, (8, 4 + ts.get_height()))
+
+
+# Singleton
+alloc_counter = AllocCounter()
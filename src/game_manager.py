@@ -4,6 +4,9 @@ game_manager.py - Điều phối Scene (Màn hình)
 
 import pygame
 from src.constants import *
+from src.profiler import profiler
+from src.persistence import persistence
+from src.ranking import ranking
 
 
 class GameState:
@@ -11,6 +14,9 @@ class GameState:
     def __init__(self):
         self.player_name: str = ""
         self.selected_question_files: list = []    # Danh sách file .json đã chọn
+        self.selected_class: str = ""              # Lớp / môn của bộ đề (ghi kèm kết quả BXH)
+        self.selected_subject: str = ""
+        self.question_query: dict | None = None    # Bộ lọc kho câu hỏi (QuestionManager.load_query)
         self.current_score: int = 0
         self.correct_count: int = 0
         self.wrong_count: int = 0
@@ -28,6 +34,7 @@ class GameManager:
         self.state = GameState()
         self._current_scene = None
         self._pending_scene = None
+        ranking.preload()    # Đọc lịch sử BXH trên thread nền, 1 lần mỗi lần chạy game
 
         # Import lazy để tránh circular import
         self.go_to(SCENE_MENU)
@@ -72,12 +79,18 @@ class GameManager:
 
     def update(self, dt: float, events: list):
         """Cập nhật scene hiện tại + xử lý chuyển scene."""
+        profiler.handle_events(events)    # F3: bật/tắt profiler overlay
+
         # Xử lý pending scene transition
         if self._pending_scene is not None:
             scene_id, kwargs = self._pending_scene
             self._pending_scene = None
+            if self._current_scene:
+                self._current_scene.on_exit()
+                self._current_scene = None
             if scene_id == SCENE_QUIT:
                 import sys
+                persistence.flush(timeout=5.0)    # Ghi nốt ranking / progress trước khi thoát
                 pygame.quit()
                 sys.exit()
             self._current_scene = self._create_scene(scene_id, kwargs)
@@ -87,6 +100,7 @@ class GameManager:
 
     def draw(self):
         """Vẽ scene hiện tại."""
-        self.screen.fill(DARK_BG)
+        if not (self._current_scene and self._current_scene.opaque):
+            self.screen.fill(DARK_BG)
         if self._current_scene:
             self._current_scene.draw()
\ No newline at end of file
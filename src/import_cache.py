@@ -0,0 +1,146 @@
+"""
+import_cache.py - Cache kết quả parse .docx theo hash nội dung (file → các block → câu hỏi)
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from src.constants import IMPORT_CACHE_FILE
+
+
+IMPORT_CACHE_VERSION = 1
+IMPORT_CACHE_MAX_FILES = 256     # Số file .docx nhớ tối đa (cũ nhất bị bỏ trước)
+
+
+def file_digest(path: str) -> str:
+    """sha256 nội dung file (đọc theo khối 1MB)."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class ImportCache:
+    """
+    2 tầng, lưu trong IMPORT_CACHE_FILE:
+
+    - files:  sha256 của file .docx → danh sách id block theo thứ tự
+    - blocks: id block (uuid5 nội dung, xem question_parser.block_id)
+              → {"q": câu hỏi} hoặc {"err": lỗi parse}
+
+    File không đổi → dựng lại kết quả từ blocks, không cần đọc .docx.
+    File đã sửa → chỉ block có nội dung mới phải parse (QuestionParser.iter_parse).
+    Block mới được ghi nhận riêng (take_update) để tiến trình con gửi về tiến trình chính.
+    """
+
+    def __init__(self, path: str = IMPORT_CACHE_FILE):
+        self.path    = path
+        self._files: OrderedDict[str, list] = OrderedDict()
+        self._blocks: dict[str, dict] = {}
+        self._new: dict[str, dict]    = {}      # block thêm từ lần take_update trước
+        self.hits    = 0                         # Số block lấy lại được từ cache
+        self._loaded = False
+        self._dirty  = False
+
+    # ─── Lưu / đọc ────────────────────────────────────────────
+
+    def _ensure_loaded(self):
+        if self._loaded: return
+        self._loaded = True
+        if not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == IMPORT_CACHE_VERSION:
+                self._files  = OrderedDict(data.get("files", {}))
+                self._blocks = data.get("blocks", {})
+        except Exception as e:
+            print(f"[ImportCache] Load error: {e}")
+            self._files, self._blocks = OrderedDict(), {}
+
+    def _prune(self):
+        while len(self._files) > IMPORT_CACHE_MAX_FILES:
+            self._files.popitem(last=False)
+        live = {bid for bids in self._files.values() for bid in bids}
+        if len(live) < len(self._blocks):
+            self._blocks = {bid: e for bid, e in self._blocks.items() if bid in live}
+
+    def save(self):
+        """Ghi cache nếu có thay đổi (ghi file tạm rồi os.replace)."""
+        if not self._dirty: return
+        self._prune()
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": IMPORT_CACHE_VERSION,
+                           "files": self._files, "blocks": self._blocks},
+                          f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except Exception as e:
+            print(f"[ImportCache] Save error: {e}")
+
+    # ─── Tra cứu ──────────────────────────────────────────────
+
+    def block(self, bid: str) -> dict | None:
+        self._ensure_loaded()
+        entry = self._blocks.get(bid)
+        if entry is not None:
+            self.hits += 1
+        return entry
+
+    def put_block(self, bid: str, entry: dict):
+        self._ensure_loaded()
+        self._blocks[bid] = entry
+        self._new[bid]    = entry
+        self._dirty = True
+
+    def lookup(self, digest: str) -> tuple | None:
+        """
+        (questions, errors, n_blocks) của file đã import trước đó, None nếu chưa có
+        (hoặc block đã bị dọn). errors đã đánh số "Block i: ..." như parser.
+        """
+        self._ensure_loaded()
+        bids = self._files.get(digest)
+        if bids is None:
+            return None
+        entries = [self._blocks.get(bid) for bid in bids]
+        if any(e is None for e in entries):
+            return None
+        self._files.move_to_end(digest)
+        questions, errors = [], []
+        for i, e in enumerate(entries):
+            if "q" in e:
+                questions.append(e["q"])
+            else:
+                errors.append(f"Block {i+1}: {e['err']}")
+        return questions, errors, len(entries)
+
+    def put_file(self, digest: str, bids: list):
+        self._ensure_loaded()
+        self._files[digest] = list(bids)
+        self._files.move_to_end(digest)
+        self._dirty = True
+
+    # ─── Đồng bộ giữa các tiến trình ──────────────────────────
+
+    def take_update(self, digest: str, bids: list) -> dict:
+        """Ghi nhận file rồi trả về phần mới (file + block mới) để gửi về tiến trình chính."""
+        self.put_file(digest, bids)
+        update = {"digest": digest, "blocks": list(bids), "new": self._new}
+        self._new = {}
+        return update
+
+    def apply_update(self, update: dict):
+        self._ensure_loaded()
+        if update["new"]:
+            self._blocks.update(update["new"])
+        self.put_file(update["digest"], update["blocks"])
+
+
+# Singleton
+import_cache = ImportCache()
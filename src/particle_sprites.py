@@ -0,0 +1,163 @@
+"""
+particle_sprites.py - Cache sprite particle vẽ sẵn (spark, glow, vòng sáng, mảnh vỡ xoay)
+"""
+
+import pygame
+from collections import OrderedDict
+from src.render_utils import display_format
+
+
+SPRITE_CACHE_BUDGET = 16 * 1024 * 1024
+ALPHA_STEP          = 16     # Lượng tử hoá alpha của sprite nhỏ (spark / star)
+ANGLE_STEP          = 15     # Độ — mảnh vỡ được xoay sẵn theo bước này
+RING_STEP           = 4      # px — bước làm tròn bán kính vòng sáng > RING_EXACT,
+RING_EXACT          = 16     #      nhân lên theo mỗi 48px bán kính (vòng lớn tốn bộ nhớ)
+
+
+def quantize_alpha(a) -> int:
+    """Đưa alpha về giữa bucket ALPHA_STEP (0 nếu quá mờ)."""
+    a = int(a)
+    if a <= 0: return 0
+    return min(255, (a // ALPHA_STEP) * ALPHA_STEP + ALPHA_STEP // 2)
+
+
+class ParticleSpriteCache:
+    """
+    Sprite particle dùng chung cho RobotRenderer, PowerupSystem và menu.
+    Mỗi hình chỉ vẽ 1 lần khi gặp lần đầu, sau đó vẽ particle = 1 lần blit.
+
+    - Sprite nhỏ (spark, star) được lượng tử hoá theo (size, color, alpha).
+    - Sprite lớn (disc, ring, rect) lưu ở alpha đầy; độ mờ áp bằng set_alpha.
+    LRU theo ngân sách byte như cache text của AssetManager.
+    """
+
+    def __init__(self, budget: int = SPRITE_CACHE_BUDGET):
+        self._cache: OrderedDict = OrderedDict()
+        self._bytes  = 0
+        self._budget = budget
+        self._stats  = {"hits": 0, "misses": 0, "evictions": 0}
+
+    # ─── LRU ──────────────────────────────────────────────────
+
+    def _get(self, key, build):
+        surf = self._cache.get(key)
+        if surf is not None:
+            self._cache.move_to_end(key)
+            self._stats["hits"] += 1
+            return surf
+        self._stats["misses"] += 1
+        surf   = display_format(build(), alpha=True)
+        nbytes = surf.get_width() * surf.get_height() * 4
+        if nbytes <= self._budget:
+            self._cache[key] = surf
+            self._bytes += nbytes
+            self._evict_to_budget()
+        return surf
+
+    def _evict_to_budget(self):
+        while self._cache and self._bytes > self._budget:
+            _, old = self._cache.popitem(last=False)
+            self._bytes -= old.get_width() * old.get_height() * 4
+            self._stats["evictions"] += 1
+
+    def stats(self) -> dict:
+        """Thống kê: hits, misses, evictions, entries, bytes, budget, hit_rate."""
+        st = dict(self._stats)
+        total = st["hits"] + st["misses"]
+        st["entries"]  = len(self._cache)
+        st["bytes"]    = self._bytes
+        st["budget"]   = self._budget
+        st["hit_rate"] = st["hits"] / total if total else 0.0
+        return st
+
+    def set_budget(self, nbytes: int):
+        self._budget = max(0, int(nbytes))
+        self._evict_to_budget()
+
+    def clear(self):
+        self._cache.clear()
+        self._bytes = 0
+
+    # ─── Sprite ───────────────────────────────────────────────
+
+    def spark(self, radius: int, color: tuple, alpha: int, core: bool = False) -> pygame.Surface:
+        """
+        Chấm tròn kích thước (2r × 2r), tâm (r, r); core = lõi trắng r/2.
+        alpha đã lượng tử hoá (xem quantize_alpha).
+        """
+        radius = max(1, int(radius))
+        color  = tuple(color[:3])
+        key    = ("spark", radius, color, alpha, core)
+
+        def build():
+            s = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(s, (*color, alpha), (radius, radius), radius)
+            if core:
+                pygame.draw.circle(s, (255, 255, 255, alpha),
+                                   (radius, radius), max(1, radius // 2))
+            return s
+        return self._get(key, build)
+
+    def star(self, radius: int, color: tuple, alpha: int) -> pygame.Surface:
+        """Chấm tròn có viền trống 1px: kích thước (2r+2), tâm (r+1, r+1)."""
+        radius = max(0, int(radius))
+        color  = tuple(color[:3])
+        key    = ("star", radius, color, alpha)
+
+        def build():
+            s = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
+            pygame.draw.circle(s, (*color, alpha), (radius + 1, radius + 1), radius)
+            return s
+        return self._get(key, build)
+
+    def disc(self, radius: int, color: tuple) -> pygame.Surface:
+        """Hình tròn đặc alpha đầy (2r × 2r) — glow hào quang, nền tròn."""
+        radius = max(1, int(radius))
+        color  = tuple(color[:3])
+
+        def build():
+            s = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(s, (*color, 255), (radius, radius), radius)
+            return s
+        return self._get(("disc", radius, color), build)
+
+    def ring(self, radius: int, color: tuple, width: int | None = None) -> pygame.Surface:
+        """
+        Vòng sáng alpha đầy, kích thước (2r+4), tâm (r+2, r+2).
+        Bán kính lớn được làm tròn (xem RING_STEP); width mặc định = 14% bán kính.
+        """
+        radius = max(1, int(radius))
+        if radius > RING_EXACT:
+            step   = RING_STEP * max(1, radius // 48)
+            radius = int(round(radius / step)) * step
+        if width is None:
+            width = max(1, int(radius * 0.14))
+        color = tuple(color[:3])
+
+        def build():
+            s = pygame.Surface((radius * 2 + 4, radius * 2 + 4), pygame.SRCALPHA)
+            pygame.draw.circle(s, (*color, 255), (radius + 2, radius + 2), radius, width)
+            return s
+        return self._get(("ring", radius, color, width), build)
+
+    def rect(self, w: int, h: int, color: tuple, angle: float) -> pygame.Surface:
+        """Hình chữ nhật đặc (mảnh vỡ, vỏ đạn) xoay sẵn theo bước ANGLE_STEP."""
+        w, h  = max(1, int(w)), max(1, int(h))
+        step  = int(round(angle / ANGLE_STEP)) % (360 // ANGLE_STEP)
+        color = tuple(color[:3])
+
+        def build():
+            s = pygame.Surface((w, h), pygame.SRCALPHA)
+            s.fill((*color, 255))
+            return pygame.transform.rotate(s, step * ANGLE_STEP)
+        return self._get(("rect", w, h, color, step), build)
+
+    @staticmethod
+    def blit(surf: pygame.Surface, sprite: pygame.Surface, pos, alpha: int = 255):
+        """Blit sprite alpha đầy với độ mờ alpha (set_alpha trên sprite dùng chung)."""
+        sprite.set_alpha(max(0, min(255, int(alpha))))
+        surf.blit(sprite, pos)
+
+
+# Singleton
+particle_sprites = ParticleSpriteCache()
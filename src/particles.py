@@ -0,0 +1,162 @@
+"""
+particles.py - Engine particle dạng structure-of-arrays (NumPy) dùng chung
+"""
+
+import numpy as np
+
+
+rng = np.random.default_rng()   # RNG dùng chung khi spawn hàng loạt
+
+
+class ParticlePool:
+    """
+    Pool particle lưu theo cột: mỗi thuộc tính là 1 mảng NumPy cấp phát sẵn,
+    chỉ n phần tử đầu là đang sống.
+
+    - Thuộc tính cơ bản: x, y, vx, vy, life, size, color (n×3, uint8)
+    - fields: thuộc tính thêm, vd ("rot", "rot_spd") hoặc {"w": 1, "h": 1}
+    - trail > 0: mỗi particle giữ `trail` vị trí gần nhất trong ring buffer
+
+    Tích phân và dọn particle chết đều vector hoá; mảng tự nhân đôi khi đầy.
+    """
+
+    BASE_FIELDS = ("x", "y", "vx", "vy", "life", "size")
+
+    def __init__(self, capacity: int = 256, fields=(), trail: int = 0):
+        self.capacity = max(1, capacity)
+        self.n        = 0
+        self._fields  = list(self.BASE_FIELDS) + [f for f in fields if f not in self.BASE_FIELDS]
+        self._arrays: dict[str, np.ndarray] = {}
+        for name in self._fields:
+            self._arrays[name] = np.zeros(self.capacity, np.float32)
+        self._arrays["color"] = np.zeros((self.capacity, 3), np.uint8)
+
+        self.trail_max   = trail
+        self._trail_head = 0
+        if trail:
+            self._trail     = np.zeros((self.capacity, trail, 2), np.float32)
+            self._trail_cnt = np.zeros(self.capacity, np.int16)
+
+    def __len__(self):
+        return self.n
+
+    def __getattr__(self, name):
+        # Trả về view các particle đang sống: pool.x, pool.life, pool.color ...
+        arrays = self.__dict__.get("_arrays")
+        if arrays is not None and name in arrays:
+            return arrays[name][:self.n]
+        raise AttributeError(name)
+
+    # ─── Spawn ────────────────────────────────────────────────
+
+    def _grow(self, need: int):
+        cap = self.capacity
+        while cap < need:
+            cap *= 2
+        for name, arr in self._arrays.items():
+            new = np.zeros((cap,) + arr.shape[1:], arr.dtype)
+            new[:self.n] = arr[:self.n]
+            self._arrays[name] = new
+        if self.trail_max:
+            new = np.zeros((cap, self.trail_max, 2), np.float32)
+            new[:self.n] = self._trail[:self.n]
+            self._trail = new
+            cnt = np.zeros(cap, np.int16)
+            cnt[:self.n] = self._trail_cnt[:self.n]
+            self._trail_cnt = cnt
+        self.capacity = cap
+
+    def spawn(self, count: int = 1, **values) -> slice:
+        """
+        Thêm `count` particle. Mỗi giá trị có thể là scalar hoặc mảng dài count
+        (color: tuple RGB hoặc mảng count×3). Thuộc tính không truyền = 0.
+        Trả về slice của các particle mới.
+        """
+        if count <= 0:
+            return slice(self.n, self.n)
+        start, end = self.n, self.n + count
+        if end > self.capacity:
+            self._grow(end)
+        for name, arr in self._arrays.items():
+            if name in values:
+                arr[start:end] = values[name]
+            else:
+                arr[start:end] = 0
+        if self.trail_max:
+            self._trail_cnt[start:end] = 0
+        self.n = end
+        return slice(start, end)
+
+    def clear(self):
+        self.n = 0
+
+    # ─── Update ───────────────────────────────────────────────
+
+    def integrate(self, dt: float, decay: float, gravity: float = 0.0,
+                  drag: float = 1.0, spin: str | None = None):
+        """
+        Bước chuẩn (đơn vị vận tốc: px / frame 60fps):
+        life -= dt*decay; pos += vel*dt*60; vy += gravity; vx *= drag.
+        spin: tên field tốc độ xoay (vd "rot_spd") → rot += rot_spd*dt.
+        """
+        n = self.n
+        if n == 0: return
+        a = self._arrays
+        if self.trail_max:
+            self.push_trail()
+        step = dt * 60
+        a["life"][:n] -= dt * decay
+        a["x"][:n]    += a["vx"][:n] * step
+        a["y"][:n]    += a["vy"][:n] * step
+        if gravity:
+            a["vy"][:n] += gravity
+        if drag != 1.0:
+            a["vx"][:n] *= drag
+        if spin:
+            a["rot"][:n] += a[spin][:n] * dt
+
+    def push_trail(self):
+        """Ghi vị trí hiện tại vào ring buffer trail (head dùng chung cho cả pool)."""
+        n = self.n
+        h = self._trail_head
+        self._trail[:n, h, 0] = self._arrays["x"][:n]
+        self._trail[:n, h, 1] = self._arrays["y"][:n]
+        np.minimum(self._trail_cnt[:n] + 1, self.trail_max, out=self._trail_cnt[:n])
+        self._trail_head = (h + 1) % self.trail_max
+
+    def compact(self):
+        """Loại particle có life <= 0, dồn phần còn lại về đầu mảng."""
+        n = self.n
+        if n == 0: return
+        alive = self._arrays["life"][:n] > 0
+        k = int(np.count_nonzero(alive))
+        if k == n: return
+        for arr in self._arrays.values():
+            arr[:k] = arr[:n][alive]
+        if self.trail_max:
+            self._trail[:k]     = self._trail[:n][alive]
+            self._trail_cnt[:k] = self._trail_cnt[:n][alive]
+        self.n = k
+
+    # ─── Đọc ──────────────────────────────────────────────────
+
+    def trails(self) -> np.ndarray:
+        """
+        Mảng n×trail×2 theo thứ tự cũ → mới. Chỉ `trail_counts()[i]` điểm
+        cuối cùng của hàng i là hợp lệ.
+        """
+        order = (np.arange(self.trail_max) + self._trail_head) % self.trail_max
+        return self._trail[:self.n][:, order]
+
+    def trail_counts(self) -> np.ndarray:
+        return self._trail_cnt[:self.n]
+
+    def rows(self, *names) -> list:
+        """Danh sách tuple (theo names) kiểu Python — dùng cho vòng lặp vẽ."""
+        n = self.n
+        if n == 0: return []
+        cols = []
+        for name in names:
+            arr = self._arrays[name][:n]
+            cols.append(arr.tolist() if arr.ndim == 1 else [tuple(c) for c in arr.tolist()])
+        return list(zip(*cols))
@@ -0,0 +1,130 @@
+"""
+persistence.py - Ghi đĩa nền (write-behind) cho saves/: ranking, catalog, progress...
+
+Scene chỉ giao việc ghi rồi đi tiếp, không chờ đĩa (máy HDD phòng máy có thể
+ghi mất hàng chục ms). 1 thread nền ghi lần lượt theo thứ tự giao:
+    write_json / write_bytes  thay cả file: ghi file tạm → fsync → os.replace
+    append                    nối vào cuối file (log), tuỳ chọn fsync
+    call                      hàm bất kỳ cần chạy tuần tự với các lần ghi (vd. gộp log)
+Nhiều lần ghi cùng 1 file khi thread chưa kịp ghi được gộp lại: write_* giữ bản
+mới nhất, append nối chuỗi. Việc đã gộp chạy ở vị trí của lần giao cuối cùng.
+flush() chờ ghi xong — gọi trước khi đọc lại file vừa giao và khi thoát game.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+class PersistenceService:
+    """Hàng đợi ghi đĩa + 1 thread ghi nền (khởi động khi có việc đầu tiên)."""
+
+    def __init__(self):
+        self._cond    = threading.Condition()
+        self._jobs    = OrderedDict()   # key → [kind, path, data, opts] — thứ tự = thứ tự chạy
+        self._busy    = False           # Thread đang chạy 1 việc (đã lấy khỏi _jobs)
+        self._thread  = None
+
+    # ─── Giao việc ────────────────────────────────────────────
+
+    def write_json(self, path: str, obj, **dump_kwargs):
+        """
+        Ghi obj ra JSON (thay cả file). Serialize ở thread nền — obj không được sửa
+        sau khi giao (truyền bản sao nếu cần).
+        """
+        dump_kwargs.setdefault("ensure_ascii", False)
+        self._submit(("replace", path), ["json", path, obj, dump_kwargs])
+
+    def write_bytes(self, path: str, data: bytes):
+        self._submit(("replace", path), ["bytes", path, data, None])
+
+    def append(self, path: str, text: str, fsync: bool = False):
+        """Nối text (UTF-8) vào cuối file; fsync=True cho log không được mất khi mất điện."""
+        with self._cond:
+            job = self._jobs.pop(("append", path), None)
+            if job is not None:
+                job[2] += text
+                job[3] = job[3] or fsync
+            else:
+                job = ["append", path, text, fsync]
+            self._jobs[("append", path)] = job
+            self._wake()
+
+    def call(self, key: str, fn):
+        """Chạy fn() ở thread nền, sau các việc đã giao trước đó; cùng key → chạy 1 lần."""
+        self._submit(("call", key), ["call", key, fn, None])
+
+    def _submit(self, key, job):
+        with self._cond:
+            self._jobs.pop(key, None)
+            self._jobs[key] = job
+            self._wake()
+
+    def _wake(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="persistence", daemon=True)
+            self._thread.start()
+        self._cond.notify_all()
+
+    # ─── Chờ ──────────────────────────────────────────────────
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._jobs) + self._busy
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Chờ mọi việc đã giao ghi xong. False nếu hết timeout trước."""
+        if threading.current_thread() is self._thread:
+            return True             # Gọi từ chính việc đang chạy — chờ sẽ kẹt
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._jobs and not self._busy, timeout)
+
+    # ─── Thread nền ───────────────────────────────────────────
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._cond.wait_for(lambda: self._jobs, timeout=5.0):
+                    self._thread = None     # Rảnh lâu → thoát, lần giao sau tạo lại
+                    return
+                _, job = self._jobs.popitem(last=False)
+                self._busy = True
+            try:
+                self._do(*job)
+            except Exception as e:
+                print(f"[Persistence] Error writing {job[1]}: {e}")
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    @staticmethod
+    def _do(kind: str, path, data, opts):
+        if kind == "call":
+            data()
+            return
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if kind == "append":
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(data)
+                if opts:
+                    f.flush()
+                    os.fsync(f.fileno())
+            return
+        tmp = path + ".tmp"
+        if kind == "json":
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, **opts)
+                f.flush()
+                os.fsync(f.fileno())
+        else:
+            with open(tmp, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+
+# Singleton
+persistence = PersistenceService()
@@ -0,0 +1,118 @@
+"""
+post_fx.py - Các lớp hậu kỳ toàn màn hình (vignette, scanlines, fade, flash) bake sẵn
+"""
+
+import pygame
+from src.constants import *
+from src.render_utils import display_format
+
+
+SCANLINE_KEY = (255, 0, 255)
+
+
+class PostFX:
+    """
+    Quản lý các overlay toàn màn hình.
+    Mỗi layer chỉ được dựng 1 lần (lazy, sau khi đã có display), giữ ở format
+    màn hình; cường độ thay đổi bằng set_alpha thay vì vẽ lại.
+    """
+
+    VIGNETTE_W     = 60     # Độ dày viền vignette đen
+    RED_VIGNETTE_W = 80     # Độ dày viền vignette đỏ (40 vòng × 2px)
+
+    def __init__(self):
+        self._vignette:     pygame.Surface | None = None
+        self._red_vignette: pygame.Surface | None = None
+        self._scanlines:    pygame.Surface | None = None
+        self._fills: dict[tuple, pygame.Surface] = {}
+
+    # ─── Build ────────────────────────────────────────────────
+
+    def _build_vignette(self) -> pygame.Surface:
+        vs = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+        for i in range(self.VIGNETTE_W):
+            t = i / self.VIGNETTE_W
+            a = int(120 * (1 - t) ** 2)
+            pygame.draw.rect(vs, (0, 0, 0, a),
+                (i, i, SCREEN_W - i * 2, SCREEN_H - i * 2), 1)
+        return display_format(vs, alpha=True)
+
+    def _build_red_vignette(self) -> pygame.Surface:
+        """Dựng ở cường độ tối đa (100), sau đó điều chỉnh bằng set_alpha."""
+        rv = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+        for i in range(self.RED_VIGNETTE_W // 2):
+            t2 = i / (self.RED_VIGNETTE_W // 2)
+            ia = int(100 * (1 - t2) ** 2)
+            pygame.draw.rect(rv, (200, 20, 20, ia),
+                (i * 2, i * 2, SCREEN_W - i * 4, SCREEN_H - i * 4), 2)
+        return display_format(rv, alpha=True)
+
+    def _build_scanlines(self) -> pygame.Surface:
+        """Surface đục + colorkey: chỉ các dòng đen được blend (RLE, rất nhẹ)."""
+        sl = pygame.Surface((SCREEN_W, SCREEN_H))
+        sl.fill(SCANLINE_KEY)
+        for y in range(0, SCREEN_H, 4):
+            pygame.draw.line(sl, (0, 0, 0), (0, y), (SCREEN_W, y))
+        sl = display_format(sl)
+        sl.set_colorkey(SCANLINE_KEY, pygame.RLEACCEL)
+        sl.set_alpha(18)
+        return sl
+
+    def _fill_layer(self, color: tuple) -> pygame.Surface:
+        layer = self._fills.get(color)
+        if layer is None:
+            layer = pygame.Surface((SCREEN_W, SCREEN_H))
+            layer.fill(color)
+            layer = display_format(layer)
+            self._fills[color] = layer
+        return layer
+
+    # ─── Apply ────────────────────────────────────────────────
+
+    @staticmethod
+    def _blit_border(surf, layer, w):
+        """Chỉ blit 4 dải viền — phần giữa của vignette trong suốt."""
+        for rect in ((0, 0, SCREEN_W, w), (0, SCREEN_H - w, SCREEN_W, w),
+                     (0, w, w, SCREEN_H - w * 2), (SCREEN_W - w, w, w, SCREEN_H - w * 2)):
+            surf.blit(layer, rect[:2], rect)
+
+    def vignette(self, surf: pygame.Surface):
+        """Vignette viền đen thường trực."""
+        if self._vignette is None:
+            self._vignette = self._build_vignette()
+        self._blit_border(surf, self._vignette, self.VIGNETTE_W)
+
+    def red_vignette(self, surf: pygame.Surface, strength: float):
+        """Vignette đỏ khi sai. strength 0..1."""
+        a = int(255 * min(1.0, strength))
+        if a <= 0: return
+        if self._red_vignette is None:
+            self._red_vignette = self._build_red_vignette()
+        self._red_vignette.set_alpha(a)
+        self._blit_border(surf, self._red_vignette, self.RED_VIGNETTE_W)
+
+    def scanlines(self, surf: pygame.Surface):
+        if self._scanlines is None:
+            self._scanlines = self._build_scanlines()
+        surf.blit(self._scanlines, (0, 0))
+
+    def fade(self, surf: pygame.Surface, alpha: int, color: tuple = (0, 0, 0), rect=None):
+        """
+        Phủ màu đặc với alpha (fade, dim, flash).
+        rect: chỉ phủ một vùng (vd: banner), mặc định toàn màn hình.
+        """
+        alpha = int(alpha)
+        if alpha <= 0: return
+        if alpha >= 255 and rect is None:
+            surf.fill(color); return
+        layer = self._fill_layer(tuple(color))
+        layer.set_alpha(min(255, alpha))
+        if rect is None:
+            surf.blit(layer, (0, 0))
+        else:
+            rect = pygame.Rect(rect)
+            surf.blit(layer, rect.topleft, pygame.Rect(0, 0, rect.w, rect.h))
+
+
+# Singleton
+post_fx = PostFX()
@@ -4,6 +4,7 @@ powerup_system.py - Hệ thống Power-up thả từ robot khi bắn trúng
 import pygame, math, random
 from src.constants import *
 from src.assets import assets
+from src.particle_sprites import particle_sprites, quantize_alpha
 
 # ── Định nghĩa power-up ────────────────────────────────────────
 POWERUP_DEFS = {
@@ -55,20 +56,18 @@ class FloatingItem:
         alpha = min(255, int(self.life / 6.0 * 255)) if self.life < 1.5 else 255
 
         # Sparkles vòng ngoài
-        for sp in self._sparkles:
-            sa = int(alpha * 0.6)
-            if sa < 5: continue
-            sx = self.x + math.cos(sp["angle"] + t*1.5) * sp["r"]
-            sy = self.y + math.sin(sp["angle"] + t*1.5) * sp["r"] * 0.5
-            gs = pygame.Surface((8,8), pygame.SRCALPHA)
-            pygame.draw.circle(gs, (*color, sa), (4,4), 4)
-            surf.blit(gs, (int(sx)-4, int(sy)-4))
+        sa = int(alpha * 0.6)
+        if sa >= 5:
+            gs = particle_sprites.spark(4, color, quantize_alpha(sa))
+            for sp in self._sparkles:
+                sx = self.x + math.cos(sp["angle"] + t*1.5) * sp["r"]
+                sy = self.y + math.sin(sp["angle"] + t*1.5) * sp["r"] * 0.5
+                surf.blit(gs, (int(sx)-4, int(sy)-4))
 
         # Glow hào quang
         glow_r = int(r * 1.8)
-        gs = pygame.Surface((glow_r*2, glow_r*2), pygame.SRCALPHA)
-        pygame.draw.circle(gs, (*color, int(alpha*0.25)), (glow_r,glow_r), glow_r)
-        surf.blit(gs, (int(self.x)-glow_r, int(self.y)-glow_r))
+        gs = particle_sprites.disc(glow_r, color)
+        particle_sprites.blit(surf, gs, (int(self.x)-glow_r, int(self.y)-glow_r), alpha*0.25)
 
         # Nền vòng tròn
         bg_s = pygame.Surface((r*2+4, r*2+4), pygame.SRCALPHA)
@@ -205,8 +204,7 @@ class PowerupSystem:
         # Notifs
         for n in self._notifs:
             a = min(255, int(n["life"]/2.2 * 255))
-            ns = assets.render_text(n["text"], "lg", (*n["color"],), bold=True, shadow=True)
-            ns.set_alpha(a)
+            ns = assets.render_text(n["text"], "lg", (*n["color"],), bold=True, shadow=True, alpha=a)
             surf.blit(ns, (SCREEN_W//2 - ns.get_width()//2, int(n["y"])))
 
     def draw_hud(self, surf):
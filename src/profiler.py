@@ -0,0 +1,237 @@
+"""
+profiler.py - Profiler theo giai đoạn frame (bật/tắt bằng phím F3)
+"""
+
+import sys
+import time
+from collections import deque
+import pygame
+from src.constants import DEBUG_ALLOC
+
+
+PROFILER_KEY = pygame.K_F3
+_BLIT_NAMES  = frozenset(("blit", "blits", "fblits"))
+
+
+class _NullStage:
+    """Context rỗng dùng khi profiler tắt — không đo gì."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ("_acc", "name", "_t0")
+
+    def __init__(self, acc: dict, name: str):
+        self._acc = acc
+        self.name = name
+        self._t0  = 0.0
+
+    def __enter__(self):
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        # Cộng dồn: 1 stage có thể chạy nhiều lần trong 1 frame
+        acc = self._acc
+        acc[self.name] = acc.get(self.name, 0.0) + time.perf_counter() - self._t0
+        return False
+
+
+class FrameProfiler:
+    """
+    Đo thời gian từng giai đoạn của frame.
+
+        with profiler.stage("robot"):
+            self._robot.draw(buf)
+
+    F3 xoay vòng: tắt → đo thời gian → đo thời gian + đếm blit/Surface → tắt.
+    Khi tắt, stage() chỉ trả về 1 context rỗng dùng chung (gần như không tốn gì).
+    Chế độ đếm dùng sys.setprofile nên chậm hơn đáng kể — chỉ để xem số lượng.
+    """
+
+    HISTORY    = 240    # Số frame giữ lại (graph + avg + p99)
+    REFRESH    = 0.25   # Giây giữa 2 lần cập nhật chữ trên overlay
+    GRAPH_W    = 240
+    GRAPH_H    = 60
+    PANEL_W    = 300
+    COLUMNS    = (0, 150, 220)   # x của cột tên / avg / p99
+
+    def __init__(self):
+        self.enabled     = False
+        self.count_blits = False
+        self.blits       = 0
+        self._alloc      = None     # alloc_counter khi đang đếm (hook đếm hộ)
+        self._acc: dict[str, float]         = {}
+        self._stages: dict[str, _Stage]     = {}
+        self._hist: dict[str, deque]        = {}
+        self._frames     = deque(maxlen=self.HISTORY)
+        self._blit_hist  = deque(maxlen=self.HISTORY)
+        self._frame_t0   = None     # None: frame hiện tại bắt đầu khi profiler còn tắt
+        self._lines: list[tuple[tuple, tuple]] = []   # (các cột chữ, màu)
+        self._next_refresh = 0.0
+
+    # ─── Bật / tắt ────────────────────────────────────────────
+
+    def cycle(self):
+        """Chuyển sang chế độ kế tiếp (gắn với PROFILER_KEY)."""
+        if not self.enabled:
+            self.enabled = True
+        elif not self.count_blits:
+            self._set_counting(True)
+        else:
+            self._set_counting(False)
+            self.enabled = False
+        self.reset()
+
+    def _set_counting(self, on: bool):
+        from src.frame_stats import alloc_counter
+        self.count_blits = on
+        if on:
+            alloc_counter.install()
+            self._alloc = alloc_counter
+            sys.setprofile(self._profile_hook)
+        else:
+            sys.setprofile(None)
+            self._alloc = None
+            if DEBUG_ALLOC:
+                sys.setprofile(alloc_counter.profile_hook)     # Bộ đếm bật từ đầu → giữ nguyên
+            else:
+                alloc_counter.uninstall()   # Trả pygame.Surface / transform gốc cho bản phát hành
+
+    def _profile_hook(self, frame, event, arg):
+        # Thay hook của alloc_counter (chỉ có 1 sys.setprofile) → đếm hộ luôn
+        if event == "c_call":
+            if getattr(arg, "__name__", None) in _BLIT_NAMES:
+                self.blits += 1
+            else:
+                self._alloc.count_call(arg)
+
+    def reset(self):
+        self._acc.clear()
+        self._hist.clear()
+        self._frames.clear()
+        self._blit_hist.clear()
+        self._lines = []
+        self._next_refresh = 0.0
+        self._frame_t0 = None
+
+    def handle_events(self, events: list):
+        for ev in events:
+            if ev.type == pygame.KEYDOWN and ev.key == PROFILER_KEY:
+                self.cycle()
+
+    # ─── Đo ───────────────────────────────────────────────────
+
+    def stage(self, name: str):
+        if not self.enabled:
+            return _NULL_STAGE
+        st = self._stages.get(name)
+        if st is None:
+            st = self._stages[name] = _Stage(self._acc, name)
+        return st
+
+    def begin_frame(self):
+        if not self.enabled: return
+        self._acc.clear()
+        self.blits     = 0
+        self._frame_t0 = time.perf_counter()
+
+    def end_frame(self):
+        if not self.enabled or self._frame_t0 is None: return
+        self._frames.append((time.perf_counter() - self._frame_t0) * 1000.0)
+        self._blit_hist.append(self.blits)
+        for name, sec in self._acc.items():
+            h = self._hist.get(name)
+            if h is None:
+                h = self._hist[name] = deque(maxlen=self.HISTORY)
+            h.append(sec * 1000.0)
+
+    # ─── Thống kê ─────────────────────────────────────────────
+
+    @staticmethod
+    def _p99(values) -> float:
+        if not values: return 0.0
+        s = sorted(values)
+        return s[min(len(s) - 1, int(len(s) * 0.99))]
+
+    def stats(self) -> dict:
+        """{"frame": (avg, p99), stage: (avg, p99), ...} tính theo ms."""
+        out = {}
+        if self._frames:
+            out["frame"] = (sum(self._frames) / len(self._frames), self._p99(self._frames))
+        for name, h in self._hist.items():
+            # Frame không chạy stage tính là 0 ms
+            n = max(len(h), len(self._frames))
+            out[name] = (sum(h) / n if n else 0.0, self._p99(h))
+        return out
+
+    def _refresh_lines(self):
+        from src.frame_stats import alloc_counter
+        lines = []
+        st = self.stats()
+        avg, p99 = st.pop("frame", (0.0, 0.0))
+        lines.append((("ms", "avg", "p99"), (110, 120, 140)))
+        lines.append((("FRAME", f"{avg:.2f}", f"{p99:.2f}"), (120, 230, 255)))
+        for name, (a, p) in st.items():
+            lines.append(((name, f"{a:.2f}", f"{p:.2f}"), (200, 210, 230)))
+        if self.count_blits:
+            blits = self._blit_hist[-1] if self._blit_hist else 0
+            lines.append(((f"BLIT {blits}/frame   ALLOC {alloc_counter.last}/frame",), (255, 200, 60)))
+            # Những gì được tính là 1 alloc (2 dòng cho vừa panel)
+            counted = alloc_counter.COUNTED
+            lines.append((("đếm: " + " ".join(counted[:3]),), (110, 120, 140)))
+            lines.append((("      " + " ".join(counted[3:]),), (110, 120, 140)))
+        else:
+            lines.append((("F3: + đếm blit/alloc",), (110, 120, 140)))
+        self._lines = lines
+
+    # ─── Vẽ ───────────────────────────────────────────────────
+
+    def draw(self, surf: pygame.Surface):
+        """Vẽ overlay ở góc phải trên (gọi sau end_frame để không tự đo)."""
+        if not self.enabled: return
+        from src.assets import assets
+        from src.post_fx import post_fx
+
+        now = time.perf_counter()
+        if now >= self._next_refresh:
+            self._refresh_lines()
+            self._next_refresh = now + self.REFRESH
+
+        line_h = 16
+        x = surf.get_width() - self.PANEL_W - 8
+        y = 8
+        h = self.GRAPH_H + 12 + line_h * len(self._lines) + 8
+        post_fx.fade(surf, 175, (0, 0, 0), (x, y, self.PANEL_W, h))
+
+        # Graph thời gian frame (thang 0..50ms, vạch 16.7 / 33.3)
+        gx, gy = x + 8, y + 6
+        gb = gy + self.GRAPH_H
+        scale = self.GRAPH_H / 50.0
+        for ms, c in ((1000 / 60, (40, 110, 60)), (1000 / 30, (120, 60, 40))):
+            ly = gb - int(ms * scale)
+            pygame.draw.line(surf, c, (gx, ly), (gx + self.GRAPH_W, ly))
+        off = self.GRAPH_W - len(self._frames)
+        for i, ms in enumerate(self._frames):
+            c = (80, 230, 120) if ms <= 1000 / 60 else ((255, 200, 60) if ms <= 1000 / 30 else (255, 80, 80))
+            pygame.draw.line(surf, c, (gx + off + i, gb), (gx + off + i, gb - min(self.GRAPH_H, int(ms * scale))))
+
+        ty = gb + 6
+        for cols, color in self._lines:
+            for cx, text in zip(self.COLUMNS, cols):
+                ts = assets.render_text(text, "xs", color)
+                surf.blit(ts, (x + 8 + cx, ty))
+            ty += line_h
+
+
+# Singleton
+profiler = FrameProfiler()
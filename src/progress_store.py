@@ -0,0 +1,235 @@
+"""
+progress_store.py - Tiến độ học theo từng người chơi (SQLite ở PROGRESS_FILE)
+
+Mỗi (người chơi, câu hỏi) là 1 dòng: số lần làm, số lần đúng, tổng / lần cuối
+thời gian trả lời, lần cuối đúng hay sai, lần cuối gặp. Bảng WITHOUT ROWID có
+khoá chính (player_id, qid) → dữ liệu 1 người nằm liền nhau, đọc riêng 1 người
+không phải quét cả file dù máy dùng chung có hàng nghìn học sinh.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from src.constants import PROGRESS_FILE
+from src.persistence import persistence
+from src.ranking import player_key
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    id   INTEGER PRIMARY KEY,
+    key  TEXT UNIQUE NOT NULL,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS progress (
+    player_id    INTEGER NOT NULL,
+    qid          TEXT NOT NULL,
+    attempts     INTEGER NOT NULL,
+    correct      INTEGER NOT NULL,
+    total_ms     INTEGER NOT NULL,
+    last_ms      INTEGER NOT NULL,
+    last_correct INTEGER NOT NULL,
+    last_seen    INTEGER NOT NULL,
+    PRIMARY KEY (player_id, qid)
+) WITHOUT ROWID;
+"""
+
+# version → script nâng DB từ version đó lên version + 1. Chỉ thêm bảng / cột,
+# không bao giờ xoá dữ liệu người chơi. Đổi schema = thêm 1 bước vào cuối.
+_MIGRATIONS = {
+    0: _SCHEMA,
+}
+PROGRESS_VERSION = len(_MIGRATIONS)
+
+# Cộng dồn vào dòng đã có — đúng cả khi 1 lô ghi có nhiều lần làm cùng 1 câu
+_UPSERT = """
+INSERT INTO progress (player_id, qid, attempts, correct, total_ms, last_ms, last_correct, last_seen)
+VALUES (?, ?, 1, ?, ?, ?, ?, ?)
+ON CONFLICT (player_id, qid) DO UPDATE SET
+    attempts     = attempts + 1,
+    correct      = correct + excluded.correct,
+    total_ms     = total_ms + excluded.total_ms,
+    last_ms      = excluded.last_ms,
+    last_correct = excluded.last_correct,
+    last_seen    = excluded.last_seen
+"""
+
+FIELDS = ("attempts", "correct", "total_ms", "last_ms", "last_correct", "last_seen")
+
+
+class PlayerProgress:
+    """Tiến độ của 1 người chơi, đã đọc vào bộ nhớ: qid → dict FIELDS."""
+
+    def __init__(self, name: str, rows: dict):
+        self.name  = name
+        self._rows = rows
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, qid):
+        return str(qid) in self._rows
+
+    def get(self, qid) -> dict | None:
+        return self._rows.get(str(qid))
+
+    def accuracy(self) -> float:
+        """Tỉ lệ đúng trên mọi lần làm (0 nếu chưa làm câu nào)."""
+        attempts = sum(r["attempts"] for r in self._rows.values())
+        return sum(r["correct"] for r in self._rows.values()) / attempts if attempts else 0.0
+
+    def _apply(self, qid: str, correct: bool, ms: int, now: int):
+        r = self._rows.get(qid)
+        if r is None:
+            r = self._rows[qid] = dict.fromkeys(FIELDS, 0)
+        r["attempts"]    += 1
+        r["correct"]     += int(correct)
+        r["total_ms"]    += ms
+        r["last_ms"]      = ms
+        r["last_correct"] = int(correct)
+        r["last_seen"]    = now
+
+
+class ProgressStore:
+    """
+    - preload(name): giao việc đọc tiến độ 1 người cho thread persistence (lúc vào trận).
+    - player(name): tiến độ đã đọc của người chơi hiện tại, None nếu chưa đọc xong — không chờ.
+    - record(...): cập nhật bộ nhớ ngay, còn ghi SQLite thì gom lại thành 1 transaction
+      chạy trên thread persistence — scene không chờ đĩa.
+    Mọi thao tác SQLite chạy trên thread persistence; file .db chỉ mở lần dùng đầu tiên.
+    """
+
+    def __init__(self, path: str = PROGRESS_FILE):
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock    = threading.Lock()    # Kết nối dùng chung main thread + thread persistence
+        self._pending = []                  # (key, name, qid, correct, ms, now) chưa ghi
+        self._pending_lock = threading.Lock()   # Riêng cho _pending — record() không chờ commit
+        self._current: PlayerProgress | None = None
+        self._current_key = None
+        self._loading_key = None            # Người chơi đã giao việc đọc (tránh giao lặp)
+
+    # ─── Kết nối ──────────────────────────────────────────────
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version > PROGRESS_VERSION:
+                # File của bản game mới hơn — không đụng vào, để bản đó đọc tiếp
+                raise sqlite3.DatabaseError(
+                    f"{self.path} có schema v{version}, bản này chỉ hiểu tới v{PROGRESS_VERSION}")
+            for v in range(version, PROGRESS_VERSION):
+                # Mỗi bước 1 transaction (cả user_version) — tắt máy giữa chừng thì làm lại bước đó
+                conn.executescript(f"BEGIN;\n{_MIGRATIONS[v]}\nPRAGMA user_version = {v + 1};\nCOMMIT;")
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.close()
+            raise
+        self._conn = conn
+        return conn
+
+    def close(self):
+        persistence.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        self._current = self._current_key = self._loading_key = None
+
+    # ─── Đọc ──────────────────────────────────────────────────
+
+    def preload(self, name: str):
+        """Giao việc đọc tiến độ người chơi `name` cho thread persistence (không chờ)."""
+        if not name:
+            return
+        key = player_key(name)
+        if key in (self._current_key, self._loading_key):
+            return
+        self._loading_key = key
+        persistence.call("progress-load", lambda: self._load(name, key))
+
+    def player(self, name: str) -> PlayerProgress | None:
+        """
+        Tiến độ của người chơi `name` (so tên không phân biệt hoa thường / dạng dấu).
+        None nếu chưa đọc xong — khi đó giao việc đọc nếu chưa giao.
+        """
+        key = player_key(name)
+        if self._current is not None and self._current_key == key:
+            return self._current
+        self.preload(name)
+        return None
+
+    def _load(self, name: str, key: str):
+        """
+        Chạy trên thread persistence — sau mọi lô ghi đã giao trước đó. Bản ghi còn
+        trong _pending chưa nằm trong DB nên cộng thêm vào đây.
+        """
+        rows = {}
+        try:
+            with self._lock:
+                conn = self._db()
+                found = conn.execute("SELECT id FROM players WHERE key = ?", (key,)).fetchone()
+                if found:
+                    cur = conn.execute(
+                        f"SELECT qid, {', '.join(FIELDS)} FROM progress WHERE player_id = ?", found)
+                    rows = {r[0]: dict(zip(FIELDS, r[1:])) for r in cur}
+        except sqlite3.Error as e:
+            print(f"[Progress] Load error: {e}")
+        progress = PlayerProgress(name, rows)
+        with self._pending_lock:
+            for k, _, qid, c, ms, now in self._pending:
+                if k == key:
+                    progress._apply(qid, c, ms, now)
+            self._current, self._current_key = progress, key
+            if self._loading_key == key:
+                self._loading_key = None
+
+    # ─── Ghi ──────────────────────────────────────────────────
+
+    def record(self, name: str, qid, correct: bool, response_time: float):
+        """1 lần trả lời: câu qid, đúng / sai, thời gian trả lời (giây)."""
+        if not name or not qid:
+            return
+        key, qid = player_key(name), str(qid)
+        ms, now = int(response_time * 1000), int(time.time())
+        with self._pending_lock:
+            # Cùng khoá với _load: bản ghi hoặc đã nằm trong _current, hoặc _load sẽ cộng vào
+            if self._current is not None and self._current_key == key:
+                self._current._apply(qid, correct, ms, now)
+            self._pending.append((key, name, qid, int(correct), ms, now))
+        persistence.call("progress", self._write_pending)
+
+    def _write_pending(self):
+        """Chạy trên thread persistence: ghi mọi bản ghi đang chờ trong 1 transaction."""
+        with self._pending_lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return
+        with self._lock:
+            try:
+                conn = self._db()
+                ids = {}
+                for key, name, *_ in batch:
+                    if key not in ids:
+                        conn.execute("INSERT OR IGNORE INTO players (key, name) VALUES (?, ?)", (key, name))
+                        ids[key] = conn.execute("SELECT id FROM players WHERE key = ?", (key,)).fetchone()[0]
+                conn.executemany(_UPSERT, [(ids[key], qid, c, ms, ms, c, now)
+                                           for key, _, qid, c, ms, now in batch])
+                conn.commit()
+            except sqlite3.Error as e:
+                if self._conn is not None:
+                    self._conn.rollback()
+                # Giữ lại lô lỗi — lần ghi sau thử lại, không mất tiến độ
+                with self._pending_lock:
+                    self._pending[:0] = batch
+                print(f"[Progress] Save error: {e}")
+
+
+# Singleton (GameplayScene preload + ghi, ResultScene đọc qua player())
+progress_store = ProgressStore()
@@ -0,0 +1,159 @@
+"""
+question_catalog.py - Chỉ mục ngân hàng câu hỏi (lớp → môn → file) lưu trong saves/
+"""
+
+import json
+import os
+from src.constants import DATA_DIR, CATALOG_FILE
+from src.persistence import persistence
+
+
+CATALOG_VERSION = 1
+
+
+class QuestionCatalog:
+    """
+    Chỉ mục các file câu hỏi trong DATA_DIR/<lớp>/<môn>/*.json.
+
+    Mỗi file lưu: số câu, phân bố độ khó, phân bố dạng câu, size, mtime.
+    Chỉ file có (size, mtime) thay đổi mới bị đọc lại; danh sách thư mục con
+    được nhớ theo mtime của thư mục. Kết quả được ghi ra CATALOG_FILE để lần
+    chạy sau không phải parse lại toàn bộ.
+    """
+
+    def __init__(self, root: str = DATA_DIR, path: str = CATALOG_FILE):
+        self.root   = root
+        self.path   = path
+        self._files: dict[str, dict] = {}      # relpath → entry
+        self._dirs:  dict[str, tuple] = {}     # abspath → (mtime_ns, subdirs, json names)
+        self._loaded = False
+        self._dirty  = False
+
+    # ─── Lưu / đọc ────────────────────────────────────────────
+
+    def _ensure_loaded(self):
+        if self._loaded: return
+        self._loaded = True
+        if not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == CATALOG_VERSION:
+                self._files = data.get("files", {})
+        except Exception as e:
+            print(f"[Catalog] Load error: {e}")
+            self._files = {}
+
+    def save(self):
+        """Giao ghi catalog cho thread nền nếu có thay đổi (ghi file tạm rồi os.replace)."""
+        if not self._dirty: return
+        # Entry chỉ bị thay chứ không sửa tại chỗ → bản sao nông là đủ
+        persistence.write_json(self.path, {"version": CATALOG_VERSION, "files": dict(self._files)})
+        self._dirty = False
+
+    # ─── Quét thư mục ─────────────────────────────────────────
+
+    def _scan_dir(self, path: str) -> tuple[list, list]:
+        """(thư mục con, file .json) đã sắp xếp — nhớ theo mtime của thư mục."""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            self._dirs.pop(path, None)
+            return [], []
+        cached = self._dirs.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1], cached[2]
+        subdirs, files = [], []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        subdirs.append(entry.name)
+                    elif entry.name.endswith(".json") and entry.is_file():
+                        files.append(entry.name)
+        except OSError:
+            pass
+        subdirs.sort(); files.sort()
+        self._dirs[path] = (mtime, subdirs, files)
+        return subdirs, files
+
+    @staticmethod
+    def _summarize(fpath: str) -> dict:
+        counts = {"count": 0, "difficulty": {}, "types": {}}
+        try:
+            with open(fpath, encoding="utf-8") as f:
+                data = json.load(f)
+            questions = data.get("questions", [])
+        except Exception:
+            return counts
+        diff, types = counts["difficulty"], counts["types"]
+        for q in questions:
+            d = q.get("difficulty", "medium")
+            t = q.get("type", "")
+            diff[d]  = diff.get(d, 0) + 1
+            types[t] = types.get(t, 0) + 1
+        counts["count"] = len(questions)
+        return counts
+
+    def _entry(self, rel: str, st: os.stat_result) -> dict:
+        """Entry của 1 file; chỉ parse lại khi size/mtime khác bản đã lưu."""
+        e = self._files.get(rel)
+        if e is None or e.get("size") != st.st_size or e.get("mtime") != st.st_mtime_ns:
+            e = self._summarize(os.path.join(self.root, rel))
+            e["size"]  = st.st_size
+            e["mtime"] = st.st_mtime_ns
+            self._files[rel] = e
+            self._dirty = True
+        return e
+
+    # ─── Truy vấn ─────────────────────────────────────────────
+
+    def classes(self) -> list[dict]:
+        """[{"name", "subjects"}] — số môn của mỗi lớp."""
+        subdirs, _ = self._scan_dir(self.root)
+        return [{"name": c, "subjects": len(self._scan_dir(os.path.join(self.root, c))[0])}
+                for c in subdirs]
+
+    def subjects(self, class_name: str) -> list[dict]:
+        """[{"name", "files"}] — số bộ đề của mỗi môn."""
+        class_path = os.path.join(self.root, class_name)
+        subdirs, _ = self._scan_dir(class_path)
+        return [{"name": s, "files": len(self._scan_dir(os.path.join(class_path, s))[1])}
+                for s in subdirs]
+
+    def files(self, class_name: str, subject_name: str) -> list[dict]:
+        """
+        [{"path", "name", "count", "difficulty", "types", "size", "mtime"}]
+        File mới / đã sửa được đọc lại; file đã xoá bị bỏ khỏi catalog.
+        """
+        self._ensure_loaded()
+        subj_rel  = os.path.join(class_name, subject_name)
+        subj_path = os.path.join(self.root, subj_rel)
+        out, seen = [], set()
+        try:
+            with os.scandir(subj_path) as it:
+                entries = sorted((e for e in it if e.name.endswith(".json") and e.is_file()),
+                                 key=lambda e: e.name)
+        except OSError:
+            entries = []
+        for de in entries:
+            rel = os.path.join(subj_rel, de.name)
+            seen.add(rel)
+            try:
+                e = self._entry(rel, de.stat())
+            except OSError:
+                continue
+            out.append(dict(e, path=de.path, name=de.name[:-5]))
+
+        prefix = subj_rel + os.sep
+        for rel in [r for r in self._files if r.startswith(prefix) and r not in seen
+                    and os.sep not in r[len(prefix):]]:
+            del self._files[rel]
+            self._dirty = True
+        self.save()
+        return out
+
+
+# Singleton (dùng chung StartScene / QuestionBankScene)
+question_catalog = QuestionCatalog()
@@ -0,0 +1,242 @@
+"""
+question_dedupe.py - Phát hiện câu hỏi gần trùng (shingle + MinHash/LSH) giữa các bộ đề
+"""
+
+import json
+import os
+import re
+import unicodedata
+import zlib
+import numpy as np
+from src.constants import Q_MULTIPLE_CHOICE, Q_SHORT_ANSWER, Q_FACT_ANALYSIS
+from src.question_model import normalize_number
+
+
+SIG_EXT    = ".sig.npy"
+NUM_PERM   = 64             # Số hàm băm MinHash
+BANDS      = 16             # LSH: 16 band × 4 hàng → ngưỡng ứng viên ~ (1/16)^(1/4) ≈ 0.5
+ROWS       = NUM_PERM // BANDS
+THRESHOLD  = 0.8            # Jaccard ước lượng tối thiểu để coi là trùng
+BATCH      = 4096           # Số câu / lô khi tính chữ ký (giới hạn bộ nhớ)
+
+# Băm multiply-shift ((a·x + b) mod 2^64) >> 32 — a lẻ, cố định để chữ ký ổn định giữa các lần chạy
+_rng   = np.random.default_rng(0x5EED)
+_A     = _rng.integers(0, 1 << 63, NUM_PERM, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+_B     = _rng.integers(0, 1 << 63, NUM_PERM, dtype=np.uint64)
+_MIX   = np.uint64(0x9E3779B97F4A7C15)
+_FNV   = np.uint64(1099511628211)
+_SHIFT = np.uint64(32)
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+# ─── Chuẩn hoá ────────────────────────────────────────────────
+
+def normalize_text(s) -> str:
+    """Chữ thường, NFC, bỏ dấu câu / khoảng trắng thừa."""
+    return _NON_WORD.sub(" ", unicodedata.normalize("NFC", str(s)).lower()).strip()
+
+
+def question_text(d: dict) -> str:
+    """Nội dung so trùng: đề + đoạn văn + các phương án (sắp xếp — đảo A/B/C/D vẫn trùng)."""
+    choices = d.get("choices") or {}
+    opts = sorted(str(v).strip().lower() for v in choices.values()) if isinstance(choices, dict) else []
+    return normalize_text(" ".join([str(d.get("question", "")), str(d.get("passage") or "")] + opts))
+
+
+class _WordHash(dict):
+    """Bảng nhớ crc32 của từng từ (từ lặp lại rất nhiều giữa các câu)."""
+    def __missing__(self, w):
+        h = self[w] = zlib.crc32(w.encode("utf-8"))
+        return h
+
+
+def answer_key(d: dict) -> int:
+    """
+    crc32 của đáp án theo nội dung (không theo chữ cái A/B/C/D). Hai câu chỉ được
+    coi là trùng khi đáp án giống nhau — "2 + 3 = ?" và "2 + 4 = ?" không trùng.
+    """
+    t, ans = d.get("type", Q_MULTIPLE_CHOICE), d.get("answer", "")
+    choices = d.get("choices") or {}
+    if not isinstance(choices, dict):
+        choices = {}
+    if t == Q_MULTIPLE_CHOICE:
+        key = normalize_text(choices.get(str(ans).strip().upper(), ans))
+    elif t == Q_SHORT_ANSWER:
+        v = normalize_number(str(ans))
+        key = repr(v) if v is not None else normalize_text(ans)
+    elif t == Q_FACT_ANALYSIS and isinstance(ans, dict):
+        key = repr(sorted((normalize_text(choices.get(str(k).upper(), k)), bool(v))
+                          for k, v in ans.items()))
+    else:
+        key = normalize_text(ans)
+    return zlib.crc32(f"{t}|{key}".encode("utf-8"))
+
+
+# ─── Chữ ký MinHash ───────────────────────────────────────────
+
+def _signature_batch(questions: list, word_hash: _WordHash) -> np.ndarray:
+    # Shingle = cặp từ liền nhau; mỗi câu mở đầu bằng từ giả 0 nên câu 1 từ vẫn có shingle
+    words, starts = [], []
+    for d in questions:
+        starts.append(len(words))
+        words.append(0)
+        words.extend(map(word_hash.__getitem__, question_text(d).split()))
+    flat = np.array(words, np.uint64)
+    starts = np.array(starts, np.int64)
+
+    follows = np.ones(len(flat), bool)      # flat[j] ghép được với flat[j + 1]
+    follows[starts[1:] - 1] = False
+    follows[-1] = False
+    j = np.flatnonzero(follows)
+    x = ((flat[j] * _MIX) ^ flat[j + 1]) * _MIX
+    # Đoạn shingle của câu i bắt đầu ở starts[i] - i (mỗi câu mất 1 vị trí cuối)
+    seg = starts - np.arange(len(starts))
+    counts = np.diff(np.append(seg, len(j)))
+    empty = counts == 0                     # Câu không có chữ nào
+
+    sig = np.empty((len(questions), NUM_PERM + 1), np.uint32)
+    if len(j):
+        for p in range(NUM_PERM):
+            sig[:, p] = np.minimum.reduceat((_A[p] * x + _B[p]) >> _SHIFT,
+                                            np.minimum(seg, len(j) - 1))
+    sig[empty, :NUM_PERM] = 0
+    sig[:, NUM_PERM] = [answer_key(d) for d in questions]
+    return sig
+
+
+def compute_signatures(questions: list) -> np.ndarray:
+    """
+    (số câu, NUM_PERM + 1) uint32: NUM_PERM cột MinHash của shingle nội dung,
+    cột cuối là answer_key. Cùng thứ tự với danh sách câu hỏi.
+    """
+    questions = [q.to_dict() if hasattr(q, "to_dict") else q for q in questions]
+    if not questions:
+        return np.zeros((0, NUM_PERM + 1), np.uint32)
+    word_hash = _WordHash()
+    return np.concatenate([_signature_batch(questions[i:i + BATCH], word_hash)
+                           for i in range(0, len(questions), BATCH)])
+
+
+def sig_path_for(json_path: str) -> str:
+    return os.path.splitext(json_path)[0] + SIG_EXT
+
+
+def write_signatures(questions: list, path: str):
+    """Tính + ghi chữ ký cạnh bộ đề (ghi file tạm rồi os.replace)."""
+    sig = compute_signatures(questions)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        np.save(f, sig)
+    os.replace(tmp, path)
+
+
+def load_signatures(json_path: str) -> np.ndarray | None:
+    """
+    Chữ ký của 1 bộ đề: đọc file .sig.npy nếu còn mới (mtime ≥ json),
+    không thì tính từ JSON rồi ghi lại. None nếu không đọc được.
+    """
+    path = sig_path_for(json_path)
+    try:
+        if os.stat(path).st_mtime_ns >= os.stat(json_path).st_mtime_ns:
+            sig = np.load(path, mmap_mode="r")
+            if sig.ndim == 2 and sig.shape[1] == NUM_PERM + 1:
+                return sig
+    except (OSError, ValueError):
+        pass
+    try:
+        with open(json_path, encoding="utf-8") as f:
+            questions = json.load(f).get("questions", [])
+    except Exception as e:
+        print(f"[Dedupe] Error loading {json_path}: {e}")
+        return None
+    sig = compute_signatures(questions)
+    try:
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, sig)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"[Dedupe] Không ghi được {path}: {e}")
+    return sig
+
+
+# ─── LSH ──────────────────────────────────────────────────────
+
+def find_duplicates(sig: np.ndarray) -> np.ndarray:
+    """
+    Nhãn nhóm cho từng dòng chữ ký: labels[i] = chỉ số nhỏ nhất trong nhóm gần trùng
+    của i (labels[i] == i → câu "gốc"). Gần tuyến tính: mỗi band sắp xếp khoá băm 1 lần,
+    chỉ so các cặp cùng bucket (cặp kề nhau + với câu đầu bucket), xác nhận bằng tỉ lệ
+    MinHash trùng ≥ THRESHOLD.
+    """
+    n = len(sig)
+    labels = np.arange(n)
+    if n < 2:
+        return labels
+    # Chuyển vị (NUM_PERM, n) để đọc từng hàng MinHash liền mạch
+    mh  = np.ascontiguousarray(np.asarray(sig[:, :NUM_PERM]).T)
+    ans = np.asarray(sig[:, NUM_PERM], np.uint64)
+
+    pairs = []
+    for b in range(BANDS):
+        # Khoá bucket = băm các hàng của band + đáp án (khác đáp án không bao giờ là ứng viên)
+        key = ans * _MIX
+        for r in range(b * ROWS, (b + 1) * ROWS):
+            key ^= mh[r]
+            key *= _FNV
+        order = np.argsort(key)
+        ks    = key[order]
+        same  = ks[1:] == ks[:-1]
+        if not same.any():
+            continue
+        first  = np.concatenate(([True], ~same))
+        leader = order[np.flatnonzero(first)[np.cumsum(first) - 1]]
+        j = np.flatnonzero(same) + 1
+        pairs.append(np.stack([order[j - 1], order[j]], axis=1))
+        pairs.append(np.stack([leader[j], order[j]], axis=1))
+    if not pairs:
+        return labels
+
+    pairs = np.unique(np.sort(np.concatenate(pairs), axis=1), axis=0)
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+    agree = (mh[:, pairs[:, 0]] == mh[:, pairs[:, 1]]).mean(axis=0)
+    pairs = pairs[agree >= THRESHOLD]
+
+    # Union-find trên các câu có cặp trùng, gốc luôn là chỉ số nhỏ hơn
+    parent = {}
+
+    def root(i):
+        while parent.get(i, i) != i:
+            parent[i] = parent.get(parent[i], parent[i])
+            i = parent[i]
+        return i
+
+    for a, c in pairs.tolist():
+        ra, rc = root(a), root(c)
+        if ra != rc:
+            parent[max(ra, rc)] = min(ra, rc)
+    for i in list(parent):
+        labels[i] = root(i)
+    return labels
+
+
+def duplicate_counts(json_paths: list, cancel=None) -> list[int] | None:
+    """
+    Số câu của từng bộ đề trùng với 1 câu đứng trước (trong cùng bộ hoặc bộ trước đó).
+    Có thể mất vài giây (MinHash từ JSON + LSH) → gọi từ DuplicateCountJob; cancel
+    (threading.Event) được kiểm tra giữa các file, đã huỷ → None.
+    """
+    sigs = []
+    for p in json_paths:
+        if cancel is not None and cancel.is_set():
+            return None
+        sigs.append(load_signatures(p))
+    sizes = [0 if s is None else len(s) for s in sigs]
+    present = [s for s in sigs if s is not None and len(s)]
+    if not present:
+        return [0] * len(json_paths)
+    labels = find_duplicates(np.concatenate(present))
+    dup = labels != np.arange(len(labels))
+    bounds = np.cumsum([0] + sizes)
+    return [int(dup[bounds[i]:bounds[i + 1]].sum()) for i in range(len(json_paths))]
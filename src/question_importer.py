@@ -0,0 +1,492 @@
+"""
+question_importer.py - Import file .docx trên thread nền (tiến độ + huỷ), import hàng loạt đa tiến trình,
+lập chỉ mục kho câu hỏi SQLite và đếm câu gần trùng trên thread nền
+"""
+
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from src.question_parser import QuestionParser, ParseError
+from src.import_cache import ImportCache, import_cache, file_digest
+from src.question_pack import write_pack, pack_path_for
+from src.question_dedupe import write_signatures, sig_path_for, duplicate_counts
+from src.question_store import QuestionStore, question_store
+
+
+# ─── Import 1 file (chạy được trong tiến trình con) ──────────
+
+def _save_atomic(parser: QuestionParser, questions: list, dest_json: str, metadata: dict):
+    """
+    Ghi file tạm rồi os.replace — file .json không bao giờ ở trạng thái ghi dở.
+    Ghi kèm gói .qpk và chữ ký gần trùng .sig.npy (sau .json, để mtime ≥ json)
+    cho QuestionManager mở nhanh.
+    """
+    tmp = dest_json + ".part"
+    parser.save_questions(questions, tmp, metadata)
+    os.replace(tmp, dest_json)
+    try:
+        write_pack(questions, pack_path_for(dest_json))
+        write_signatures(questions, sig_path_for(dest_json))
+    except OSError as e:
+        # Không bắt buộc — QuestionManager sẽ dựng lại từ .json khi vào game
+        print(f"[Import] Không ghi được gói câu hỏi: {e}")
+
+
+def parse_cached(parser: QuestionParser, src_path: str, cache: ImportCache,
+                 digest: str | None = None) -> tuple:
+    """
+    Như parser.parse_docx nhưng qua ImportCache: file không đổi (cùng sha256)
+    lấy lại nguyên kết quả; file đã sửa chỉ parse các block mới.
+    Trả về (questions, errors, reused, update) — reused: số block lấy từ cache,
+    update: phần cache mới (ImportCache.take_update) cho tiến trình chính.
+    """
+    digest = digest or file_digest(src_path)
+    hit = cache.lookup(digest)
+    if hit is not None:
+        questions, errors, n_blocks = hit
+        parser.check_result(n_blocks, questions, errors)
+        return questions, errors, n_blocks, None
+
+    hits0 = cache.hits
+    questions, errors, bids = [], [], []
+    for _, bid, q, err in parser.iter_parse(parser.iter_blocks(parser.read_docx_lines(src_path)),
+                                            cache):
+        bids.append(bid)
+        if err is None:
+            questions.append(q)
+        else:
+            errors.append(err)
+    update = cache.take_update(digest, bids)
+    parser.check_result(len(bids), questions, errors)
+    return questions, errors, cache.hits - hits0, update
+
+
+_worker_cache: ImportCache | None = None
+
+
+def _init_worker(cache_path: str):
+    """Initializer của process pool: mỗi tiến trình con đọc cache 1 lần (chỉ đọc)."""
+    global _worker_cache
+    _worker_cache = ImportCache(cache_path)
+
+
+def import_docx(src_path: str, dest_json: str, metadata: dict | None = None,
+                cache: ImportCache | None = None, digest: str | None = None) -> dict:
+    """
+    Parse 1 file .docx (qua ImportCache) và lưu ra dest_json.
+    Trả về tóm tắt {"file", "dest", "valid", "failed", "reused", "error", "cache"}
+    (dest = None nếu lỗi; cache = phần cache mới, None nếu file không đổi).
+    """
+    summary = {"file": os.path.basename(src_path), "dest": None,
+               "valid": 0, "failed": 0, "reused": 0, "error": None, "cache": None}
+    parser = QuestionParser()
+    cache  = cache or _worker_cache or import_cache
+    try:
+        questions, errors, summary["reused"], summary["cache"] = \
+            parse_cached(parser, src_path, cache, digest)
+    except ParseError as e:
+        summary["error"] = str(e)
+        return summary
+    except Exception as e:
+        summary["error"] = f"Lỗi không xác định: {e}"
+        return summary
+
+    summary["valid"], summary["failed"] = len(questions), len(errors)
+    meta = dict(metadata or {})
+    meta["source_file"] = summary["file"]
+    try:
+        os.makedirs(os.path.dirname(dest_json), exist_ok=True)
+        _save_atomic(parser, questions, dest_json, meta)
+        summary["dest"] = dest_json
+    except OSError as e:
+        summary["error"] = f"Không ghi được file: {e}"
+    return summary
+
+
+def find_docx(paths: list, recursive: bool = False) -> list:
+    """Gom các file .docx từ danh sách file / thư mục (bỏ file tạm ~$ của Word)."""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            if recursive:
+                for root, dirs, files in os.walk(path):
+                    dirs.sort()
+                    found.extend(os.path.join(root, f) for f in sorted(files)
+                                 if f.lower().endswith(".docx") and not f.startswith("~$"))
+            else:
+                found.extend(os.path.join(path, f) for f in sorted(os.listdir(path))
+                             if f.lower().endswith(".docx") and not f.startswith("~$")
+                             and os.path.isfile(os.path.join(path, f)))
+        elif path.lower().endswith(".docx") and os.path.isfile(path):
+            found.append(path)
+    return found
+
+
+def iter_import(src_paths: list, dest_dir: str, metadata: dict | None = None,
+                workers: int | None = None, cancel: threading.Event | None = None,
+                cache: ImportCache | None = None):
+    """
+    Import nhiều file .docx vào dest_dir/<tên file>.json, yield tóm tắt từng file
+    theo thứ tự xong trước. workers > 1 → ProcessPoolExecutor (spawn, 1 file / task).
+    cancel: dừng giao file mới; file đang parse vẫn chạy hết (mỗi file ghi nguyên tử).
+
+    File trùng hash trong cache được xử lý ngay ở tiến trình chính, không vào pool.
+    Cache mới từ tiến trình con được gộp lại và lưu 1 lần khi xong.
+    """
+    cache = cache or import_cache
+    jobs, hits = [], []
+    for p in src_paths:
+        dest = os.path.join(dest_dir, os.path.splitext(os.path.basename(p))[0] + ".json")
+        try:
+            digest = file_digest(p)
+        except OSError:
+            digest = None               # import_docx sẽ báo lỗi mở file
+        if digest is not None and cache.lookup(digest) is not None:
+            hits.append((p, dest, digest))
+        else:
+            jobs.append((p, dest, digest))
+
+    def finish(summary):
+        update = summary.pop("cache", None)
+        if update is not None:
+            cache.apply_update(update)
+        return summary
+
+    try:
+        for src, dest, digest in hits:
+            if cancel is not None and cancel.is_set():
+                return
+            yield finish(import_docx(src, dest, metadata, cache, digest))
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = max(1, min(workers, len(jobs)))
+
+        def run_inline(pending):
+            for src, dest, digest in pending:
+                if cancel is not None and cancel.is_set():
+                    return
+                yield finish(import_docx(src, dest, metadata, cache, digest))
+
+        if workers == 1:
+            yield from run_inline(jobs)
+            return
+
+        # spawn: không fork tiến trình đang giữ cửa sổ / thread của SDL.
+        # Bản exe (PyInstaller) cần main.py gọi multiprocessing.freeze_support();
+        # pool không chạy được thì parse tuần tự ngay trong tiến trình này.
+        done = set()
+        try:
+            ctx  = multiprocessing.get_context("spawn")
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                                       initializer=_init_worker, initargs=(cache.path,))
+        except (OSError, ValueError) as e:
+            print(f"[Import] Không tạo được process pool, import tuần tự: {e}")
+            yield from run_inline(jobs)
+            return
+        try:
+            futures = {pool.submit(import_docx, src, dest, metadata, None, digest): i
+                       for i, (src, dest, digest) in enumerate(jobs)}
+            for fut in as_completed(futures):
+                if cancel is not None and cancel.is_set():
+                    return
+                summary = fut.result()
+                done.add(futures[fut])
+                yield finish(summary)
+        except (BrokenProcessPool, OSError) as e:
+            frozen = " (exe)" if getattr(sys, "frozen", False) else ""
+            print(f"[Import] Process pool lỗi{frozen}, import tuần tự phần còn lại: {e}")
+            yield from run_inline([j for i, j in enumerate(jobs) if i not in done])
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+    finally:
+        cache.save()
+
+
+def batch_summary(results: list) -> str:
+    """1 dòng tổng kết cho danh sách tóm tắt của import_docx."""
+    ok      = [r for r in results if r["dest"]]
+    valid   = sum(r["valid"] for r in ok)
+    skipped = sum(r["failed"] for r in ok)
+    reused  = sum(r["reused"] for r in ok)
+    msg = f"✓ {len(ok)}/{len(results)} file, {valid} câu hợp lệ"
+    if reused:
+        msg += f" ({reused} block dùng lại)"
+    if skipped:
+        msg += f", {skipped} câu lỗi bỏ qua"
+    if len(ok) < len(results):
+        msg += f", {len(results) - len(ok)} file lỗi"
+    return msg
+
+
+# ─── Job nền cho scene ───────────────────────────────────────
+
+class _BackgroundJob:
+    """
+    Chạy _run() trên 1 thread riêng; thread chỉ gửi message qua queue,
+    scene gọi poll() mỗi frame để nhận:
+        ("stage", text)              - đổi bước
+        ("progress", done, total)    - số block / số file đã xong
+        ("block_error", text)        - 1 block lỗi (bị bỏ qua)
+        ("file_done", summary)       - (batch) 1 file xong, xem import_docx
+        ("done", msg)                - hoàn tất
+        ("failed", msg)              - lỗi
+        ("cancelled",)               - đã huỷ
+    """
+
+    THREAD_NAME = "docx-import"
+
+    RUNNING   = "running"
+    DONE      = "done"
+    FAILED    = "failed"
+    CANCELLED = "cancelled"
+
+    def __init__(self):
+        self.state   = self.RUNNING
+        self.stage   = ""
+        self.done    = 0
+        self.total   = 0
+        self.errors: list[str]  = []
+        self.results: list[dict] = []
+        self._queue  = queue.Queue()
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=self.THREAD_NAME, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def running(self) -> bool:
+        return self.state == self.RUNNING
+
+    @property
+    def progress(self) -> float | None:
+        """0..1, None khi chưa biết tổng (đang đọc file)."""
+        return self.done / self.total if self.total else None
+
+    def poll(self) -> list:
+        """Lấy các message mới (không chặn) và cập nhật trạng thái job."""
+        msgs = []
+        while True:
+            try:
+                msg = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            kind = msg[0]
+            if kind == "stage":
+                self.stage = msg[1]
+            elif kind == "progress":
+                self.done, self.total = msg[1], msg[2]
+            elif kind == "block_error":
+                self.errors.append(msg[1])
+            elif kind == "file_done":
+                self.results.append(msg[1])
+            elif kind == "done":
+                self.state = self.DONE
+            elif kind == "failed":
+                self.state = self.FAILED
+            elif kind == "cancelled":
+                self.state = self.CANCELLED
+            msgs.append(msg)
+        return msgs
+
+    def _run(self):
+        raise NotImplementedError
+
+
+class ImportJob(_BackgroundJob):
+    """
+    Parse 1 file .docx và lưu ra .json trên 1 thread riêng để scene không bị đứng
+    (tiến độ theo block, xem _BackgroundJob).
+
+    cancel() có hiệu lực giữa các block (bước đọc .docx không ngắt được).
+    File .json chỉ xuất hiện khi import thành công (ghi file tạm rồi os.replace).
+    Dùng ImportCache: file đã import (cùng nội dung) xong ngay, file sửa chỉ parse block mới.
+    """
+
+    def __init__(self, src_path: str, dest_json: str, metadata: dict | None = None,
+                 parser: QuestionParser | None = None, cache: ImportCache | None = None):
+        super().__init__()
+        self.src_path  = src_path
+        self.dest_json = dest_json
+        self.metadata  = metadata or {}
+        self._parser   = parser or QuestionParser()
+        self._cache    = cache or import_cache
+
+    # ─── Thread nền ───────────────────────────────────────────
+
+    def _run(self):
+        put = self._queue.put
+        try:
+            digest = file_digest(self.src_path)
+            hit = self._cache.lookup(digest)
+            if hit is not None:
+                questions, errors, n_blocks = hit
+                self._parser.check_result(n_blocks, questions, errors)
+                put(("progress", n_blocks, n_blocks))
+                self._finish(questions, errors, f"dùng lại kết quả cũ, {n_blocks} block")
+                return
+
+            put(("stage", "Đang đọc file..."))
+            lines = self._parser.read_docx_lines(self.src_path)
+            if self._cancel.is_set():
+                put(("cancelled",)); return
+
+            blocks = self._parser.split_blocks(lines)
+            if not blocks:
+                put(("failed", "✗ Lỗi: Không tìm thấy câu hỏi nào. "
+                               "Mỗi câu phải bắt đầu bằng [MC]/[SA]/[FA] theo đúng định dạng."))
+                return
+
+            put(("stage", "Đang phân tích câu hỏi..."))
+            total = len(blocks)
+            step  = max(1, total // 100)    # ~100 message tiến độ cho cả file
+            questions, errors, bids = [], [], []
+            hits0 = self._cache.hits
+            for i, bid, q, err in self._parser.iter_parse(blocks, self._cache):
+                if self._cancel.is_set():
+                    put(("cancelled",)); return
+                bids.append(bid)
+                if err is None:
+                    questions.append(q)
+                else:
+                    errors.append(err)
+                    put(("block_error", err))
+                if (i + 1) % step == 0 or i + 1 == total:
+                    put(("progress", i + 1, total))
+
+            self._cache.put_file(digest, bids)
+            self._cache.save()
+            if not questions:
+                put(("failed", f"✗ Lỗi: Tất cả câu hỏi đều lỗi ({len(errors)} block)"))
+                return
+
+            reused = self._cache.hits - hits0
+            self._finish(questions, errors, f"dùng lại {reused} block" if reused else "")
+        except ParseError as e:
+            put(("failed", f"✗ Lỗi: {e}"))
+        except Exception as e:
+            put(("failed", f"✗ Lỗi không xác định: {e}"))
+
+
+    def _finish(self, questions: list, errors: list, note: str):
+        put = self._queue.put
+        if self._cancel.is_set():
+            put(("cancelled",)); return
+        put(("stage", "Đang lưu..."))
+        _save_atomic(self._parser, questions, self.dest_json, self.metadata)
+
+        msg = f"✓ Tìm thấy {len(questions)} câu hợp lệ"
+        if errors:
+            msg += f" ({len(errors)} câu lỗi bỏ qua)"
+        if note:
+            msg += f" · {note}"
+        put(("done", msg))
+
+
+class BatchImportJob(_BackgroundJob):
+    """
+    Import cả thư mục .docx vào dest_dir bằng process pool (xem iter_import).
+    Tiến độ theo file; mỗi file xong gửi ("file_done", summary).
+    """
+
+    def __init__(self, src_paths: list, dest_dir: str, metadata: dict | None = None,
+                 workers: int | None = None):
+        super().__init__()
+        self.src_paths = list(src_paths)
+        self.dest_dir  = dest_dir
+        self.metadata  = metadata or {}
+        self.workers   = workers
+
+    def _run(self):
+        put   = self._queue.put
+        total = len(self.src_paths)
+        if not total:
+            put(("failed", "Không có file .docx nào trong thư mục!"))
+            return
+        try:
+            put(("stage", f"Đang import {total} file..."))
+            put(("progress", 0, total))
+            results = []
+            for summary in iter_import(self.src_paths, self.dest_dir, self.metadata,
+                                       self.workers, self._cancel):
+                results.append(summary)
+                put(("file_done", summary))
+                put(("progress", len(results), total))
+        except Exception as e:
+            put(("failed", f"✗ Lỗi không xác định: {e}"))
+            return
+        if len(results) < total:
+            put(("cancelled",))
+            return
+        put(("done", batch_summary(results)))
+
+
+class StoreSyncJob(_BackgroundJob):
+    """
+    QuestionStore.sync trên thread nền bằng kết nối SQLite riêng — lần đầu lập chỉ
+    mục cả data/ có thể mất vài giây. Tiến độ theo file; cancel() dừng giữa các file.
+    """
+
+    THREAD_NAME = "store-sync"
+
+    def __init__(self, store: QuestionStore | None = None, paths: list | None = None):
+        super().__init__()
+        self.store = store or question_store
+        self.paths = paths
+        self.changed = 0
+
+    def _run(self):
+        put = self._queue.put
+        put(("stage", "Đang lập chỉ mục..."))
+        try:
+            conn = self.store.connect()
+            try:
+                self.changed = self.store.sync(
+                    self.paths, conn, self._cancel,
+                    lambda done, total: put(("progress", done, total)))
+            finally:
+                conn.close()
+        except Exception as e:
+            put(("failed", f"Lỗi kho câu hỏi: {e}"))
+            return
+        if self._cancel.is_set():
+            put(("cancelled",))
+            return
+        put(("done", f"{self.changed} bộ đề đã lập lại chỉ mục"))
+
+
+class DuplicateCountJob(_BackgroundJob):
+    """
+    duplicate_counts trên thread nền — bộ đề lớn chưa có .sig.npy phải tính MinHash
+    từ JSON, đã có chữ ký thì LSH vẫn tốn vài chục ms. Xong → counts (cùng thứ tự paths).
+    """
+
+    THREAD_NAME = "dup-count"
+
+    def __init__(self, paths: list):
+        super().__init__()
+        self.paths = list(paths)
+        self.counts: list[int] = []
+
+    def _run(self):
+        put = self._queue.put
+        put(("stage", "Đang đếm câu trùng..."))
+        try:
+            counts = duplicate_counts(self.paths, self._cancel)
+        except Exception as e:
+            put(("failed", f"Lỗi đếm câu trùng: {e}"))
+            return
+        if counts is None:
+            put(("cancelled",))
+            return
+        self.counts = counts
+        put(("done", f"{sum(counts)} câu trùng"))
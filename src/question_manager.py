@@ -2,14 +2,19 @@
 question_manager.py - Quản lý pool câu hỏi trong game
 """
 
-import json
 import random
 import os
+from bisect import bisect_right
+import numpy as np
 from src.constants import (
     Q_MULTIPLE_CHOICE, Q_SHORT_ANSWER, Q_FACT_ANALYSIS,
     ZONE_HEAD_KEY, ZONE_BODY_KEY, ZONE_LIMB_KEY,
     ZONE_DIFFICULTY,
 )
+from src.question_model import Question
+from src.question_pack import DIFFICULTIES, open_bank
+from src.question_store import question_store
+from src.question_dedupe import load_signatures, find_duplicates
 
 
 class QuestionManager:
@@ -20,54 +25,134 @@ class QuestionManager:
     - hard   → zone head
     - medium → zone body  
     - easy   → zone limb
+
+    Mỗi file .json được mở qua gói .qpk (question_pack.open_bank): lúc load chỉ đọc
+    bảng index (khoá id + độ khó), câu hỏi chỉ được giải mã khi thực sự được rút ra.
+    Mỗi difficulty là 1 mảng chỉ số đã xáo trộn + con trỏ: lấy câu = tiến con trỏ
+    (O(1) trung bình), bỏ qua câu có id đã dùng ở difficulty khác.
+    Câu gần trùng giữa các bộ đề gộp (question_dedupe) được tính như cùng id.
+    Số câu còn lại được cập nhật dần khi lấy, không quét lại pool.
     """
 
+    DIFFICULTIES = DIFFICULTIES
+
     def __init__(self):
-        # Dict: difficulty → list of questions
-        self._pool = {
-            "easy":   [],
-            "medium": [],
-            "hard":   [],
-        }
-        # Câu hỏi đã dùng trong vòng hiện tại
-        self._used_ids = set()
-        # Toàn bộ câu hỏi gốc (để reset)
-        self._all_questions = []
+        # Nguồn câu hỏi (QuestionPack / QuestionList) + chỉ số toàn cục bắt đầu của từng nguồn
+        self._sources = []
+        self._starts  = []
+        self._total   = 0
+        # Chỉ số toàn cục → mã độ khó / id đã khử trùng (0..số id khác nhau - 1)
+        self._diffs = np.zeros(0, np.uint8)
+        self._uid   = []
+        # Dict: difficulty → hàng đợi chỉ số câu hỏi đã xáo trộn
+        self._pool = {d: [] for d in self.DIFFICULTIES}
+        self._cursor    = {d: 0 for d in self.DIFFICULTIES}
+        self._remaining = {d: 0 for d in self.DIFFICULTIES}
+        # id xuất hiện nhiều lần (bộ đề gộp) → các difficulty chứa nó
+        self._dup_ids: dict[int, list] = {}
+        # id (đã khử trùng) đã dùng trong vòng hiện tại
+        self._used = bytearray()
+        self._used_count = 0
 
     def load_files(self, filepaths: list) -> int:
         """
         Load danh sách file .json vào pool.
         Trả về tổng số câu hỏi đã load.
         """
-        self._all_questions = []
-        
+        sources, sigs = [], []
         for fp in filepaths:
             if not os.path.isfile(fp):
                 continue
             try:
-                with open(fp, encoding="utf-8") as f:
-                    data = json.load(f)
-                questions = data.get("questions", [])
-                self._all_questions.extend(questions)
+                src = open_bank(fp)
             except Exception as e:
                 print(f"[QuestionManager] Error loading {fp}: {e}")
+                continue
+            sig = load_signatures(fp)
+            sources.append(src)
+            sigs.append(sig if sig is not None and len(sig) == len(src) else None)
+        return self._load_sources(sources, sigs)
+
+    def load_query(self, text: str = "", store=None, **filters) -> int:
+        """
+        Load pool từ kho SQLite theo bộ lọc thay vì nguyên file, vd.
+        load_query(cls="Lớp 10", subject="Hóa", qtype="fact_analysis", difficulty="hard").
+        filters: cls, subject, qtype, difficulty, paths (xem QuestionStore.search).
+        Trả về tổng số câu hỏi đã load.
+        """
+        store = store or question_store
+        try:
+            store.sync(filters.get("paths"))
+            sources = [store.query(text, **filters)]
+        except Exception as e:
+            print(f"[QuestionManager] Error querying store: {e}")
+            sources = []
+        return self._load_sources(sources)
+
+    def _load_sources(self, sources: list, sigs: list | None = None) -> int:
+        """
+        sigs: chữ ký gần trùng (question_dedupe) của từng nguồn, None = không có.
+        Câu gần trùng (khác id, cùng nội dung + đáp án) được gộp chung 1 khoá id
+        → dùng 1 câu là cả nhóm bị coi như đã dùng, như câu trùng id.
+        """
+        self.close()
+        self._sources = sources
+
+        sizes = [len(s) for s in self._sources]
+        self._starts = np.cumsum([0] + sizes[:-1]).tolist()
+        self._total  = sum(sizes)
+        if self._sources:
+            keys        = np.concatenate([s.keys for s in self._sources])
+            self._diffs = np.concatenate([s.diffs for s in self._sources])
+            near = [(start, sig) for start, sig in zip(self._starts, sigs or []) if sig is not None]
+            if near:
+                idx = np.concatenate([np.arange(start, start + len(sig)) for start, sig in near])
+                labels = find_duplicates(np.concatenate([sig for _, sig in near]))
+                keys[idx] = keys[idx[labels]]
+            _, uid, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        else:
+            self._diffs, uid, counts = np.zeros(0, np.uint8), np.zeros(0, np.int64), np.zeros(0, np.int64)
+        self._uid  = uid.tolist()
+        self._used = bytearray(len(counts))
+
+        self._dup_ids = {}
+        for i in np.flatnonzero(counts[uid] > 1).tolist():
+            self._dup_ids.setdefault(self._uid[i], []).append(
+                self.DIFFICULTIES[self._diffs[i]])
 
         self._rebuild_pool()
-        return len(self._all_questions)
+        return self._total
+
+    def close(self):
+        """Đóng các gói câu hỏi đang mở (mmap) — trên Windows file .qpk bị khoá tới lúc này."""
+        for s in self._sources:
+            s.close()
+        self._sources = []
+        self._starts  = []
+        self._total   = 0
+
+    def __len__(self):
+        return self._total
+
+    def question_at(self, i: int) -> Question:
+        """Câu hỏi theo chỉ số toàn cục (0..len-1), giải mã khi cần."""
+        src = bisect_right(self._starts, i) - 1
+        return self._sources[src].get(i - self._starts[src])
 
     def _rebuild_pool(self):
-        """Phân loại lại câu hỏi vào pool theo difficulty."""
-        self._pool = {"easy": [], "medium": [], "hard": []}
-        self._used_ids = set()
-
-        for q in self._all_questions:
-            diff = q.get("difficulty", "medium")
-            if diff in self._pool:
-                self._pool[diff].append(q)
-            else:
-                self._pool["medium"].append(q)
-
-    def get_question_for_zone(self, zone: str) -> dict | None:
+        """Phân loại lại câu hỏi vào pool theo difficulty rồi xáo trộn từng hàng đợi."""
+        self._used = bytearray(len(self._used))
+        self._used_count = 0
+        # Seed lấy từ random → vẫn tái lập được bằng random.seed như trước
+        rng = np.random.default_rng(random.getrandbits(64))
+        for code, diff in enumerate(self.DIFFICULTIES):
+            qs = np.flatnonzero(self._diffs == code)
+            rng.shuffle(qs)
+            self._pool[diff]      = qs.tolist()
+            self._cursor[diff]    = 0
+            self._remaining[diff] = len(qs)
+
+    def get_question_for_zone(self, zone: str) -> Question | None:
         """
         Lấy câu hỏi chưa dùng cho vùng robot.
         zone: ZONE_HEAD_KEY | ZONE_BODY_KEY | ZONE_LIMB_KEY
@@ -102,23 +187,40 @@ class QuestionManager:
         # Không có câu hỏi nào
         return None
 
-    def _pick_from_difficulty(self, difficulty: str) -> dict | None:
-        """Chọn ngẫu nhiên 1 câu chưa dùng từ difficulty pool."""
-        available = [
-            q for q in self._pool.get(difficulty, [])
-            if q["id"] not in self._used_ids
-        ]
-        if not available:
+    def _pick_from_difficulty(self, difficulty: str) -> Question | None:
+        """Lấy câu kế tiếp chưa dùng trong hàng đợi (đã xáo trộn) của difficulty."""
+        queue = self._pool.get(difficulty)
+        if not queue:
             return None
+        used, uid = self._used, self._uid
+        i = self._cursor[difficulty]
+        n = len(queue)
+        while i < n:
+            gi = queue[i]
+            i += 1
+            u = uid[gi]
+            if not used[u]:
+                self._cursor[difficulty] = i
+                self._mark_used(u, difficulty)
+                return self.question_at(gi)
+        self._cursor[difficulty] = i
+        return None
 
-        q = random.choice(available)
-        self._used_ids.add(q["id"])
-        return q
+    def _mark_used(self, u: int, difficulty: str):
+        self._used[u] = 1
+        self._used_count += 1
+        dup = self._dup_ids.get(u)
+        if dup is None:
+            self._remaining[difficulty] -= 1
+        else:
+            # Mọi bản sao cùng id đều không còn dùng được
+            for d in dup:
+                self._remaining[d] -= 1
 
     def get_stats(self) -> dict:
         """Thống kê pool câu hỏi."""
-        used = len(self._used_ids)
-        total = len(self._all_questions)
+        used = self._used_count
+        total = self._total
         return {
             "total": total,
             "used": used,
@@ -126,7 +228,7 @@ class QuestionManager:
             "by_difficulty": {
                 diff: {
                     "total": len(qs),
-                    "remaining": sum(1 for q in qs if q["id"] not in self._used_ids),
+                    "remaining": self._remaining[diff],
                 }
                 for diff, qs in self._pool.items()
             }
@@ -164,4 +266,4 @@ class QuestionManager:
     @property
     def has_questions(self) -> bool:
         """True nếu còn câu hỏi để dùng."""
-        return len(self._all_questions) > 0
+        return self._total > 0
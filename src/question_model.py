@@ -0,0 +1,136 @@
+"""
+question_model.py - Kiểu Question gọn (__slots__) với đáp án đã chuẩn hoá sẵn
+"""
+
+import re
+import sys
+import uuid
+from src.constants import Q_MULTIPLE_CHOICE, Q_SHORT_ANSWER, Q_FACT_ANALYSIS
+
+
+_UNIT_SUFFIX = re.compile(r'[a-zA-Z%°]+$')
+_INTERNED    = {s: sys.intern(s) for s in (Q_MULTIPLE_CHOICE, Q_SHORT_ANSWER, Q_FACT_ANALYSIS,
+                                           "easy", "medium", "hard")}
+
+
+def normalize_number(s: str):
+    """'3,5cm' → 3.5; None nếu không phải số."""
+    s = s.strip().replace(",", ".")
+    s = _UNIT_SUFFIX.sub('', s).strip()
+    try: return float(s)
+    except ValueError: return None
+
+
+def _intern(s) -> str:
+    s = str(s)
+    return _INTERNED.get(s) or sys.intern(s)
+
+
+class Question:
+    """
+    1 câu hỏi đã load. Dựng 1 lần khi load bộ đề, sau đó dùng chung cho
+    QuestionManager / QuestionOverlay / GameplayScene.
+
+    - type, difficulty được intern (so sánh / làm key dict rẻ hơn)
+    - MC: mc_key (đáp án viết hoa) + hint_keys (các key sai để Hint Reveal)
+    - SA: sa_value + sa_tol (đáp án số) hoặc sa_text (so sánh chữ)
+    - FA: answer là dict {key: bool} đã chuẩn hoá
+
+    Vẫn đọc được như dict: q["question"], q.get("choices", {}), "answer" in q.
+    """
+
+    KEYS = ("id", "type", "difficulty", "question", "choices", "answer", "passage")
+
+    __slots__ = KEYS + ("mc_key", "hint_keys", "sa_value", "sa_tol", "sa_text")
+
+    def __init__(self, id: str, type: str, difficulty: str, question: str,
+                 choices: dict | None = None, answer=None, passage: str = ""):
+        self.id         = id
+        self.type       = _intern(type)
+        self.difficulty = _intern(difficulty)
+        self.question   = question
+        self.choices    = choices or {}
+        self.passage    = passage or ""
+        self.mc_key     = None
+        self.hint_keys  = ()
+        self.sa_value   = None
+        self.sa_tol     = 0.0
+        self.sa_text    = None
+
+        if self.type == Q_MULTIPLE_CHOICE:
+            self.mc_key    = str(answer).strip().upper()
+            self.hint_keys = tuple(k for k in self.choices if k.upper() != self.mc_key)
+        elif self.type == Q_SHORT_ANSWER:
+            self._compile_sa(str(answer))
+        elif self.type == Q_FACT_ANALYSIS and isinstance(answer, dict):
+            answer = {str(k).upper(): bool(v) for k, v in answer.items()}
+        self.answer = answer
+
+    def _compile_sa(self, correct: str):
+        self.sa_text  = correct.strip().lower()
+        self.sa_value = normalize_number(correct)
+        if self.sa_value is None:
+            return
+        c_str = correct.strip().replace(",", ".")
+        if "." in c_str:
+            decimals    = len(c_str.rstrip("0").split(".")[1])
+            self.sa_tol = 0.5 * (10 ** (-decimals)) + 1e-9
+        else:
+            self.sa_tol = 0.01
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Question":
+        if isinstance(d, cls):
+            return d
+        return cls(
+            id=str(d.get("id") or uuid.uuid4()),
+            type=d.get("type", Q_MULTIPLE_CHOICE),
+            difficulty=d.get("difficulty", "medium"),
+            question=d.get("question", ""),
+            choices=d.get("choices") or {},
+            answer=d.get("answer", ""),
+            passage=d.get("passage", ""),
+        )
+
+    def to_dict(self) -> dict:
+        return {k: getattr(self, k) for k in self.KEYS}
+
+    # ─── Chấm đáp án ──────────────────────────────────────────
+
+    def check(self, user_answer) -> bool:
+        """MC: "A".."D" · SA: chuỗi (số có dung sai) · FA: {key: bool}."""
+        t = self.type
+        if t == Q_MULTIPLE_CHOICE:
+            return str(user_answer).strip().upper() == self.mc_key
+        if t == Q_SHORT_ANSWER:
+            user = str(user_answer)
+            if self.sa_value is not None:
+                u_num = normalize_number(user)
+                if u_num is not None:
+                    return abs(u_num - self.sa_value) <= self.sa_tol
+            return user.strip().lower() == self.sa_text
+        if t == Q_FACT_ANALYSIS:
+            return (isinstance(user_answer, dict) and isinstance(self.answer, dict)
+                    and all(user_answer.get(k) == v for k, v in self.answer.items()))
+        return False
+
+    # ─── Truy cập kiểu dict ───────────────────────────────────
+
+    def __getitem__(self, key):
+        if key in self.KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key in self.KEYS:
+            return getattr(self, key)
+        return default
+
+    def __contains__(self, key):
+        return key in self.KEYS
+
+    def keys(self):
+        return self.KEYS
+
+    def __repr__(self):
+        return f"Question({self.id!r}, {self.type!r}, {self.difficulty!r})"
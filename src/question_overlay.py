@@ -1,34 +1,18 @@
 """
 question_overlay.py - Overlay Câu Hỏi (v2 - Time Attack + Power-ups)
 """
-import pygame, math, re
+import pygame, math
 from src.constants import *
 from src.assets import assets
 from src.ui_components import Button, TextInput
+from src.post_fx import post_fx
+from src.question_model import Question
+from src.render_utils import display_format
 
 # ── Timer theo độ khó ──────────────────────────────────────
 TIMER_BY_DIFF = {"easy": 15.0, "medium": 10.0, "hard": 8.0}
 SPEED_BONUS_THRESHOLD = 3.0   # Trả lời trong 3s đầu → ×2
 
-def _normalize_number(s: str):
-    s = s.strip().replace(",", ".")
-    s = re.sub(r'[a-zA-Z%°]+$', '', s).strip()
-    try: return float(s)
-    except ValueError: return None
-
-def _numbers_match(user: str, correct: str) -> bool:
-    u_num = _normalize_number(user)
-    c_num = _normalize_number(correct)
-    if u_num is not None and c_num is not None:
-        c_str = str(correct).strip().replace(",", ".")
-        if "." in c_str:
-            decimals = len(c_str.rstrip("0").split(".")[1]) if "." in c_str else 0
-            tol = 0.5 * (10 ** (-decimals)) + 1e-9
-        else:
-            tol = 0.01
-        return abs(u_num - c_num) <= tol
-    return user.strip().lower() == correct.strip().lower()
-
 def _lerp_color(a, b, t):
     return tuple(int(a[i] + (b[i] - a[i]) * t) for i in range(3))
 
@@ -58,6 +42,7 @@ class QuestionOverlay:
 
         # ── Speed bonus ───────────────────────────────────────
         self.last_score_mult = 1.0   # Đọc từ gameplay sau khi answer
+        self.last_response_time = 0.0  # Giây từ lúc hiện câu tới lúc trả lời
 
         self._fa_checkboxes  = {}
         self._mc_buttons     = {}
@@ -67,13 +52,16 @@ class QuestionOverlay:
         self._pending_result = None
         self._panel_x = SCREEN_W // 2 - 440
         self._panel_w = 880
+        self._panel_key    = None   # (pw, ph, màu vùng) của các lớp nền panel đã vẽ
+        self._panel_layers = None   # (glow alpha đầy, nền, top bar)
 
     @property
     def is_visible(self):
         return self._state != self.STATE_HIDDEN
 
     # ── Show / Hide ────────────────────────────────────────────
-    def show(self, question: dict, zone: str, slow_time=False, hint_reveal=False, use_timer=True, keyboard_nav=False, nav_keys=None):
+    def show(self, question, zone: str, slow_time=False, hint_reveal=False, use_timer=True, keyboard_nav=False, nav_keys=None):
+        question = Question.from_dict(question)   # dict cũ → Question (đáp án chuẩn hoá sẵn)
         self._question   = question
         self._zone       = zone
         self._state      = self.STATE_SHOW
@@ -98,18 +86,15 @@ class QuestionOverlay:
         self._double_click_window = 0.4  # 400ms window for double-click
 
         # Set timer — nếu không dùng timer thì đặt rất lớn (vô hạn thực tế)
-        diff = question.get("difficulty", "medium")
+        diff = question.difficulty
         base = TIMER_BY_DIFF.get(diff, 10.0) if use_timer else 999.0
         self._timer_max = base
         self._timer     = base
 
         # Hint: chọn 1 key sai ngẫu nhiên để "hé lộ" (làm xám đi)
-        if hint_reveal and question["type"] == Q_MULTIPLE_CHOICE:
+        if hint_reveal and question.type == Q_MULTIPLE_CHOICE and question.hint_keys:
             import random
-            correct = str(question["answer"]).upper()
-            wrong_keys = [k for k in question.get("choices", {}) if k.upper() != correct]
-            if wrong_keys:
-                self._hint_key = random.choice(wrong_keys)
+            self._hint_key = random.choice(question.hint_keys)
 
         pygame.mouse.set_visible(not keyboard_nav)  # Hide mouse in multiplayer
         self._build_ui()
@@ -307,18 +292,12 @@ class QuestionOverlay:
 
     # ── Answer checking ────────────────────────────────────────
     def _submit_answer(self, user_answer):
-        q = self._question; correct = q["answer"]; q_type = q["type"]
-
         if user_answer == "__TIMEOUT__":
             is_correct = False
-        elif q_type == Q_MULTIPLE_CHOICE:
-            is_correct = str(user_answer).strip().upper() == str(correct).strip().upper()
-        elif q_type == Q_SHORT_ANSWER:
-            is_correct = _numbers_match(str(user_answer), str(correct))
-        elif q_type == Q_FACT_ANALYSIS:
-            is_correct = isinstance(user_answer, dict) and all(user_answer.get(k)==v for k,v in correct.items())
         else:
-            is_correct = False
+            is_correct = self._question.check(user_answer)
+
+        self.last_response_time = self._time
 
         # Speed bonus multiplier
         elapsed = self._timer_max - self._timer
@@ -343,19 +322,31 @@ class QuestionOverlay:
         self._draw_panel(int(self._slide_y))
         pygame.mouse.set_visible(True)
 
+    def _get_panel_layers(self, pw, ph, top_bar_h, zc):
+        key = (pw, ph, zc)
+        if key != self._panel_key:
+            gs = pygame.Surface((pw+40, ph+40), pygame.SRCALPHA)
+            pygame.draw.rect(gs, (*zc, 255), gs.get_rect(), border_radius=20)
+            ps = pygame.Surface((pw, ph), pygame.SRCALPHA)
+            pygame.draw.rect(ps, (10,14,28,248), ps.get_rect(), border_radius=16)
+            bar_bg = tuple(int(c*0.4) for c in zc)
+            bar_s = pygame.Surface((pw, top_bar_h), pygame.SRCALPHA)
+            pygame.draw.rect(bar_s, (*bar_bg, 220), bar_s.get_rect(), border_radius=14)
+            self._panel_layers = tuple(display_format(s, alpha=True) for s in (gs, ps, bar_s))
+            self._panel_key = key
+        return self._panel_layers
+
     def _draw_panel(self, offset):
         q = self._question
         if not q: return
         alpha = int(170 * max(0.0, 1.0 - abs(offset)/SCREEN_H))
-        dim = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        dim.fill((0,0,0,alpha))
-        self.screen.blit(dim, (0,0))
+        post_fx.fade(self.screen, alpha)
 
         zone_colors = {ZONE_HEAD_KEY:(220,80,80), ZONE_BODY_KEY:(80,160,220), ZONE_LIMB_KEY:(80,200,120)}
         zc = zone_colors.get(self._zone, (0,200,255))
         px = self._panel_x; pw = self._panel_w; pad = 28
 
-        q_surf_h  = self._estimate_text_h(q["question"], pw-pad*2, "md")
+        q_surf_h  = self._estimate_text_h(q["question"], pw-pad*2, "md", bold=True)
         passage_h = (self._estimate_text_h(q.get("passage",""), pw-pad*2, "sm")+14) if q["type"]==Q_FACT_ANALYSIS and q.get("passage") else 0
         extra_h   = len(q.get("choices",{}))*60+40 if q["type"]==Q_MULTIPLE_CHOICE else (140 if q["type"]==Q_SHORT_ANSWER else len(q.get("choices",{}))*62+70)
         top_bar_h = 50
@@ -363,20 +354,15 @@ class QuestionOverlay:
         ph = max(380, min(int(top_bar_h+20+q_surf_h+passage_h+extra_h+60+timer_bar_h), 660))
         py = max(20, (SCREEN_H-ph)//2) + offset
 
-        # Panel BG + glow
+        # Panel BG + glow (vẽ lại chỉ khi đổi kích thước / vùng; glow nhịp bằng set_alpha)
+        glow, ps, bar_s = self._get_panel_layers(pw, ph, top_bar_h, zc)
         pulse = 0.6 + 0.4*math.sin(self._time*2.5)
-        gs = pygame.Surface((pw+40, ph+40), pygame.SRCALPHA)
-        pygame.draw.rect(gs, (*zc, int(40*pulse)), gs.get_rect(), border_radius=20)
-        self.screen.blit(gs, (px-20, py-20))
-        ps = pygame.Surface((pw, ph), pygame.SRCALPHA)
-        pygame.draw.rect(ps, (10,14,28,248), ps.get_rect(), border_radius=16)
+        glow.set_alpha(int(40*pulse))
+        self.screen.blit(glow, (px-20, py-20))
         self.screen.blit(ps, (px, py))
         pygame.draw.rect(self.screen, zc, (px,py,pw,ph), width=2, border_radius=16)
 
         # Top bar
-        bar_bg = tuple(int(c*0.4) for c in zc)
-        bar_s = pygame.Surface((pw, top_bar_h), pygame.SRCALPHA)
-        pygame.draw.rect(bar_s, (*bar_bg, 220), bar_s.get_rect(), border_radius=14)
         self.screen.blit(bar_s, (px, py))
         pygame.draw.rect(self.screen, zc, (px,py,pw,top_bar_h), width=2, border_radius=14)
 
@@ -569,8 +555,6 @@ class QuestionOverlay:
         if bar_w > 0:
             pygame.draw.rect(self.screen, color, (px+24,bar_y,bar_w,6), border_radius=3)
 
-    def _estimate_text_h(self, text, max_w, size):
-        try:
-            f=assets.font(size); lh=f.get_linesize()+8; cw=max(1,f.size("W")[0])
-            return max(1,(len(text)//(max_w//cw)+text.count("\n")+1))*lh
-        except: return 40
\ No newline at end of file
+    def _estimate_text_h(self, text, max_w, size, bold=False):
+        """Chiều cao thật của đoạn văn — dùng lại layout đã cache (cùng lúc vẽ)."""
+        return assets.layout_text(text, max_w, size, bold).height
\ No newline at end of file
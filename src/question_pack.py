@@ -0,0 +1,179 @@
+"""
+question_pack.py - Định dạng gói câu hỏi nhị phân (.qpk) mở bằng mmap, giải mã từng câu khi cần
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import uuid
+import zlib
+import numpy as np
+from src.question_model import Question
+
+
+PACK_MAGIC   = b"RQPK"
+PACK_VERSION = 1
+PACK_EXT     = ".qpk"
+FLAG_ZLIB    = 1            # Mỗi bản ghi nén zlib riêng
+
+# magic, version, flags, số câu, offset bảng index
+_HEADER = struct.Struct("<4sHHIQ")
+# 1 dòng index / câu: vị trí + độ dài bản ghi, mã độ khó (pool), khoá id 16 byte
+INDEX_DTYPE = np.dtype([("off", "<u8"), ("len", "<u4"), ("diff", "u1"), ("key", "S16")])
+
+DIFFICULTIES = ("easy", "medium", "hard")
+_DIFF_CODE   = {d: i for i, d in enumerate(DIFFICULTIES)}
+_MEDIUM      = _DIFF_CODE["medium"]
+
+
+class PackError(Exception):
+    """File .qpk hỏng / sai phiên bản."""
+    pass
+
+
+def id_key(qid) -> bytes:
+    """Khoá 16 byte cố định của id câu hỏi (dùng để khử trùng / đánh dấu đã dùng)."""
+    return hashlib.md5(str(qid).encode("utf-8")).digest()
+
+
+def diff_code(difficulty) -> int:
+    """Mã pool theo độ khó — không rõ độ khó thì vào pool medium như QuestionManager."""
+    return _DIFF_CODE.get(difficulty, _MEDIUM)
+
+
+def pack_path_for(json_path: str) -> str:
+    return os.path.splitext(json_path)[0] + PACK_EXT
+
+
+def write_pack(questions: list, path: str, compress: bool = False):
+    """
+    Ghi danh sách câu hỏi (dict / Question) ra .qpk:
+        header | bản ghi JSON UTF-8 (nén tuỳ chọn) | index (INDEX_DTYPE × số câu)
+    Ghi file tạm rồi os.replace.
+    """
+    n     = len(questions)
+    flags = FLAG_ZLIB if compress else 0
+    lens, diffs, keys = [], [], []
+    tmp   = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(PACK_MAGIC, PACK_VERSION, flags, n, 0))
+        for q in questions:
+            d = q.to_dict() if isinstance(q, Question) else q
+            if not d.get("id"):
+                # Cấp id ngay khi đóng gói — khoá trong index phải khớp câu giải mã ra
+                d = dict(d, id=str(uuid.uuid4()))
+            rec = json.dumps(d, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            if compress:
+                rec = zlib.compress(rec)
+            f.write(rec)
+            lens.append(len(rec))
+            diffs.append(diff_code(d.get("difficulty", "medium")))
+            keys.append(id_key(d["id"]))
+        index = np.zeros(n, INDEX_DTYPE)
+        index["len"]  = lens
+        index["diff"] = diffs
+        index["key"]  = keys
+        index["off"]  = np.cumsum(index["len"], dtype=np.uint64) - index["len"] + _HEADER.size
+        f.write(index.tobytes())
+        f.seek(0)
+        f.write(_HEADER.pack(PACK_MAGIC, PACK_VERSION, flags, n, _HEADER.size + sum(lens)))
+    os.replace(tmp, path)
+
+
+class QuestionPack:
+    """
+    Gói .qpk đã mở: keys / diffs là view numpy thẳng trên mmap (không copy,
+    không giải mã); get(i) mới đọc + parse bản ghi thứ i và nhớ lại kết quả.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:               # File rỗng
+            self._file.close()
+            raise PackError(f"{path}: {e}")
+        try:
+            magic, version, self._flags, n, index_off = _HEADER.unpack_from(self._mm, 0)
+            if magic != PACK_MAGIC or version != PACK_VERSION:
+                raise PackError(f"{path}: không phải gói câu hỏi v{PACK_VERSION}")
+            if index_off + n * INDEX_DTYPE.itemsize > len(self._mm):
+                raise PackError(f"{path}: file bị cắt cụt")
+            self._index = np.frombuffer(self._mm, INDEX_DTYPE, n, index_off)
+        except (PackError, struct.error) as e:
+            self._mm.close()
+            self._file.close()
+            raise PackError(str(e))
+        self._cache: dict[int, Question] = {}
+
+    def __len__(self):
+        return len(self._index)
+
+    @property
+    def keys(self) -> np.ndarray:
+        return self._index["key"]
+
+    @property
+    def diffs(self) -> np.ndarray:
+        return self._index["diff"]
+
+    def get(self, i: int) -> Question:
+        q = self._cache.get(i)
+        if q is None:
+            row = self._index[i]
+            off, ln = int(row["off"]), int(row["len"])
+            raw = self._mm[off:off + ln]
+            if self._flags & FLAG_ZLIB:
+                raw = zlib.decompress(raw)
+            q = self._cache[i] = Question.from_dict(json.loads(raw))
+        return q
+
+    def close(self):
+        # Bỏ view numpy trước, mmap không đóng được khi còn buffer trỏ vào
+        self._index = np.zeros(0, INDEX_DTYPE)
+        self._cache.clear()
+        self._mm.close()
+        self._file.close()
+
+
+class QuestionList:
+    """Cùng giao diện với QuestionPack cho câu hỏi đã nằm sẵn trong bộ nhớ."""
+
+    def __init__(self, questions: list):
+        self._questions = [Question.from_dict(q) for q in questions]
+        self.keys  = np.array([id_key(q.id) for q in self._questions], "S16")
+        self.diffs = np.array([diff_code(q.difficulty) for q in self._questions], np.uint8)
+
+    def __len__(self):
+        return len(self._questions)
+
+    def get(self, i: int) -> Question:
+        return self._questions[i]
+
+    def close(self):
+        pass
+
+
+def open_bank(json_path: str):
+    """
+    Mở 1 bộ đề: dùng .qpk cạnh file .json nếu còn mới (mtime ≥ json),
+    không thì đọc JSON rồi ghi lại .qpk cho lần sau. Trả về QuestionPack / QuestionList.
+    """
+    pack = pack_path_for(json_path)
+    try:
+        if os.stat(pack).st_mtime_ns >= os.stat(json_path).st_mtime_ns:
+            return QuestionPack(pack)
+    except (OSError, PackError):
+        pass
+
+    with open(json_path, encoding="utf-8") as f:
+        questions = json.load(f).get("questions", [])
+    try:
+        write_pack(questions, pack)
+        return QuestionPack(pack)
+    except (OSError, PackError) as e:
+        print(f"[QuestionPack] Không ghi được {pack}: {e}")
+        return QuestionList(questions)
@@ -30,6 +30,8 @@ D. Nhận định D
 import re
 import json
 import uuid
+import zipfile
+import xml.etree.ElementTree as ET
 from typing import Optional
 from src.constants import Q_MULTIPLE_CHOICE, Q_SHORT_ANSWER, Q_FACT_ANALYSIS
 
@@ -39,13 +41,61 @@ class ParseError(Exception):
     pass
 
 
+class _StreamError(Exception):
+    """Đường đọc nhanh không đọc được file → quay về python-docx."""
+    pass
+
+
+# Namespace cho id câu hỏi: uuid5(nội dung block) → cùng nội dung = cùng id
+QUESTION_ID_NS = uuid.UUID("6f1c2a7e-3b0d-5e8a-9c41-2d7f0b6e8a13")
+
+
+def block_id(block: list) -> str:
+    """Id ổn định của 1 block câu hỏi (bỏ qua dòng trống)."""
+    return str(uuid.uuid5(QUESTION_ID_NS, "\n".join(l for l in block if l)))
+
+
+# ─── Đọc nhanh word/document.xml ────────────────────────────────
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_P, _W_R, _W_HYPERLINK = _W + "p", _W + "r", _W + "hyperlink"
+_W_T, _W_BR, _W_TYPE     = _W + "t", _W + "br", _W + "type"
+# Phần tử con của w:r → text, giống run.text của python-docx
+_RUN_CHARS = {_W + "tab": "\t", _W + "ptab": "\t", _W + "cr": "\n", _W + "noBreakHyphen": "-"}
+
+
+def _run_text(r) -> str:
+    parts = []
+    for e in r:
+        tag = e.tag
+        if tag == _W_T:
+            parts.append(e.text or "")
+        elif tag == _W_BR:
+            if e.get(_W_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            c = _RUN_CHARS.get(tag)
+            if c: parts.append(c)
+    return "".join(parts)
+
+
+def _paragraph_text(p) -> str:
+    """Text của 1 w:p như paragraph.text: các w:r và w:r trong w:hyperlink trực tiếp."""
+    parts = []
+    for child in p:
+        if child.tag == _W_R:
+            parts.append(_run_text(child))
+        elif child.tag == _W_HYPERLINK:
+            parts.extend(_run_text(r) for r in child if r.tag == _W_R)
+    return "".join(parts)
+
+
 class QuestionParser:
     """
     Parse file .docx thành danh sách câu hỏi chuẩn hóa.
     
     Mỗi câu hỏi sau khi parse có dạng:
     {
-        "id": str,           # UUID duy nhất
+        "id": str,           # UUID5 theo nội dung block (import lại → giữ nguyên id)
         "type": str,         # Q_MULTIPLE_CHOICE | Q_SHORT_ANSWER | Q_FACT_ANALYSIS
         "difficulty": str,   # "easy" | "medium" | "hard"
         "question": str,     # Nội dung câu hỏi
@@ -71,6 +121,57 @@ class QuestionParser:
         Parse file .docx, trả về list câu hỏi.
         Raise ParseError nếu file không hợp lệ.
         """
+        try:
+            # Đọc dòng nào parse dòng đó, không dựng cả Document
+            return self._parse_lines(self.iter_docx_lines(filepath), filepath)
+        except _StreamError:
+            return self._parse_lines(self._read_docx_lines_full(filepath), filepath)
+
+    def iter_docx_lines(self, filepath: str):
+        """
+        Generator: stream word/document.xml trong file zip bằng iterparse,
+        yield text (đã strip) của từng đoạn văn cấp body — cùng kết quả với
+        doc.paragraphs của python-docx (không gồm bảng, text box).
+        Đoạn đã đọc bị xoá khỏi cây nên bộ nhớ không tăng theo độ dài file.
+        Raise _StreamError nếu không phải zip / thiếu document.xml / XML lỗi.
+        """
+        try:
+            zf = zipfile.ZipFile(filepath)
+        except (OSError, zipfile.BadZipFile) as e:
+            raise _StreamError(e)
+        with zf:
+            try:
+                f = zf.open("word/document.xml")
+            except KeyError as e:
+                raise _StreamError(e)
+            with f:
+                depth = 0
+                body  = None
+                try:
+                    for event, elem in ET.iterparse(f, events=("start", "end")):
+                        if event == "start":
+                            depth += 1
+                            if depth == 2:
+                                body = elem          # w:body
+                            continue
+                        depth -= 1
+                        if depth == 2:
+                            # Phần tử con trực tiếp của body đã đọc xong
+                            if elem.tag == _W_P:
+                                yield _paragraph_text(elem).strip()
+                            body.remove(elem)
+                except ET.ParseError as e:
+                    raise _StreamError(e)
+
+    def read_docx_lines(self, filepath: str) -> list:
+        """Đọc toàn bộ đoạn văn của file .docx thành list dòng (đã strip)."""
+        try:
+            return list(self.iter_docx_lines(filepath))
+        except _StreamError:
+            return self._read_docx_lines_full(filepath)
+
+    def _read_docx_lines_full(self, filepath: str) -> list:
+        """Đường đọc qua python-docx (dự phòng cho file lạ)."""
         try:
             from docx import Document
         except ImportError:
@@ -86,48 +187,76 @@ class QuestionParser:
         for para in doc.paragraphs:
             text = para.text.strip()
             lines.append(text)
+        return lines
 
-        return self._parse_lines(lines, filepath)
+    def split_blocks(self, lines) -> list:
+        """Tách lines thành các block, mỗi block bắt đầu bằng 1 dòng header."""
+        return list(self.iter_blocks(lines))
 
-    def _parse_lines(self, lines: list, source: str = "") -> list:
-        """Chia lines thành các block câu hỏi rồi parse từng block."""
-        # Tách blocks bằng header pattern
-        blocks = []
+    def iter_blocks(self, lines):
+        """Như split_blocks nhưng yield từng block ngay khi gặp header kế tiếp."""
         current_block = []
 
         for line in lines:
             if self.HEADER_PATTERN.match(line):
                 if current_block:
-                    blocks.append(current_block)
+                    yield current_block
                 current_block = [line]
             elif current_block:
                 current_block.append(line)
 
         if current_block:
-            blocks.append(current_block)
+            yield current_block
 
-        if not blocks:
+    def iter_parse(self, blocks, cache=None):
+        """
+        Parse lần lượt từng block: yield (index, id block, question | None, lỗi | None).
+        cache (ImportCache): block đã gặp thì lấy lại kết quả cũ, block mới được ghi vào.
+        """
+        for i, block in enumerate(blocks):
+            bid   = block_id(block)
+            entry = cache.block(bid) if cache is not None else None
+            if entry is None:
+                try:
+                    entry = {"q": self._parse_block(block, bid)}
+                except ParseError as e:
+                    entry = {"err": str(e)}
+                if cache is not None:
+                    cache.put_block(bid, entry)
+            if "q" in entry:
+                yield i, bid, entry["q"], None
+            else:
+                yield i, bid, None, f"Block {i+1}: {entry['err']}"
+
+    def _parse_lines(self, lines, source: str = "") -> list:
+        """Chia lines (list hoặc generator) thành các block câu hỏi, parse từng block khi tới."""
+        questions = []
+        errors = []
+        n_blocks = 0
+        for _, _, q, err in self.iter_parse(self.iter_blocks(lines)):
+            n_blocks += 1
+            if err is None:
+                questions.append(q)
+            else:
+                errors.append(err)
+        return self.check_result(n_blocks, questions, errors)
+
+    @staticmethod
+    def check_result(n_blocks: int, questions: list, errors: list) -> tuple:
+        """Raise ParseError nếu file không có block nào / mọi block đều lỗi."""
+        if not n_blocks:
             raise ParseError(
                 "Không tìm thấy câu hỏi nào. "
                 "Mỗi câu phải bắt đầu bằng [MC]/[SA]/[FA] theo đúng định dạng."
             )
 
-        questions = []
-        errors = []
-        for i, block in enumerate(blocks):
-            try:
-                q = self._parse_block(block)
-                questions.append(q)
-            except ParseError as e:
-                errors.append(f"Block {i+1}: {e}")
-
         if errors and not questions:
             raise ParseError("Tất cả câu hỏi đều lỗi:\n" + "\n".join(errors))
 
         return questions, errors
 
-    def _parse_block(self, lines: list) -> dict:
-        """Parse một block câu hỏi."""
+    def _parse_block(self, lines: list, qid: str | None = None) -> dict:
+        """Parse một block câu hỏi (qid: id đã tính sẵn, mặc định block_id(lines))."""
         # Dòng đầu tiên là header
         header = lines[0]
         m = self.HEADER_PATTERN.match(header)
@@ -146,15 +275,16 @@ class QuestionParser:
 
         # Lấy nội dung còn lại
         content_lines = [l for l in lines[1:] if l.strip()]
+        qid = qid or block_id(lines)
 
         if q_type == Q_MULTIPLE_CHOICE:
-            return self._parse_mc(content_lines, difficulty)
+            return self._parse_mc(content_lines, difficulty, qid)
         elif q_type == Q_SHORT_ANSWER:
-            return self._parse_sa(content_lines, difficulty)
+            return self._parse_sa(content_lines, difficulty, qid)
         elif q_type == Q_FACT_ANALYSIS:
-            return self._parse_fa(content_lines, difficulty)
+            return self._parse_fa(content_lines, difficulty, qid)
 
-    def _parse_mc(self, lines: list, difficulty: str) -> dict:
+    def _parse_mc(self, lines: list, difficulty: str, qid: str) -> dict:
         """Parse trắc nghiệm 4 lựa chọn."""
         question_text = ""
         choices = {}
@@ -180,7 +310,7 @@ class QuestionParser:
             raise ParseError(f"Đáp án '{answer}' không hợp lệ (phải là A/B/C/D)")
 
         return {
-            "id": str(uuid.uuid4()),
+            "id": qid,
             "type": Q_MULTIPLE_CHOICE,
             "difficulty": difficulty,
             "question": question_text,
@@ -190,7 +320,7 @@ class QuestionParser:
             "used": False,
         }
 
-    def _parse_sa(self, lines: list, difficulty: str) -> dict:
+    def _parse_sa(self, lines: list, difficulty: str, qid: str) -> dict:
         """Parse câu trả lời ngắn."""
         question_text = ""
         answer = ""
@@ -209,7 +339,7 @@ class QuestionParser:
             raise ParseError("Thiếu đáp án")
 
         return {
-            "id": str(uuid.uuid4()),
+            "id": qid,
             "type": Q_SHORT_ANSWER,
             "difficulty": difficulty,
             "question": question_text,
@@ -219,7 +349,7 @@ class QuestionParser:
             "used": False,
         }
 
-    def _parse_fa(self, lines: list, difficulty: str) -> dict:
+    def _parse_fa(self, lines: list, difficulty: str, qid: str) -> dict:
         """Parse phân tích dữ kiện (đúng/sai cho 4 nhận định)."""
         passage = ""
         choices = {}
@@ -268,7 +398,7 @@ class QuestionParser:
             )
 
         return {
-            "id": str(uuid.uuid4()),
+            "id": qid,
             "type": Q_FACT_ANALYSIS,
             "difficulty": difficulty,
             "question": "Xác định đúng/sai cho các nhận định dưới đây:",
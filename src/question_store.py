@@ -0,0 +1,313 @@
+"""
+question_store.py - Kho câu hỏi SQLite (bản sao của data/) có chỉ mục toàn văn để tìm kiếm / lọc
+"""
+
+import json
+import os
+import re
+import sqlite3
+import uuid
+import numpy as np
+from src.constants import DATA_DIR, QUESTION_STORE_FILE, Q_MULTIPLE_CHOICE
+from src.question_model import Question
+from src.question_pack import id_key, diff_code
+
+
+STORE_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id      INTEGER PRIMARY KEY,
+    path    TEXT UNIQUE NOT NULL,
+    cls     TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    name    TEXT NOT NULL,
+    size    INTEGER NOT NULL,
+    mtime   INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS questions (
+    id         INTEGER PRIMARY KEY,
+    file_id    INTEGER NOT NULL,
+    qid        TEXT NOT NULL,
+    type       TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    question   TEXT NOT NULL,
+    passage    TEXT NOT NULL,
+    choices    TEXT NOT NULL,
+    data       TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS questions_file ON questions(file_id);
+CREATE INDEX IF NOT EXISTS questions_kind ON questions(type, difficulty);
+"""
+
+# Bảng FTS5 "external content" trỏ vào questions. Không dùng trigger (chậm khi
+# nạp hàng loạt): _index_file / _unindex_file cập nhật theo từng file bằng 1 câu lệnh.
+# remove_diacritics: gõ "quang hop" vẫn khớp "quang hợp"
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS questions_fts USING fts5(
+    question, passage, choices,
+    content='questions', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+"""
+
+_WORD = re.compile(r"\w+")
+
+
+def _fts_query(text: str) -> str:
+    """Chuỗi người dùng gõ → truy vấn FTS5: mọi từ đều phải có (khớp tiền tố, gõ tới đâu tìm tới đó)."""
+    words = _WORD.findall(text)
+    return " ".join(f'"{w}"*' for w in words)
+
+
+class StoreQuery:
+    """
+    Kết quả truy vấn dùng làm nguồn câu hỏi cho QuestionManager (cùng giao diện
+    QuestionPack): keys / diffs có sẵn, get(i) mới đọc JSON câu thứ i từ SQLite.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, rows: list):
+        self._conn  = conn
+        self._rowid = [r[0] for r in rows]
+        self.keys   = np.array([id_key(r[1]) for r in rows], "S16")
+        self.diffs  = np.array([diff_code(r[2]) for r in rows], np.uint8)
+        self._cache: dict[int, Question] = {}
+
+    def __len__(self):
+        return len(self._rowid)
+
+    def get(self, i: int) -> Question:
+        q = self._cache.get(i)
+        if q is None:
+            (data,) = self._conn.execute(
+                "SELECT data FROM questions WHERE id = ?", (self._rowid[i],)).fetchone()
+            q = self._cache[i] = Question.from_dict(json.loads(data))
+        return q
+
+    def close(self):
+        self._cache.clear()
+
+
+class QuestionStore:
+    """
+    Bản sao của DATA_DIR/<lớp>/<môn>/*.json trong 1 file SQLite (QUESTION_STORE_FILE).
+
+    - sync(): chỉ file có (size, mtime) khác bản đã lưu mới bị đọc lại; file đã xoá
+      bị bỏ khỏi kho. JSON vẫn là dữ liệu gốc — xoá file .db chỉ mất chỉ mục.
+    - search(): tìm theo nội dung (câu hỏi, đoạn văn, phương án) + lọc lớp / môn /
+      dạng / độ khó. Dùng FTS5 nếu SQLite có, không thì LIKE.
+    - query(): như search nhưng trả về nguồn câu hỏi cho QuestionManager.load_query.
+    """
+
+    RANK_MAX_MATCHES = 2000
+
+    def __init__(self, root: str = DATA_DIR, path: str = QUESTION_STORE_FILE):
+        self.root = root
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self.has_fts = False
+
+    # ─── Kết nối ──────────────────────────────────────────────
+
+    def _db(self) -> sqlite3.Connection:
+        """Kết nối của main thread (search / count / query)."""
+        if self._conn is None:
+            self._conn = self.connect()
+        return self._conn
+
+    def connect(self) -> sqlite3.Connection:
+        """Mở 1 kết nối mới (đã dựng schema) — mỗi thread dùng kết nối riêng, vd. StoreSyncJob."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        if conn.execute("PRAGMA user_version").fetchone()[0] != STORE_VERSION:
+            # Kho cũ / khác phiên bản → dựng lại từ data/
+            conn.executescript("""
+                DROP TABLE IF EXISTS questions_fts;
+                DROP TABLE IF EXISTS questions;
+                DROP TABLE IF EXISTS files;
+            """)
+        conn.executescript(_SCHEMA)
+        try:
+            conn.executescript(_FTS_SCHEMA)
+            self.has_fts = True
+        except sqlite3.OperationalError as e:
+            print(f"[QuestionStore] FTS5 không khả dụng, tìm bằng LIKE: {e}")
+        conn.execute(f"PRAGMA user_version = {STORE_VERSION}")
+        conn.commit()
+        return conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ─── Đồng bộ với data/ ────────────────────────────────────
+
+    def _walk(self):
+        """(path, lớp, môn, tên) của mọi file .json trong DATA_DIR/<lớp>/<môn>/."""
+        for cls in sorted(os.listdir(self.root)) if os.path.isdir(self.root) else []:
+            cls_path = os.path.join(self.root, cls)
+            if not os.path.isdir(cls_path):
+                continue
+            for subj in sorted(os.listdir(cls_path)):
+                subj_path = os.path.join(cls_path, subj)
+                if not os.path.isdir(subj_path):
+                    continue
+                for name in sorted(os.listdir(subj_path)):
+                    if name.endswith(".json"):
+                        yield os.path.join(subj_path, name), cls, subj, name[:-5]
+
+    def _describe(self, path: str) -> tuple:
+        """(path, lớp, môn, tên) của 1 file theo vị trí trong DATA_DIR."""
+        rel = os.path.relpath(path, self.root).split(os.sep)
+        cls, subj = (rel[0], rel[1]) if len(rel) >= 3 else ("", "")
+        return path, cls, subj, os.path.splitext(os.path.basename(path))[0]
+
+    def sync(self, paths: list | None = None, conn: sqlite3.Connection | None = None,
+             cancel=None, progress=None) -> int:
+        """
+        Cập nhật kho theo data/ (hoặc chỉ các file trong paths).
+        Trả về số file đã đọc lại.
+        conn: kết nối dùng (mặc định kết nối main thread); cancel: threading.Event —
+        dừng giữa các file, phần đã đọc vẫn được lưu; progress(đã xong, tổng) trước mỗi file.
+        """
+        conn = conn or self._db()
+        known = {p: (fid, size, mtime) for fid, p, size, mtime in
+                 conn.execute("SELECT id, path, size, mtime FROM files")}
+        if paths is None:
+            entries = list(self._walk())
+        else:
+            entries = [self._describe(os.path.abspath(p)) for p in paths]
+
+        changed, seen = 0, set()
+        with conn:
+            for i, (path, cls, subj, name) in enumerate(entries):
+                if cancel is not None and cancel.is_set():
+                    return changed      # Chưa duyệt hết → không biết file nào đã xoá
+                if progress is not None:
+                    progress(i, len(entries))
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                seen.add(path)
+                old = known.get(path)
+                if old and old[1] == st.st_size and old[2] == st.st_mtime_ns:
+                    continue
+                self._load_file(conn, old[0] if old else None, path, cls, subj, name, st)
+                changed += 1
+            stale = [v[0] for p, v in known.items()
+                     if p not in seen and (paths is None or not os.path.exists(p))]
+            for fid in stale:
+                self._clear_file(conn, fid)
+                conn.execute("DELETE FROM files WHERE id = ?", (fid,))
+        return changed
+
+    def _clear_file(self, conn, fid):
+        if self.has_fts:
+            conn.execute(
+                "INSERT INTO questions_fts(questions_fts, rowid, question, passage, choices)"
+                " SELECT 'delete', id, question, passage, choices FROM questions WHERE file_id = ?",
+                (fid,))
+        conn.execute("DELETE FROM questions WHERE file_id = ?", (fid,))
+
+    def _load_file(self, conn, fid, path, cls, subj, name, st):
+        try:
+            with open(path, encoding="utf-8") as f:
+                questions = json.load(f).get("questions", [])
+        except Exception as e:
+            print(f"[QuestionStore] Error loading {path}: {e}")
+            questions = []
+        if fid is None:
+            fid = conn.execute(
+                "INSERT INTO files (path, cls, subject, name, size, mtime) VALUES (?, ?, ?, ?, ?, ?)",
+                (path, cls, subj, name, st.st_size, st.st_mtime_ns)).lastrowid
+        else:
+            self._clear_file(conn, fid)
+            conn.execute("UPDATE files SET size = ?, mtime = ? WHERE id = ?",
+                         (st.st_size, st.st_mtime_ns, fid))
+        rows = []
+        for d in questions:
+            if not d.get("id"):
+                # Giống Question.from_dict, nhưng id phải cố định trong kho
+                d = dict(d, id=str(uuid.uuid4()))
+            choices = d.get("choices") or {}
+            rows.append((fid, str(d["id"]), d.get("type", Q_MULTIPLE_CHOICE),
+                         d.get("difficulty", "medium"), d.get("question", ""),
+                         d.get("passage") or "",
+                         " ".join(str(v) for v in choices.values()) if isinstance(choices, dict) else "",
+                         json.dumps(d, ensure_ascii=False)))
+        conn.executemany(
+            "INSERT INTO questions (file_id, qid, type, difficulty, question, passage, choices, data)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        if self.has_fts:
+            conn.execute(
+                "INSERT INTO questions_fts(rowid, question, passage, choices)"
+                " SELECT id, question, passage, choices FROM questions WHERE file_id = ?", (fid,))
+
+    # ─── Truy vấn ─────────────────────────────────────────────
+
+    def _where(self, text="", cls=None, subject=None, qtype=None, difficulty=None,
+               paths=None) -> tuple[str, list, str]:
+        """(điều kiện WHERE, tham số, truy vấn FTS5 — "" nếu không dùng FTS) cho bộ lọc."""
+        cond, args, match = [], [], ""
+        text = (text or "").strip()
+        if text:
+            match = _fts_query(text) if self.has_fts else ""
+            if match:
+                cond.append("q.id IN (SELECT rowid FROM questions_fts WHERE questions_fts MATCH ?)")
+                args.append(match)
+            else:
+                like = "%" + text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+                cond.append("(q.question LIKE ? ESCAPE '\\' OR q.passage LIKE ? ESCAPE '\\'"
+                            " OR q.choices LIKE ? ESCAPE '\\')")
+                args += [like] * 3
+        for col, val in (("f.cls", cls), ("f.subject", subject),
+                         ("q.type", qtype), ("q.difficulty", difficulty)):
+            if val:
+                cond.append(f"{col} = ?")
+                args.append(val)
+        if paths:
+            paths = [os.path.abspath(p) for p in paths]
+            cond.append(f"f.path IN ({', '.join('?' * len(paths))})")
+            args += paths
+        return ("WHERE " + " AND ".join(cond)) if cond else "", args, match
+
+    def search(self, text: str = "", limit: int = 200, **filters) -> tuple[list[dict], int]:
+        """
+        ([{"qid", "type", "difficulty", "question", "cls", "subject", "file"}], tổng số câu khớp)
+        filters: cls, subject, qtype, difficulty, paths. Có text + FTS5 → xếp theo độ liên quan
+        (chỉ khi số câu khớp ≤ RANK_MAX_MATCHES — xếp hạng chục nghìn câu quá chậm khi gõ).
+        """
+        conn = self._db()
+        where, args, match = self._where(text, **filters)
+        total = self.count(text, **filters)
+        cols = "q.qid, q.type, q.difficulty, q.question, f.cls, f.subject, f.name"
+        if match and total <= self.RANK_MAX_MATCHES:
+            sql = (f"SELECT {cols} FROM questions q JOIN files f ON f.id = q.file_id "
+                   f"JOIN (SELECT rowid, rank FROM questions_fts WHERE questions_fts MATCH ?) m "
+                   f"ON m.rowid = q.id {where} ORDER BY m.rank LIMIT ?")
+            args = [match] + args
+        else:
+            sql = (f"SELECT {cols} FROM questions q JOIN files f ON f.id = q.file_id "
+                   f"{where} ORDER BY q.id LIMIT ?")
+        keys = ("qid", "type", "difficulty", "question", "cls", "subject", "file")
+        return [dict(zip(keys, row)) for row in conn.execute(sql, args + [limit])], total
+
+    def count(self, text: str = "", **filters) -> int:
+        conn = self._db()
+        where, args, _ = self._where(text, **filters)
+        sql = f"SELECT COUNT(*) FROM questions q JOIN files f ON f.id = q.file_id {where}"
+        return conn.execute(sql, args).fetchone()[0]
+
+    def query(self, text: str = "", **filters) -> StoreQuery:
+        """Mọi câu khớp bộ lọc, dạng nguồn câu hỏi lazy cho QuestionManager."""
+        conn = self._db()
+        where, args, _ = self._where(text, **filters)
+        sql = (f"SELECT q.id, q.qid, q.difficulty FROM questions q "
+               f"JOIN files f ON f.id = q.file_id {where} ORDER BY q.id")
+        return StoreQuery(conn, conn.execute(sql, args).fetchall())
+
+
+# Singleton (dùng chung QuestionBankScene / QuestionManager)
+question_store = QuestionStore()
@@ -1,44 +1,229 @@
 """
 ranking.py - Hệ thống Bảng Xếp Hạng.
+
+Lưu trữ gồm 2 file trong saves/:
+    ranking.log   nhật ký chỉ ghi nối — mỗi kết quả 1 dòng JSON (có "seq" tăng dần)
+    ranking.json  snapshot đã sắp xếp, kèm "seq" của bản ghi cuối cùng đã gộp vào
+
+Ghi 1 kết quả = nối 1 dòng vào log (không đọc / ghi lại cả file). Khi log đủ dài,
+gộp log vào snapshot (ghi file tạm rồi os.replace). Mọi thao tác ghi chạy tuần tự
+trên thread nền của persistence — scene không chờ đĩa. Lúc đọc: snapshot
++ các dòng log có seq lớn hơn — tắt máy giữa chừng ở bước nào cũng không mất
+hay nhân đôi kết quả.
+
+Trong bộ nhớ: danh sách khoá (-score, seq) đã sắp xếp (bisect) + chỉ mục phụ theo
+người chơi / lớp / môn — tra hạng, điểm cao nhất, phân trang không cần quét cả bảng.
 """
 
+import bisect
 import json
 import os
+import threading
+import time
+import unicodedata
 from datetime import datetime
-from src.constants import RANKING_FILE
+from src.constants import RANKING_FILE, RANKING_LOG_FILE
+from src.persistence import persistence
+
+
+DATE_FORMAT = "%d/%m/%Y %H:%M"
+
+
+def player_key(name: str) -> str:
+    """Khoá so tên người chơi: NFC + casefold + gộp khoảng trắng ("  ĐỨC " == "đức")."""
+    return " ".join(unicodedata.normalize("NFC", str(name)).casefold().split())
+
+
+def entry_time(entry: dict) -> float:
+    """Thời điểm (epoch) của 1 kết quả; bản ghi cũ chưa có "ts" thì đọc từ "date"."""
+    ts = entry.get("ts")
+    if ts is None:
+        try:
+            ts = datetime.strptime(entry.get("date", ""), DATE_FORMAT).timestamp()
+        except ValueError:
+            ts = 0.0
+        entry["ts"] = ts
+    return ts
 
 
 class RankingSystem:
-    """Quản lý lưu và đọc bảng xếp hạng."""
+    """
+    Quản lý lưu và đọc bảng xếp hạng (giữ toàn bộ lịch sử).
+    Dùng chung 1 instance (singleton `ranking` cuối file): lịch sử chỉ đọc từ đĩa
+    1 lần mỗi lần chạy game, trên thread persistence (preload() lúc khởi động).
+    Tới khi `ready` các hàm đọc trả về rỗng; kết quả thêm trong lúc đó được giữ lại
+    rồi gộp vào khi đọc xong. ResultScene ghi kết quả chỉ chèn vào bộ nhớ + giao
+    1 dòng log cho thread nền.
+    """
 
-    MAX_ENTRIES = 100   # Giữ tối đa 100 kết quả
+    COMPACT_EVERY = 50   # Số dòng log trước khi gộp vào snapshot
 
     def __init__(self):
-        self._entries = []
-        self._load()
+        self._entries = []      # Điểm cao → thấp; cùng điểm: kết quả cũ trước
+        self._keys    = []      # (-score, seq) song song với _entries (cho bisect)
+        self._index   = {}      # ("player", key) / ("cls", c) / ("subject", s) / ("group", c, s) → khoá đã sắp xếp
+        self._by_seq  = {}      # seq → entry
+        self._scan_cache = None   # (bộ lọc, khoá khớp) của lần query phải quét gần nhất
+        self._pending = 0       # Số dòng log chưa gộp vào snapshot
+        self._seq     = 0       # seq của bản ghi mới nhất
+        self._loading = False
+        self._ready   = False
+        self._early   = []      # Kết quả thêm trước khi đọc xong lịch sử (chưa có seq)
+        self._lock    = threading.Lock()    # add_entry (main thread) / _load (thread persistence)
+        self.last_entry = None  # Kết quả add_entry gần nhất (ResultScene tra hạng khi ready)
+
+    # ─── Đọc ──────────────────────────────────────────────────
+
+    def preload(self):
+        """
+        Giao việc đọc lịch sử cho thread persistence nếu chưa giao (gọi lúc khởi động).
+        Không chờ — việc đọc xếp sau mọi lần ghi đã giao nên không cần flush().
+        """
+        if self._loading:
+            return
+        self._loading = True
+        persistence.call("ranking-load", self._load)
+
+    @property
+    def ready(self) -> bool:
+        """Đã đọc xong lịch sử (trước đó các hàm đọc trả về rỗng)."""
+        return self._ready
 
     def _load(self):
-        """Đọc file ranking."""
+        """Chạy trên thread persistence: đọc snapshot rồi phát lại các dòng log mới hơn."""
+        entries, seq = self._read_snapshot()
+        pending = 0
+        snapshot_seq = seq
+        for path in (RANKING_LOG_FILE + ".old", RANKING_LOG_FILE):
+            for entry in self._read_log(path):
+                s = entry.get("seq", 0)
+                if s > snapshot_seq:
+                    entries.append(entry)
+                    seq = max(seq, s)
+                    pending += 1
+        # Bản ghi cũ chưa có seq: cấp seq âm theo thứ tự trong file (giữ thứ tự cùng điểm)
+        for i, e in enumerate(entries):
+            if "seq" not in e:
+                e["seq"] = i - len(entries)
+        entries.sort(key=self._key)
+        keys = [self._key(e) for e in entries]
+        index = {}
+        for k, e in zip(keys, entries):
+            for name in self._index_names(e):
+                index.setdefault(name, []).append(k)     # Đã đúng thứ tự
+
+        with self._lock:
+            self._entries, self._keys, self._index = entries, keys, index
+            self._by_seq = {e["seq"]: e for e in entries}
+            self._seq, self._pending = seq, pending
+            # Kết quả thêm trong lúc đọc: cấp seq sau lịch sử rồi mới ghi log
+            for entry in self._early:
+                self._insert(entry)
+            self._early = []
+            self._ready = True
+        if self._pending >= self.COMPACT_EVERY:
+            self._compact_async()
+
+    # ─── Chỉ mục ──────────────────────────────────────────────
+
+    @staticmethod
+    def _key(entry: dict) -> tuple:
+        return (-entry["score"], entry.get("seq", 0))
+
+    @staticmethod
+    def _index_names(entry: dict) -> list:
+        names = [("player", player_key(entry.get("name", "")))]
+        cls, subject = entry.get("cls") or "", entry.get("subject") or ""
+        if cls:
+            names.append(("cls", cls))
+        if subject:
+            names.append(("subject", subject))
+            if cls:
+                names.append(("group", cls, subject))
+        return names
+
+    @staticmethod
+    def _read_log(path: str) -> list:
+        if not os.path.isfile(path):
+            return []
+        out = []
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue    # Dòng cuối bị cắt do tắt máy khi đang ghi
+                    if isinstance(entry, dict) and "score" in entry:
+                        out.append(entry)
+        except OSError as e:
+            print(f"[Ranking] Load error: {e}")
+        return out
+
+    # ─── Ghi ──────────────────────────────────────────────────
+
+    def _append(self, entry: dict):
+        """Giao 1 dòng log cho thread nền (fsync để kết quả không mất khi mất điện)."""
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+        persistence.append(RANKING_LOG_FILE, line, fsync=True)
+
+    def _compact_async(self):
+        self._pending = 0
+        persistence.call("ranking-compact", RankingSystem._compact)
+
+    @classmethod
+    def _compact(cls):
+        """
+        Gộp log vào snapshot: đổi tên log → .old (kết quả mới ghi vào log trống),
+        ghi snapshot = snapshot cũ + .old đọc lại từ đĩa, rồi mới xoá .old.
+        Đọc từ đĩa chứ không từ bộ nhớ — scene khác có thể đã ghi thêm kết quả.
+        Chạy trên thread persistence nên không xen với các lần nối log.
+        """
+        old_log = RANKING_LOG_FILE + ".old"
+        try:
+            if os.path.isfile(RANKING_LOG_FILE):
+                if os.path.isfile(old_log):
+                    # Lần gộp trước bị ngắt — nối log hiện tại vào .old
+                    with open(RANKING_LOG_FILE, encoding="utf-8") as src, \
+                            open(old_log, "a", encoding="utf-8") as dst:
+                        dst.write(src.read())
+                    os.remove(RANKING_LOG_FILE)
+                else:
+                    os.replace(RANKING_LOG_FILE, old_log)
+            entries, seq = cls._read_snapshot()
+            for entry in cls._read_log(old_log):
+                if entry.get("seq", 0) > seq:
+                    entries.append(entry)
+            entries.sort(key=lambda e: e["score"], reverse=True)
+            seq = max([seq] + [e.get("seq", 0) for e in entries])
+            cls._write_snapshot(entries, seq)
+            if os.path.isfile(old_log):
+                os.remove(old_log)
+        except Exception as e:
+            print(f"[Ranking] Compact error: {e}")
+
+    @staticmethod
+    def _read_snapshot() -> tuple[list, int]:
         if not os.path.isfile(RANKING_FILE):
-            self._entries = []
-            return
+            return [], 0
         try:
             with open(RANKING_FILE, encoding="utf-8") as f:
                 data = json.load(f)
-            self._entries = data.get("rankings", [])
+            return data.get("rankings", []), int(data.get("seq", 0))
         except Exception as e:
             print(f"[Ranking] Load error: {e}")
-            self._entries = []
+            return [], 0
 
-    def _save(self):
-        """Ghi file ranking."""
-        try:
-            os.makedirs(os.path.dirname(RANKING_FILE), exist_ok=True)
-            with open(RANKING_FILE, "w", encoding="utf-8") as f:
-                json.dump({"rankings": self._entries}, f,
-                          ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"[Ranking] Save error: {e}")
+    @staticmethod
+    def _write_snapshot(entries: list, seq: int):
+        os.makedirs(os.path.dirname(RANKING_FILE), exist_ok=True)
+        tmp = RANKING_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"seq": seq, "rankings": entries}, f,
+                      ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, RANKING_FILE)
 
     def add_entry(
         self,
@@ -47,49 +232,173 @@ class RankingSystem:
         correct: int,
         wrong: int,
         question_count: int = 0,
+        cls: str = "",
+        subject: str = "",
     ) -> int:
         """
-        Thêm kết quả mới.
-        Trả về rank (thứ hạng 1-based) sau khi thêm.
+        Thêm kết quả mới (cls / subject: lớp / môn của bộ đề, để lọc BXH).
+        Trả về rank (thứ hạng 1-based) sau khi thêm; 0 nếu lịch sử chưa đọc xong —
+        khi đó tra lại bằng rank_of(last_entry) sau khi `ready`.
         """
+        self.preload()
         entry = {
+            "seq": 0,               # Cấp trong _insert
             "name": player_name,
             "score": score,
             "correct": correct,
             "wrong": wrong,
             "total": question_count,
-            "date": datetime.now().strftime("%d/%m/%Y %H:%M"),
+            "cls": cls,
+            "subject": subject,
+            "date": datetime.now().strftime(DATE_FORMAT),
+            "ts": int(time.time()),
         }
-        self._entries.append(entry)
-        # Sắp xếp: điểm cao nhất trước
-        self._entries.sort(key=lambda e: e["score"], reverse=True)
-        # Giữ top MAX_ENTRIES
-        self._entries = self._entries[:self.MAX_ENTRIES]
-        self._save()
-
-        # Tìm rank
-        for i, e in enumerate(self._entries):
-            if (e["name"] == player_name and
-                    e["score"] == score and
-                    e["date"] == entry["date"]):
-                return i + 1
-        return len(self._entries)
+        self.last_entry = entry
+        with self._lock:
+            if not self._ready:
+                self._early.append(entry)
+                return 0
+            return self._insert(entry)
+
+    def _insert(self, entry: dict) -> int:
+        """Cấp seq, giao dòng log, chèn vào bảng + chỉ mục. Gọi khi giữ _lock."""
+        self._seq += 1
+        seq = entry["seq"] = self._seq
+        self._append(entry)
+
+        # seq tăng dần → cùng điểm thì đứng sau các kết quả cũ
+        key = self._key(entry)
+        i = bisect.bisect_left(self._keys, key)
+        self._keys.insert(i, key)
+        self._entries.insert(i, entry)
+        self._by_seq[seq] = entry
+        for name in self._index_names(entry):
+            bisect.insort(self._index.setdefault(name, []), key)
+
+        self._pending += 1
+        if self._pending >= self.COMPACT_EVERY:
+            self._compact_async()
+        return i + 1
 
     def get_top(self, n: int = 20) -> list:
         """Lấy top N kết quả."""
+        if not self._ready:
+            return []
         return self._entries[:n]
 
     def get_all(self) -> list:
+        if not self._ready:
+            return []
         return self._entries.copy()
 
     def get_player_best(self, player_name: str) -> dict | None:
-        """Lấy điểm cao nhất của người chơi."""
-        for entry in self._entries:
-            if entry["name"].lower() == player_name.lower():
-                return entry
-        return None
+        """Lấy điểm cao nhất của người chơi (không phân biệt hoa thường / dạng dấu)."""
+        if not self._ready:
+            return None
+        keys = self._index.get(("player", player_key(player_name)))
+        return self._by_seq[keys[0][1]] if keys else None
+
+    def rank_of(self, entry: dict) -> int:
+        """Thứ hạng 1-based của 1 kết quả trong toàn bảng (0 nếu không có / chưa ready)."""
+        if not self._ready:
+            return 0
+        key = self._key(entry)
+        i = bisect.bisect_left(self._keys, key)
+        return i + 1 if i < len(self._keys) and self._keys[i] == key else 0
+
+    def count(self) -> int:
+        if not self._ready:
+            return 0
+        return len(self._entries)
+
+    def classes(self) -> list[str]:
+        if not self._ready:
+            return []
+        return sorted(name[1] for name in self._index if name[0] == "cls")
+
+    def subjects(self, cls: str | None = None) -> list[str]:
+        if not self._ready:
+            return []
+        if cls:
+            return sorted(name[2] for name in self._index if name[0] == "group" and name[1] == cls)
+        return sorted(name[1] for name in self._index if name[0] == "subject")
+
+    def query(
+        self,
+        offset: int = 0,
+        limit: int = 20,
+        player: str | None = None,
+        cls: str | None = None,
+        subject: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+    ) -> tuple[list, int]:
+        """
+        1 trang kết quả đã lọc, sắp theo điểm: ([(rank, entry), ...], tổng số khớp).
+        rank là thứ hạng trong toàn bảng. Lọc người chơi / lớp / môn dùng chỉ mục;
+        khoảng thời gian [since, until) (epoch) quét trong tập đã thu hẹp.
+        """
+        if not self._ready:
+            return [], 0
+        # Thu hẹp bằng chỉ mục cụ thể nhất, phần lọc còn lại kiểm tra từng kết quả
+        checks = []
+        if player is not None:
+            keys = self._index.get(("player", player_key(player)), [])
+            if cls:
+                checks.append(lambda e: e.get("cls") == cls)
+            if subject:
+                checks.append(lambda e: e.get("subject") == subject)
+        elif cls and subject:
+            keys = self._index.get(("group", cls, subject), [])
+        elif cls:
+            keys = self._index.get(("cls", cls), [])
+        elif subject:
+            keys = self._index.get(("subject", subject), [])
+        else:
+            keys = self._keys
+        if since is not None:
+            checks.append(lambda e: entry_time(e) >= since)
+        if until is not None:
+            checks.append(lambda e: entry_time(e) < until)
+
+        if checks:
+            # Cuộn qua cùng bộ lọc → dùng lại kết quả quét lần trước
+            sig = (player, cls, subject, since, until, len(self._keys))
+            if self._scan_cache and self._scan_cache[0] == sig:
+                keys = self._scan_cache[1]
+            else:
+                keys = [k for k in keys if all(c(self._by_seq[k[1]]) for c in checks)]
+                self._scan_cache = (sig, keys)
+        if keys is self._keys:
+            page = [(offset + i + 1, e) for i, e in enumerate(self._entries[offset:offset + limit])]
+        else:
+            page = [(bisect.bisect_left(self._keys, k) + 1, self._by_seq[k[1]])
+                    for k in keys[offset:offset + limit]]
+        return page, len(keys)
 
     def clear(self):
-        """Xóa toàn bộ ranking."""
+        """Xóa toàn bộ ranking (bỏ qua nếu lịch sử chưa đọc xong)."""
+        if not self._ready:
+            return
         self._entries = []
-        self._save()
+        self._keys = []
+        self._index = {}
+        self._by_seq = {}
+        self._scan_cache = None
+        self._pending = 0
+        persistence.call("ranking-clear", lambda seq=self._seq: self._clear_files(seq))
+
+    @classmethod
+    def _clear_files(cls, seq: int):
+        # Snapshot rỗng giữ seq hiện tại — dòng log cũ còn sót lại cũng bị bỏ qua
+        try:
+            cls._write_snapshot([], seq)
+            for path in (RANKING_LOG_FILE, RANKING_LOG_FILE + ".old"):
+                if os.path.isfile(path):
+                    os.remove(path)
+        except Exception as e:
+            print(f"[Ranking] Save error: {e}")
+
+
+# Singleton (dùng chung ResultScene / RankingScene)
+ranking = RankingSystem()
@@ -0,0 +1,24 @@
+"""
+render_utils.py - Tiện ích dựng hình dùng chung (surface format, layer bake)
+"""
+
+import pygame
+
+
+def display_format(surf: pygame.Surface, alpha: bool = False, rle: bool = False) -> pygame.Surface:
+    """
+    Chuyển surface sang pixel format của màn hình để blit nhanh hơn.
+    Nếu chưa có display (vd: lúc test headless chưa set_mode) thì giữ nguyên.
+    rle=True (kèm alpha): bật RLEACCEL cho sprite tĩnh nhiều vùng trong suốt (glow, lớp
+    robot bake sẵn) — blit bỏ qua các đoạn alpha 0, nhanh hơn vài lần và SDL nhả bộ đệm
+    pixel gốc. Không vẽ / set_alpha lên sprite RLE sau đó (mỗi lần sẽ phải giải mã lại).
+    """
+    if pygame.display.get_surface() is None:
+        return surf
+    try:
+        surf = surf.convert_alpha() if alpha else surf.convert()
+    except pygame.error:
+        return surf
+    if rle:
+        surf.set_alpha(255, pygame.RLEACCEL)
+    return surf
@@ -5,6 +5,9 @@ base_scene.py - Lớp cơ sở cho tất cả Scene
 
 class BaseScene:
 
+    # True nếu draw() tự phủ kín màn hình → GameManager bỏ qua bước fill nền
+    opaque = False
+
     def __init__(self, screen, manager):
         self.screen = screen
         self.manager = manager  # GameManager để gọi go_to()
@@ -17,3 +20,7 @@ class BaseScene:
     def draw(self):
         """Vẽ màn hình. Override trong subclass."""
         pass
+
+    def on_exit(self):
+        """Gọi 1 lần khi rời scene (trước khi tạo scene mới) — giải phóng file / tài nguyên."""
+        pass
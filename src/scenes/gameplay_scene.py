@@ -13,7 +13,14 @@ from src.ui_components import HealthBar, draw_crosshair
 from src.robot_renderer import RobotRenderer
 from src.question_overlay import QuestionOverlay
 from src.question_manager import QuestionManager
+from src.progress_store import progress_store
 from src.powerup_system import PowerupSystem
+from src.environment import EnvironmentRenderer
+from src.post_fx import post_fx
+from src.render_utils import display_format
+from src.particles import ParticlePool
+from src.particle_sprites import particle_sprites, quantize_alpha
+from src.profiler import profiler
 
 
 # ─── Màu FPS Environment ─────────────────────────────────────
@@ -22,11 +29,12 @@ ENV_FLOOR     = (14,  18,  32)
 ENV_GRID_LINE = (22,  30,  55)
 ENV_NEON_LINE = (0,   80,  160)
 ENV_HORIZON   = (18,  28,  55)
-ENV_FOG       = (10,  14,  28)
 
 
 class GameplayScene(BaseScene):
 
+    opaque = True   # Back buffer phủ kín màn hình
+
     # Thứ tự robot (0-9), sau đó lặp lại từ đầu
     ROBOT_ORDER  = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
     # HP bonus từng robot (index 0-9)
@@ -38,10 +46,15 @@ class GameplayScene(BaseScene):
         super().__init__(screen, manager)
 
         self._q_manager = QuestionManager()
-        n = self._q_manager.load_files(self.state.selected_question_files)
+        if self.state.question_query:
+            n = self._q_manager.load_query(**self.state.question_query)
+        else:
+            n = self._q_manager.load_files(self.state.selected_question_files)
         if n == 0:
             manager.go_to(SCENE_MENU)
             return
+        # Đọc nền tiến độ người chơi — ResultScene hiện mà không mở progress.db
+        progress_store.preload(self.state.player_name)
 
         # === Wave / Robot hệ thống ===
         self._wave_index    = 0          # Vị trí trong ROBOT_ORDER (tăng mãi)
@@ -79,7 +92,7 @@ class GameplayScene(BaseScene):
 
         # --- FX ---
         self._muzzle_t      = 0.0
-        self._muzzle_shells = []
+        self._muzzle_shells = ParticlePool(16, fields=("rot", "rot_spd"))
         self._crosshair_t   = 0.0
         self._aim_on_robot  = False
         self._vignette_t    = 0.0
@@ -114,6 +127,13 @@ class GameplayScene(BaseScene):
         # --- Env decorations ---
         self._wall_lights   = self._gen_wall_lights()
         self._floor_tiles   = self._gen_floor_tiles()
+        self._env           = EnvironmentRenderer()
+        self._env.build(self._current_map, self._wall_lights)
+
+        # Back buffer cố định (camera shake = lệch vị trí blit cuối)
+        self._buf = display_format(pygame.Surface((SCREEN_W, SCREEN_H)))
+        # Glow của súng vẽ sẵn ở alpha đầy — mỗi frame chỉ set_alpha + blit
+        self._gun_glows = self._build_gun_glows()
 
         pygame.mouse.set_visible(False)
 
@@ -138,6 +158,10 @@ class GameplayScene(BaseScene):
         robot_y          = SCREEN_H // 2 + 55
         self._robot      = RobotRenderer(robot_x, robot_y, scale=1.7,
                                           robot_index=robot_idx)
+        self._robot.prebake()   # Thường đã bake xong từ trận trước → không tốn gì
+        # Robot kế tiếp: bake dần mỗi frame trong update() (chỉ dùng atlas, không vẽ)
+        self._next_robot = RobotRenderer(robot_x, robot_y, scale=1.7,
+                                         robot_index=self._get_robot_idx(wave_index + 1))
         self._robot_hp   = self._get_robot_hp(wave_index)
         self._robot_max_hp = self._robot_hp
 
@@ -165,10 +189,14 @@ class GameplayScene(BaseScene):
             # Regenerate environment for new map
             self._wall_lights = self._gen_wall_lights()
             self._floor_tiles = self._gen_floor_tiles()
+            self._env.build(self._current_map, self._wall_lights)
 
     def _cleanup(self):
         pygame.mouse.set_visible(True)
 
+    def on_exit(self):
+        self._q_manager.close()     # Nhả mmap .qpk → import lại / xoá bộ đề được ngay
+
     # ─── Environment generators ───────────────────────────────
 
     def _gen_wall_lights(self):
@@ -200,6 +228,7 @@ class GameplayScene(BaseScene):
 
     def update(self, dt, events):
         self._time += dt
+        self._next_robot.bake_step()    # ≤ 1 lớp atlas / frame
 
         # ── Intro countdown (Time Attack mode) ─────────────────
         if self._intro_t > 0:
@@ -226,7 +255,8 @@ class GameplayScene(BaseScene):
             self._robot.update(dt)
             return
 
-        self._robot.update(dt)
+        with profiler.stage("upd.robot"):
+            self._robot.update(dt)
         self._hp_bar.update(dt)
 
         # Banner đếm ngược
@@ -256,14 +286,8 @@ class GameplayScene(BaseScene):
         self._shake_y *= 0.75
 
         # Muzzle shells
-        for sh in self._muzzle_shells[:]:
-            sh["life"] -= dt * 2
-            sh["x"]    += sh["vx"] * dt * 60
-            sh["y"]    += sh["vy"] * dt * 60
-            sh["vy"]   += 0.4
-            sh["rot"]  += sh["rot_spd"] * dt
-            if sh["life"] <= 0:
-                self._muzzle_shells.remove(sh)
+        self._muzzle_shells.integrate(dt, decay=2, gravity=0.4, spin="rot_spd")
+        self._muzzle_shells.compact()
 
         # Damage numbers
         for dn in self._dmg_numbers[:]:
@@ -274,13 +298,15 @@ class GameplayScene(BaseScene):
                 self._dmg_numbers.remove(dn)
 
         # Question overlay
-        result = self._overlay.update(dt, events)
+        with profiler.stage("upd.overlay"):
+            result = self._overlay.update(dt, events)
         if result is not None:
             self._process_answer(result)
 
         # Power-up update + collect
         if not self._overlay.is_visible:
-            collected = self._powerups.update(dt, events)
+            with profiler.stage("upd.powerups"):
+                collected = self._powerups.update(dt, events)
             for kind in collected:
                 if kind == "heal":
                     self._wrong_count = max(0, self._wrong_count - 1)
@@ -361,6 +387,8 @@ class GameplayScene(BaseScene):
             "zone": zone,
             "correct": is_correct,
         })
+        progress_store.record(self.state.player_name, q.id, is_correct,
+                              self._overlay.last_response_time)
 
         if is_correct:
             dmg  = {ZONE_HEAD_KEY: DAMAGE_HEAD, ZONE_BODY_KEY: DAMAGE_BODY, ZONE_LIMB_KEY: DAMAGE_LIMB}.get(zone, 40)
@@ -441,15 +469,15 @@ class GameplayScene(BaseScene):
         """Vỏ đạn bay ra phải."""
         gx = SCREEN_W - 200
         gy = SCREEN_H - 220
-        self._muzzle_shells.append({
-            "x": float(gx - 20),
-            "y": float(gy),
-            "vx": random.uniform(3, 6),
-            "vy": random.uniform(-5, -2),
-            "rot": 0.0,
-            "rot_spd": random.uniform(180, 540),
-            "life": 1.0,
-        })
+        self._muzzle_shells.spawn(1,
+            x=float(gx - 20),
+            y=float(gy),
+            vx=random.uniform(3, 6),
+            vy=random.uniform(-5, -2),
+            rot=0.0,
+            rot_spd=random.uniform(180, 540),
+            life=1.0,
+        )
 
     def _spawn_dmg_number(self, pts, zone, mult=1.0):
         zone_y = {ZONE_HEAD_KEY: self._robot.cy - 175,
@@ -477,68 +505,81 @@ class GameplayScene(BaseScene):
         sx = int(self._shake_x * self._shake_decay)
         sy = int(self._shake_y * self._shake_decay)
 
-        buf = pygame.Surface((SCREEN_W, SCREEN_H))
-        buf.fill(ENV_CEILING)
-
-        self._draw_environment(buf)
-        self._robot.draw(buf)
-        self._draw_muzzle_light(buf)
-        self._draw_damage_numbers(buf)
-        self._powerups.draw(buf, self._time)     # Power-up floating items
-        self._draw_combo_hud(buf)                 # Combo meter
-        self._draw_gun(buf)
-        self._draw_shells(buf)
-        self._draw_hud(buf)
-        self._powerups.draw_hud(buf)              # Active buff icons
-
-        self.screen.blit(buf, (sx, sy))
-
-        self._draw_vignette()
-        self._draw_scanlines()
-        self._draw_crosshair_custom()
+        # Back buffer dùng lại mỗi frame (lớp môi trường đục phủ kín → không cần fill)
+        buf = self._buf
+        with profiler.stage("environment"):
+            self._draw_environment(buf)
+        with profiler.stage("robot"):             # Gồm cả particles của robot
+            self._robot.draw(buf)
+        with profiler.stage("hud"):
+            self._draw_muzzle_light(buf)
+            self._draw_damage_numbers(buf)
+            self._powerups.draw(buf, self._time)     # Power-up floating items
+            self._draw_combo_hud(buf)                 # Combo meter
+        with profiler.stage("gun"):
+            self._draw_gun(buf)
+        with profiler.stage("particles"):
+            self._draw_shells(buf)
+        with profiler.stage("hud"):
+            self._draw_hud(buf)
+            self._powerups.draw_hud(buf)              # Active buff icons
+
+        with profiler.stage("present"):
+            self.screen.blit(buf, (sx, sy))
+            self._fill_shake_border(sx, sy)
+
+        with profiler.stage("vignette"):
+            self._draw_vignette()
+        with profiler.stage("scanlines"):
+            self._draw_scanlines()
+        with profiler.stage("hud"):
+            self._draw_crosshair_custom()
 
         # Death flash effect khi robot vừa chết
         if self._robot.is_dead and getattr(self._robot, "_death_flash", False):
-            flash = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-            flash.fill((255,255,255, 80))
-            self.screen.blit(flash, (0,0))
+            post_fx.fade(self.screen, 80, (255, 255, 255))
             self._robot._death_flash = False  # Consume once
 
         # Combo notifs (trên overlay)
         for n in self._combo_notifs:
             a = min(255, int(n["life"]/2.0 * 255))
             ns = assets.render_text(n["text"], "lg", n["color"], bold=True,
-                                    shadow=True, shadow_color=(0,0,0))
-            ns.set_alpha(a)
+                                    shadow=True, shadow_color=(0,0,0), alpha=a)
             self.screen.blit(ns, (SCREEN_W//2 - ns.get_width()//2, int(n["y"])))
 
-        # Overlay câu hỏi
-        self._overlay.draw()
+        with profiler.stage("overlay"):
+            # Overlay câu hỏi
+            self._overlay.draw()
 
-        # Transition fade giữa các robot
-        if self._transition_phase != "none":
-            self._draw_transition()
+            # Transition fade giữa các robot
+            if self._transition_phase != "none":
+                self._draw_transition()
 
-        # Map transition (đè lên robot transition, hiện tên map mới)
-        if self._map_transition_phase != "none":
-            self._draw_map_transition()
+            # Map transition (đè lên robot transition, hiện tên map mới)
+            if self._map_transition_phase != "none":
+                self._draw_map_transition()
 
-        # Robot name banner
-        if self._robot_banner_t > 0:
-            self._draw_robot_banner()
+            # Robot name banner
+            if self._robot_banner_t > 0:
+                self._draw_robot_banner()
 
-        # Intro countdown overlay (Time Attack mode)
-        if self._intro_t > 0:
-            self._draw_intro_countdown()
+            # Intro countdown overlay (Time Attack mode)
+            if self._intro_t > 0:
+                self._draw_intro_countdown()
 
-        if self._game_over:
-            self._draw_endscreen()
+            if self._game_over:
+                self._draw_endscreen()
+
+    def _fill_shake_border(self, sx, sy):
+        """Chỉ tô dải viền bị lộ ra khi back buffer lệch do rung màn hình."""
+        if sx > 0:   self.screen.fill(DARK_BG, (0, 0, sx, SCREEN_H))
+        elif sx < 0: self.screen.fill(DARK_BG, (SCREEN_W + sx, 0, -sx, SCREEN_H))
+        if sy > 0:   self.screen.fill(DARK_BG, (0, 0, SCREEN_W, sy))
+        elif sy < 0: self.screen.fill(DARK_BG, (0, SCREEN_H + sy, SCREEN_W, -sy))
 
     def _draw_intro_countdown(self):
         """Màn đếm ngược 3 giây cho Time Attack mode."""
-        overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        overlay.fill((0, 0, 10, 190))
-        self.screen.blit(overlay, (0, 0))
+        post_fx.fade(self.screen, 190, (0, 0, 10))
 
         t = self._intro_t
         cy = SCREEN_H // 2
@@ -597,22 +638,17 @@ class GameplayScene(BaseScene):
 
         a = int(progress * 255)
         if a <= 0: return
-        fade = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        fade.fill((0,0,0,a))
-        self.screen.blit(fade, (0,0))
+        post_fx.fade(self.screen, a)
 
         if progress > 0.5:
             text_a = int((progress-0.5)/0.5 * 255)
             mid = self._current_map
             mc = map_colors[mid]
-            round_s = assets.render_text(f"ROUND {self._round + 1}", "md", (180,180,200), bold=True)
-            round_s.set_alpha(text_a)
+            round_s = assets.render_text(f"ROUND {self._round + 1}", "md", (180,180,200), bold=True, alpha=text_a)
             self.screen.blit(round_s, (SCREEN_W//2-round_s.get_width()//2, SCREEN_H//2-80))
-            name_s = assets.render_text(map_names_display[mid], "xl", mc, bold=True)
-            name_s.set_alpha(text_a)
+            name_s = assets.render_text(map_names_display[mid], "xl", mc, bold=True, alpha=text_a)
             self.screen.blit(name_s, (SCREEN_W//2-name_s.get_width()//2, SCREEN_H//2-30))
-            sub_s = assets.render_text(map_subtitles[mid], "sm", (200,200,220))
-            sub_s.set_alpha(text_a)
+            sub_s = assets.render_text(map_subtitles[mid], "sm", (200,200,220), alpha=text_a)
             self.screen.blit(sub_s, (SCREEN_W//2-sub_s.get_width()//2, SCREEN_H//2+50))
 
     def _draw_combo_hud(self, surf):
@@ -652,9 +688,7 @@ class GameplayScene(BaseScene):
         if a <= 0:
             return
 
-        fade = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        fade.fill((0, 0, 0, a))
-        self.screen.blit(fade, (0, 0))
+        post_fx.fade(self.screen, a)
 
         # Khi gần đen hoàn toàn: hiện tên robot sắp xuất hiện
         if self._transition_phase == "out" and progress > 0.75:
@@ -665,19 +699,16 @@ class GameplayScene(BaseScene):
 
             # Dòng tiêu đề
             name_s = assets.render_text(f"ENEMY #{self._wave_index + 1}", "md",
-                                         pal["neon"], bold=True)
-            name_s.set_alpha(text_a)
+                                         pal["neon"], bold=True, alpha=text_a)
             self.screen.blit(name_s,
                 (SCREEN_W // 2 - name_s.get_width() // 2, SCREEN_H // 2 - 48))
 
-            title_s = assets.render_text(pal["name"], "xl", pal["neon"], bold=True)
-            title_s.set_alpha(text_a)
+            title_s = assets.render_text(pal["name"], "xl", pal["neon"], bold=True, alpha=text_a)
             self.screen.blit(title_s,
                 (SCREEN_W // 2 - title_s.get_width() // 2, SCREEN_H // 2 - 12))
 
             subtitle_s = assets.render_text(pal["title"], "sm",
-                                             (200, 210, 240), shadow=True)
-            subtitle_s.set_alpha(text_a)
+                                             (200, 210, 240), shadow=True, alpha=text_a)
             self.screen.blit(subtitle_s,
                 (SCREEN_W // 2 - subtitle_s.get_width() // 2, SCREEN_H // 2 + 44))
 
@@ -697,23 +728,20 @@ class GameplayScene(BaseScene):
 
         # Nền banner
         bh = 70
-        banner = pygame.Surface((SCREEN_W, bh), pygame.SRCALPHA)
-        banner.fill((0, 0, 0, int(160 * a_f)))
-        self.screen.blit(banner, (0, SCREEN_H // 2 - bh // 2 - 80))
+        post_fx.fade(self.screen, 160 * a_f, rect=(0, SCREEN_H // 2 - bh // 2 - 80, SCREEN_W, bh))
 
         y0 = SCREEN_H // 2 - bh // 2 - 80 + 8
 
         # "ENEMY #N" nhỏ
         lbl = assets.render_text(
             f"ENEMY #{wave_num}" + (f"  [ROUND {cycle+1}]" if cycle > 0 else ""),
-            "sm", (160, 170, 200))
-        lbl.set_alpha(int(200 * a_f))
+            "sm", (160, 170, 200), alpha=int(200 * a_f))
         self.screen.blit(lbl, (SCREEN_W // 2 - lbl.get_width() // 2, y0))
 
         # Tên robot to + màu neon
         name_s = assets.render_text(pal["name"], "lg", pal["neon"], bold=True,
-                                     shadow=True, shadow_color=(0, 0, 0))
-        name_s.set_alpha(int(255 * a_f))
+                                     shadow=True, shadow_color=(0, 0, 0),
+                                     alpha=int(255 * a_f))
         self.screen.blit(name_s,
             (SCREEN_W // 2 - name_s.get_width() // 2, y0 + 26))
 
@@ -729,201 +757,8 @@ class GameplayScene(BaseScene):
     # ─── Environment ──────────────────────────────────────────
 
     def _draw_environment(self, surf):
-        """Vẽ môi trường theo map hiện tại."""
-        m = self._current_map
-        if   m == 0: self._draw_env_lab(surf)
-        elif m == 1: self._draw_env_space(surf)
-        elif m == 2: self._draw_env_jungle(surf)
-        else:        self._draw_env_lab(surf)
-
-    # ─── MAP 0: LAB (Phòng thí nghiệm — xanh acid) ───────────
-
-    def _draw_env_lab(self, surf):
-        hz = SCREEN_H // 2
-        CEI = (8, 12, 22); HOR = (18, 28, 50); FLR = (10, 18, 32)
-        NEON = (0, 180, 80); GRID = (18, 35, 22)
-
-        for y in range(hz+1):
-            t = y/hz
-            pygame.draw.line(surf, (
-                int(CEI[0]+(HOR[0]-CEI[0])*t),
-                int(CEI[1]+(HOR[1]-CEI[1])*t),
-                int(CEI[2]+(HOR[2]-CEI[2])*t),
-            ), (0,y),(SCREEN_W,y))
-        for y in range(SCREEN_H-hz):
-            t = y/(SCREEN_H-hz)
-            pygame.draw.line(surf, (
-                int(HOR[0]+(FLR[0]-HOR[0])*t),
-                int(HOR[1]+(FLR[1]-HOR[1])*t),
-                int(HOR[2]+(FLR[2]-HOR[2])*t),
-            ), (0,hz+y),(SCREEN_W,hz+y))
-
-        # Lưới sàn xanh acid
-        vp_x = SCREEN_W//2
-        for i in range(1,15):
-            t = (i/14)**1.6; y = int(hz+(SCREEN_H-hz)*t)
-            c = NEON if i%3==0 else GRID
-            w = 2 if i%3==0 else 1
-            pygame.draw.line(surf, c, (0,y),(SCREEN_W,y),w)
-        for i in range(21):
-            angle = (i/20-0.5)*1.8
-            ex = vp_x+int(math.tan(angle)*(SCREEN_H-hz)*1.1)
-            c = NEON if i%4==0 else GRID
-            pygame.draw.line(surf, c, (vp_x,hz),(ex,SCREEN_H),2 if i%4==0 else 1)
-
-        # Ống nghiệm và thiết bị lab trên tường hai bên
-        for side_x in [0, SCREEN_W-70]:
-            pygame.draw.rect(surf, (12,18,30),(side_x,0,70,SCREEN_H))
-            ex = side_x+(69 if side_x>0 else 0)
-            pygame.draw.line(surf, NEON,(ex,0),(ex,SCREEN_H),2)
-            for i in range(4):
-                ty = 80+i*110
-                # Ống nghiệm
-                tw = 20; th = 55; tx = side_x+(25 if side_x==0 else 25)
-                pygame.draw.rect(surf,(15,25,40),(tx,ty,tw,th),border_radius=8)
-                # Chất lỏng màu
-                colors_tube = [(0,220,100),(100,255,180),(0,180,60),(180,255,80)]
-                liq_h = int(th*0.6); liq_c = colors_tube[i%4]
-                liq_pulse = 0.7+0.3*math.sin(self._time*2+i)
-                liq_c = tuple(min(255,int(c2*liq_pulse)) for c2 in liq_c)
-                pygame.draw.rect(surf,liq_c,(tx+2,ty+th-liq_h+2,tw-4,liq_h-4),border_radius=6)
-                pygame.draw.rect(surf,NEON,(tx,ty,tw,th),width=1,border_radius=8)
-                # Bubble animation
-                bub_y = ty+th-liq_h+int((self._time*30+i*20)%(liq_h))
-                pygame.draw.circle(surf,(200,255,220),(tx+tw//2,bub_y),2)
-        self._draw_wall_lights_env(surf, hz)
-        self._draw_fog(surf, hz)
-
-    # ─── MAP 1: SPACE STATION (Trạm vũ trụ — xanh thiên hà) ─────
-
-    def _draw_env_space(self, surf):
-        hz = SCREEN_H // 2
-        surf.fill((4, 6, 16))
-
-        # Sao nền
-        import random as rnd
-        rng = rnd.Random(99)
-        for _ in range(120):
-            sx = rng.randint(0, SCREEN_W); sy = rng.randint(0, SCREEN_H)
-            sr = rng.randint(1,2)
-            a = int(rng.randint(40,180)*(0.7+0.3*math.sin(self._time*0.5+sx*0.02)))
-            ss = pygame.Surface((sr*2,sr*2),pygame.SRCALPHA)
-            pygame.draw.circle(ss,(180,200,255,a),(sr,sr),sr)
-            surf.blit(ss,(sx,sy))
-
-        # Nebula cloud background
-        for ni in range(3):
-            nx = SCREEN_W//4*(ni+1); ny = SCREEN_H//3
-            nr = 80+ni*30
-            na = int(15+ni*8)
-            ns = pygame.Surface((nr*2,nr*2),pygame.SRCALPHA)
-            nc_list = [(80,40,120),(40,60,140),(120,60,180)]
-            pygame.draw.circle(ns,(*nc_list[ni],na),(nr,nr),nr)
-            surf.blit(ns,(nx-nr,ny-nr))
-
-        # Horizon line (planet curvature effect)
-        pygame.draw.line(surf,(20,40,80),(0,hz),(SCREEN_W,hz),1)
-
-        # Sàn kim loại không gian
-        for y in range(SCREEN_H-hz):
-            t = y/(SCREEN_H-hz)
-            c = (int(8+t*8),int(10+t*12),int(22+t*18))
-            pygame.draw.line(surf,c,(0,hz+y),(SCREEN_W,hz+y))
-
-        vp_x = SCREEN_W//2
-        NEON=(40,100,255); GRID=(20,35,70)
-        for i in range(1,15):
-            t=(i/14)**1.6; y=int(hz+(SCREEN_H-hz)*t)
-            c=NEON if i%3==0 else GRID
-            pygame.draw.line(surf,c,(0,y),(SCREEN_W,y),2 if i%3==0 else 1)
-        for i in range(21):
-            angle=(i/20-0.5)*1.8
-            ex=vp_x+int(math.tan(angle)*(SCREEN_H-hz)*1.1)
-            c=NEON if i%4==0 else GRID
-            pygame.draw.line(surf,c,(vp_x,hz),(ex,SCREEN_H),2 if i%4==0 else 1)
-
-        # Cột trụ không gian hai bên
-        for side_x in [0, SCREEN_W-70]:
-            pygame.draw.rect(surf,(6,10,28),(side_x,0,70,SCREEN_H))
-            ex=side_x+(69 if side_x>0 else 0)
-            pygame.draw.line(surf,(40,100,255),(ex,0),(ex,SCREEN_H),2)
-            for i in range(5):
-                py=60+i*90; bx=side_x+8
-                pygame.draw.rect(surf,(10,18,50),(bx,py,54,55),border_radius=4)
-                # Hologram display
-                holo_c=(40,100,200) if math.sin(self._time*1.5+i)>0 else (20,60,150)
-                pygame.draw.rect(surf,holo_c,(bx+4,py+4,46,30),border_radius=3)
-                for li in range(3):
-                    lw=int(20+math.sin(self._time+li)*10)
-                    pygame.draw.line(surf,(80,160,255),(bx+8,py+12+li*7),(bx+8+lw,py+12+li*7),1)
-                pygame.draw.circle(surf,(255,100,40),(bx+10,py+45),3)
-        self._draw_fog(surf, hz)
-
-    # ─── MAP 2: JUNGLE BASE (Rừng neon — xanh lá nhiệt đới) ─────
-
-    def _draw_env_jungle(self, surf):
-        hz = SCREEN_H // 2
-        CEI=(6,15,8); HOR=(14,30,18); FLR=(8,20,10)
-        NEON=(20,200,60); GRID=(15,40,18)
-
-        for y in range(hz+1):
-            t=y/hz
-            pygame.draw.line(surf,(
-                int(CEI[0]+(HOR[0]-CEI[0])*t),
-                int(CEI[1]+(HOR[1]-CEI[1])*t),
-                int(CEI[2]+(HOR[2]-CEI[2])*t),
-            ),(0,y),(SCREEN_W,y))
-        for y in range(SCREEN_H-hz):
-            t=y/(SCREEN_H-hz)
-            pygame.draw.line(surf,(
-                int(HOR[0]+(FLR[0]-HOR[0])*t),
-                int(HOR[1]+(FLR[1]-HOR[1])*t),
-                int(HOR[2]+(FLR[2]-HOR[2])*t),
-            ),(0,hz+y),(SCREEN_W,hz+y))
-
-        vp_x=SCREEN_W//2
-        for i in range(1,15):
-            t=(i/14)**1.6; y=int(hz+(SCREEN_H-hz)*t)
-            c=NEON if i%3==0 else GRID
-            pygame.draw.line(surf,c,(0,y),(SCREEN_W,y),2 if i%3==0 else 1)
-        for i in range(21):
-            angle=(i/20-0.5)*1.8
-            ex=vp_x+int(math.tan(angle)*(SCREEN_H-hz)*1.1)
-            c=NEON if i%4==0 else GRID
-            pygame.draw.line(surf,c,(vp_x,hz),(ex,SCREEN_H),2 if i%4==0 else 1)
-
-        # Cây neon hai bên
-        for side_x in [0, SCREEN_W-70]:
-            pygame.draw.rect(surf,(8,18,10),(side_x,0,70,SCREEN_H))
-            ex=side_x+(69 if side_x>0 else 0)
-            pygame.draw.line(surf,NEON,(ex,0),(ex,SCREEN_H),2)
-            for i in range(4):
-                ty=50+i*115; tx=side_x+(5 if side_x==0 else 5)
-                # Thân cây
-                pygame.draw.rect(surf,(25,45,20),(tx+20,ty,14,70))
-                # Tán lá neon
-                for li in range(3):
-                    lx2=tx+10+li*8; ly2=ty+li*20
-                    lw=55-li*12; lh=28-li*5
-                    ls=pygame.Surface((lw,lh),pygame.SRCALPHA)
-                    leaf_a=int(80*(0.7+0.3*math.sin(self._time*1.2+i+li)))
-                    leaf_c=(20,200,60) if li==0 else ((30,160,50) if li==1 else (40,220,80))
-                    pygame.draw.ellipse(ls,(*leaf_c,leaf_a),ls.get_rect())
-                    surf.blit(ls,(lx2,ly2))
-                # Quả phát sáng
-                fx=tx+25; fy=ty+55
-                fp=abs(math.sin(self._time*2+i))
-                fc=(int(30+fp*220),int(180+fp*60),int(20+fp*40))
-                pygame.draw.circle(surf,fc,(fx,fy),5)
-
-        # Hơi nước / fog nền xanh
-        for fi in range(5):
-            fy=hz-20+fi*5; fa=int(30*(1-fi/5))
-            fs=pygame.Surface((SCREEN_W,4),pygame.SRCALPHA)
-            fs.fill((20,200,60,fa))
-            surf.blit(fs,(0,fy))
-        self._draw_wall_lights_env(surf, hz)
-        self._draw_fog(surf, hz)
+        """Vẽ môi trường theo map hiện tại (lớp tĩnh bake sẵn + lớp động)."""
+        self._env.draw(surf, self._time)
 
     def _draw_floor_grid(self, surf, hz):
         """Lưới sàn neon perspective."""
@@ -959,29 +794,6 @@ class GameplayScene(BaseScene):
             y = int(hz - hz * t)
             pygame.draw.line(surf, (18, 25, 50), (0, y), (SCREEN_W, y))
 
-    def _draw_wall_lights_env(self, surf, hz):
-        """Đèn neon gắn trần + hào quang."""
-        for lt in self._wall_lights:
-            flicker = 0.75 + 0.25 * math.sin(self._time * 4 + lt["flicker"])
-            intensity = lt["intensity"] * flicker
-            lx, ly   = lt["x"], lt["y"]
-            r, g, b  = lt["color"]
-
-            # Bóng đèn
-            pygame.draw.rect(surf, (50, 55, 70), (lx - 6, ly - 4, 12, 8), border_radius=3)
-            pygame.draw.rect(surf, (200, 210, 255), (lx - 4, ly, 8, 4), border_radius=2)
-
-            # Vầng sáng côn
-            cone_h = int((SCREEN_H // 2 - ly) * 0.85)
-            for ci in range(6):
-                t    = ci / 6
-                cw   = int(20 + t * 120) * intensity
-                ca   = int(40 * (1 - t) * intensity)
-                cr, cg, cb = r, g, b
-                cone_surf = pygame.Surface((int(cw * 2), max(1, int(cone_h * (1 - t + 0.1)))), pygame.SRCALPHA)
-                pygame.draw.ellipse(cone_surf, (cr, cg, cb, ca), cone_surf.get_rect())
-                surf.blit(cone_surf, (lx - int(cw), ly + int(cone_h * t)))
-
     def _draw_side_panels(self, surf, hz):
         """Cột/tường hai bên phong cách sci-fi."""
         for side_x, flip in [(0, False), (SCREEN_W - 80, True)]:
@@ -1006,15 +818,6 @@ class GameplayScene(BaseScene):
                         (bx + 16, py + 22 + li * 10),
                         (bx + 16 + lw, py + 22 + li * 10), 1)
 
-    def _draw_fog(self, surf, hz):
-        """Sương mù xa để che chân trời."""
-        fog_h = 60
-        for y in range(fog_h):
-            a = int(100 * (1 - y / fog_h))
-            fog_surf = pygame.Surface((SCREEN_W, 1), pygame.SRCALPHA)
-            fog_surf.fill((*ENV_FOG, a))
-            surf.blit(fog_surf, (0, hz - fog_h // 2 + y))
-
     # ─── GUN (cinematic) ──────────────────────────────────────
 
     def _draw_gun(self, surf):
@@ -1070,6 +873,18 @@ class GameplayScene(BaseScene):
         # Đường khớp ngón
         pygame.draw.line(surf, skin_d, (gx + 75, gy + 168), (gx + 98, gy + 160), 1)
 
+    @staticmethod
+    def _build_gun_glows() -> dict:
+        scope = pygame.Surface((98, 40), pygame.SRCALPHA)
+        pygame.draw.rect(scope, (0, 180, 255), scope.get_rect(), border_radius=8)
+        cone = pygame.Surface((120, 40), pygame.SRCALPHA)
+        pygame.draw.polygon(cone, (255, 200, 100), [(0, 20), (120, 0), (120, 40)])
+        ambient = pygame.Surface((240, 30), pygame.SRCALPHA)
+        pygame.draw.ellipse(ambient, (0, 140, 255), ambient.get_rect())
+        return {"scope": display_format(scope, alpha=True),
+                "cone": display_format(cone, alpha=True),
+                "ambient": display_format(ambient, alpha=True)}
+
     def _draw_gun_body(self, surf, gx, gy, rc):
         """Súng cơ giới siêu cinematic."""
         dark    = (22,  24,  34)
@@ -1092,17 +907,14 @@ class GameplayScene(BaseScene):
             lc = (255, 80, 80)
         # Tia laser
         for lw, la in [(6, 8), (3, 20), (1, 60)]:
-            ls = pygame.Surface((200, lw), pygame.SRCALPHA)
-            ls.fill((*lc, la))
-            surf.blit(ls, (laser_x - 200, laser_y - lw // 2))
+            post_fx.fade(surf, la, lc, (laser_x - 200, laser_y - lw // 2, 200, lw))
         # Dot laser trên robot
         if self._aim_on_robot:
             mx, my = pygame.mouse.get_pos()
             dot_a = int(200 * (0.7 + 0.3 * math.sin(t * 12)))
             for dr, da in [(8, 30), (4, 80), (2, 200)]:
-                ds = pygame.Surface((dr * 2, dr * 2), pygame.SRCALPHA)
-                pygame.draw.circle(ds, (255, 50, 50, min(255, int(da * dot_a / 200))), (dr, dr), dr)
-                surf.blit(ds, (mx - dr, my - dr))
+                a = quantize_alpha(min(255, int(da * dot_a / 200)))
+                surf.blit(particle_sprites.spark(dr, (255, 50, 50), a), (mx - dr, my - dr))
 
         # ─── HEAT HAZE sau bắn (distortion effect) ───
         if self._muzzle_t > 0.3:
@@ -1111,9 +923,8 @@ class GameplayScene(BaseScene):
             for hi in range(4):
                 ha = int(self._muzzle_t * (25 - hi * 5))
                 if ha > 2:
-                    hs = pygame.Surface((30 + hi * 10, 60 + hi * 15), pygame.SRCALPHA)
-                    hs.fill((200, 220, 255, ha))
-                    surf.blit(hs, (haze_x - 20 - hi * 5, haze_y - 20 - hi * 8))
+                    post_fx.fade(surf, ha, (200, 220, 255),
+                                 (haze_x - 20 - hi * 5, haze_y - 20 - hi * 8, 30 + hi * 10, 60 + hi * 15))
 
         # ─── Barrel + Handguard ───
         barrel_x = gx - 100
@@ -1128,9 +939,7 @@ class GameplayScene(BaseScene):
         ]
         pygame.draw.polygon(surf, mid, pts_hg)
         # AO shadow trên handguard
-        ao_s = pygame.Surface((92, 6), pygame.SRCALPHA)
-        ao_s.fill((0, 0, 0, 40))
-        surf.blit(ao_s, (barrel_x, barrel_y + 16))
+        post_fx.fade(surf, 40, (0, 0, 0), (barrel_x, barrel_y + 16, 92, 6))
         pygame.draw.polygon(surf, light, pts_hg, 2)
 
         # Khe thoát nhiệt — neon glow khi bắn nhiều
@@ -1139,10 +948,7 @@ class GameplayScene(BaseScene):
             hx2 = barrel_x + 6 + i * 14
             pygame.draw.rect(surf, dark, (hx2, barrel_y - 8, 9, 7), border_radius=1)
             if heat_glow > 0.1:
-                ha = int(heat_glow * 120)
-                hs = pygame.Surface((9, 7), pygame.SRCALPHA)
-                hs.fill((255, 120, 30, ha))
-                surf.blit(hs, (hx2, barrel_y - 8))
+                post_fx.fade(surf, heat_glow * 120, (255, 120, 30), (hx2, barrel_y - 8, 9, 7))
 
         # Nòng chính
         pygame.draw.rect(surf, dark, (gx - 80, gy + 82, 80, 14), border_radius=3)
@@ -1209,10 +1015,7 @@ class GameplayScene(BaseScene):
         pygame.draw.ellipse(surf, (0, int(40+30*scope_glow), int(100+50*scope_glow)),
                             (sc_x + sc_w - 14, sc_y + 5, 10, 10))
         # Scope glow hào quang
-        sg_a = int(scope_glow * 35)
-        sg_s = pygame.Surface((sc_w + 20, sc_h + 20), pygame.SRCALPHA)
-        pygame.draw.rect(sg_s, (0, 180, 255, sg_a), sg_s.get_rect(), border_radius=8)
-        surf.blit(sg_s, (sc_x - 10, sc_y - 10))
+        particle_sprites.blit(surf, self._gun_glows["scope"], (sc_x - 10, sc_y - 10), scope_glow * 35)
 
         # Crosshair reticle trong scope (nhỏ)
         rle_x, rle_y = sc_x + 9, sc_y + 10
@@ -1234,9 +1037,7 @@ class GameplayScene(BaseScene):
         ]
         pygame.draw.polygon(surf, dark, mag_pts)
         # Indicator strip
-        mag_strip_s = pygame.Surface((24, 6), pygame.SRCALPHA)
-        mag_strip_s.fill((0, 200, 80, 120))
-        surf.blit(mag_strip_s, (gx + 54, gy + 165))
+        post_fx.fade(surf, 120, (0, 200, 80), (gx + 54, gy + 165, 24, 6))
         pygame.draw.polygon(surf, mid, mag_pts, 2)
         for i in range(4):
             my3 = gy + 148 + i * 14
@@ -1278,9 +1079,7 @@ class GameplayScene(BaseScene):
         pygame.draw.circle(surf, sel_c, (gx + 122, gy + 94), 5)
         pygame.draw.circle(surf, dark, (gx + 122, gy + 94), 3)
         # Glow trên selector
-        sel_gs = pygame.Surface((20, 20), pygame.SRCALPHA)
-        pygame.draw.circle(sel_gs, (*sel_c, 60), (10, 10), 10)
-        surf.blit(sel_gs, (gx + 112, gy + 84))
+        particle_sprites.blit(surf, particle_sprites.disc(10, sel_c), (gx + 112, gy + 84), 60)
 
         # ─── Stock ───
         stock_pts = [
@@ -1312,16 +1111,11 @@ class GameplayScene(BaseScene):
         pygame.draw.circle(surf, (255, 230, 180), (gx - 79, gy + 103), 2)
         # Flashlight cone (khi bắn)
         if self._muzzle_t < 0.1:
-            fl_s = pygame.Surface((120, 40), pygame.SRCALPHA)
-            pygame.draw.polygon(fl_s, (255, 200, 100, 18),
-                [(0, 20), (120, 0), (120, 40)])
-            surf.blit(fl_s, (gx - 200, gy + 83))
+            particle_sprites.blit(surf, self._gun_glows["cone"], (gx - 200, gy + 83), 18)
 
         # ─── Ambient glow dưới súng ───
-        gun_gs = pygame.Surface((240, 30), pygame.SRCALPHA)
         gga = int(20 + 15 * math.sin(t * 1.8))
-        pygame.draw.ellipse(gun_gs, (0, 140, 255, gga), gun_gs.get_rect())
-        surf.blit(gun_gs, (gx - 110, gy + 150))
+        particle_sprites.blit(surf, self._gun_glows["ambient"], (gx - 110, gy + 150), gga)
 
         # ─── Barrel (nòng súng) ───
         barrel_x = gx - 100
@@ -1480,9 +1274,7 @@ class GameplayScene(BaseScene):
             (52, (255, 140, 30),  int(t * 90)),
             (72, (255, 80,  0),   int(t * 45)),
         ]:
-            gs = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
-            pygame.draw.circle(gs, (*c, a), (r, r), r)
-            surf.blit(gs, (mx - r, my - r))
+            particle_sprites.blit(surf, particle_sprites.disc(r, c), (mx - r, my - r), a)
 
         # Tia lửa xung quanh
         for i in range(8):
@@ -1499,9 +1291,7 @@ class GameplayScene(BaseScene):
             sr = 15 + i * 10
             sx = mx - 20 - i * 15 + random.randint(-4, 4)
             sy = my - i * 8 + random.randint(-4, 4)
-            ss = pygame.Surface((sr * 2, sr * 2), pygame.SRCALPHA)
-            pygame.draw.circle(ss, (80, 85, 95, smoke_c), (sr, sr), sr)
-            surf.blit(ss, (sx, sy))
+            particle_sprites.blit(surf, particle_sprites.disc(sr, (80, 85, 95)), (sx, sy), smoke_c)
 
     def _draw_muzzle_light(self, surf):
         """Ánh sáng muzzle flash chiếu lên robot."""
@@ -1511,22 +1301,18 @@ class GameplayScene(BaseScene):
         cx = self._robot.cx
         cy = self._robot.cy - 80
 
-        r = int(200 * t)
-        gs = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
-        a  = int(t * 60)
-        pygame.draw.circle(gs, (255, 200, 80, a), (r, r), r)
-        surf.blit(gs, (cx - r, cy - r))
+        # Bán kính làm tròn 20px → ≤ 10 sprite trong cache dùng chung
+        r = max(20, int(200 * t) // 20 * 20)
+        particle_sprites.blit(surf, particle_sprites.disc(r, (255, 200, 80)), (cx - r, cy - r), t * 60)
 
     def _draw_shells(self, surf):
         """Vỏ đạn bay ra."""
-        for sh in self._muzzle_shells:
-            a = int(sh["life"] * 220)
+        for x, y, rot, life in self._muzzle_shells.rows("x", "y", "rot", "life"):
+            a = int(life * 220)
             if a < 10:
                 continue
-            shell_surf = pygame.Surface((10, 5), pygame.SRCALPHA)
-            shell_surf.fill((200, 180, 60, a))
-            rotated = pygame.transform.rotate(shell_surf, sh["rot"] % 360)
-            surf.blit(rotated, (int(sh["x"]) - 5, int(sh["y"]) - 2))
+            rotated = particle_sprites.rect(10, 5, (200, 180, 60), rot)
+            particle_sprites.blit(surf, rotated, (int(x) - 5, int(y) - 2), a)
 
     # ─── Crosshair & HUD ──────────────────────────────────────
 
@@ -1636,51 +1422,31 @@ class GameplayScene(BaseScene):
         # ─── Warning ───
         if self._wrong_count == MAX_WRONG_ANSWERS - 1:
             a = int(200*(0.6+0.4*math.sin(self._time*6)))
-            ws = assets.render_text("⚠  LAST CHANCE!", "md", (255,60,60), bold=True)
-            ws.set_alpha(a)
+            ws = assets.render_text("⚠  LAST CHANCE!", "md", (255,60,60), bold=True, alpha=a)
             surf.blit(ws, (SCREEN_W//2-ws.get_width()//2, SCREEN_H-62))
 
     def _draw_damage_numbers(self, surf):
         for dn in self._dmg_numbers:
             a = min(255, int(dn["life"] / 1.6 * 255))
             s = assets.render_text(dn["text"], dn["size"], dn["color"],
-                                    bold=True, shadow=True)
-            s.set_alpha(a)
+                                    bold=True, shadow=True, alpha=a)
             surf.blit(s, (int(dn["x"]) - s.get_width() // 2, int(dn["y"])))
 
     def _draw_vignette(self):
         """Vignette đỏ khi sai + vignette đen viền màn hình."""
         # Vignette viền đen thường trực
-        vs = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        for i in range(60):
-            t = i / 60
-            a = int(120 * (1 - t) ** 2)
-            pygame.draw.rect(vs, (0, 0, 0, a),
-                (i, i, SCREEN_W - i * 2, SCREEN_H - i * 2), 1)
-        self.screen.blit(vs, (0, 0))
+        post_fx.vignette(self.screen)
 
         # Vignette đỏ khi sai
         if self._vignette_t > 0.05:
-            rv = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-            a  = int(self._vignette_t / 1.5 * 100)
-            for i in range(40):
-                t2 = i / 40
-                ia = int(a * (1 - t2) ** 2)
-                pygame.draw.rect(rv, (200, 20, 20, ia),
-                    (i * 2, i * 2, SCREEN_W - i * 4, SCREEN_H - i * 4), 2)
-            self.screen.blit(rv, (0, 0))
+            post_fx.red_vignette(self.screen, self._vignette_t / 1.5)
 
     def _draw_scanlines(self):
         """Scanline overlay cinematic."""
-        sl = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        for y in range(0, SCREEN_H, 4):
-            pygame.draw.line(sl, (0, 0, 0, 18), (0, y), (SCREEN_W, y))
-        self.screen.blit(sl, (0, 0))
+        post_fx.scanlines(self.screen)
 
     def _draw_endscreen(self):
-        ov = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        ov.fill((0, 0, 0, 175))
-        self.screen.blit(ov, (0, 0))
+        post_fx.fade(self.screen, 175)
 
         title_c = (220, 50, 50)
         title   = "MISSION FAILED"
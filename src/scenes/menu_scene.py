@@ -4,11 +4,13 @@ menu_scene.py - Màn hình Menu Chính
 
 import pygame
 import math
-import random
+import numpy as np
 from src.scenes.base_scene import BaseScene
 from src.constants import *
 from src.assets import assets
 from src.ui_components import Button
+from src.particles import ParticlePool, rng
+from src.particle_sprites import particle_sprites, quantize_alpha
 
 
 class MenuScene(BaseScene):
@@ -53,16 +55,18 @@ class MenuScene(BaseScene):
 
     def _init_particles(self):
         """Khởi tạo particle ngôi sao nền."""
-        self.particles = []
-        for _ in range(80):
-            self.particles.append({
-                "x": random.uniform(0, SCREEN_W),
-                "y": random.uniform(0, SCREEN_H),
-                "speed": random.uniform(10, 40),
-                "size": random.uniform(1, 3),
-                "alpha": random.randint(60, 200),
-                "flicker": random.uniform(0, math.pi * 2),
-            })
+        # vy tính theo px/frame 60fps (quy ước của ParticlePool); life không giảm
+        n = 80
+        self.particles = ParticlePool(n, fields=("alpha", "flicker"))
+        self.particles.spawn(n,
+            x=rng.uniform(0, SCREEN_W, n),
+            y=rng.uniform(0, SCREEN_H, n),
+            vy=rng.uniform(10, 40, n) / 60,
+            size=rng.uniform(1, 3, n),
+            alpha=rng.integers(60, 201, n),
+            flicker=rng.uniform(0, math.pi * 2, n),
+            life=1.0,
+        )
 
     def update(self, dt: float, events: list):
         self._time += dt
@@ -73,12 +77,13 @@ class MenuScene(BaseScene):
         self._buttons_alpha = min(255, self._buttons_alpha + int(dt * 400))
 
         # Cập nhật particle
-        for p in self.particles:
-            p["y"] += p["speed"] * dt
-            if p["y"] > SCREEN_H:
-                p["y"] = -5
-                p["x"] = random.uniform(0, SCREEN_W)
-            p["flicker"] += dt * 2
+        p = self.particles
+        p.integrate(dt, decay=0)
+        wrap = p.y > SCREEN_H
+        if wrap.any():
+            p.y[wrap] = -5
+            p.x[wrap] = rng.uniform(0, SCREEN_W, int(wrap.sum()))
+        p.flicker[:] += dt * 2
 
         # Cập nhật buttons + xử lý click
         for i, btn in enumerate(self.buttons):
@@ -137,12 +142,11 @@ class MenuScene(BaseScene):
             surf.blit(line_surf, (0, glow_y - i))
 
     def _draw_particles(self, surf: pygame.Surface):
-        for p in self.particles:
-            alpha = int(p["alpha"] * (0.6 + 0.4 * math.sin(p["flicker"])))
-            size = p["size"]
-            s = pygame.Surface((int(size * 2 + 2), int(size * 2 + 2)), pygame.SRCALPHA)
-            pygame.draw.circle(s, (*WHITE, alpha), (int(size + 1), int(size + 1)), int(size))
-            surf.blit(s, (int(p["x"]), int(p["y"])))
+        p = self.particles
+        alphas = (p.alpha * (0.6 + 0.4 * np.sin(p.flicker))).astype(int).tolist()
+        for (x, y, size), alpha in zip(p.rows("x", "y", "size"), alphas):
+            s = particle_sprites.star(int(size), WHITE, quantize_alpha(alpha))
+            surf.blit(s, (int(x), int(y)))
 
     def _draw_title(self, surf: pygame.Surface):
         # Pulse animation tiêu đề
@@ -13,6 +13,8 @@ from src.robot_renderer import RobotRenderer
 from src.question_overlay import QuestionOverlay
 from src.question_manager import QuestionManager
 from src.powerup_system import PowerupSystem
+from src.post_fx import post_fx
+from src.profiler import profiler
 
 
 # ─── Constants ────────────────────────────────────────────────
@@ -68,7 +70,10 @@ class MultiplayerScene(BaseScene):
 
         # Question manager
         self._q_manager = QuestionManager()
-        n = self._q_manager.load_files(self.state.selected_question_files)
+        if self.state.question_query:
+            n = self._q_manager.load_query(**self.state.question_query)
+        else:
+            n = self._q_manager.load_files(self.state.selected_question_files)
         if n == 0:
             manager.go_to(SCENE_MENU)
             return
@@ -126,6 +131,11 @@ class MultiplayerScene(BaseScene):
         hp        = base_hp + cycle * 60
         self._robot      = RobotRenderer(SCREEN_W//2, SCREEN_H//2+55, scale=1.7,
                                           robot_index=robot_idx)
+        self._robot.prebake()   # Thường đã bake xong từ trận trước → không tốn gì
+        # Robot kế tiếp: bake dần mỗi frame trong update() (chỉ dùng atlas, không vẽ)
+        next_idx = self.ROBOT_ORDER[(wave_index + 1) % self._total_waves]
+        self._next_robot = RobotRenderer(SCREEN_W//2, SCREEN_H//2+55, scale=1.7,
+                                         robot_index=next_idx)
         self._robot_hp   = hp
         self._robot_max_hp = hp
         self._hp_bar     = HealthBar(SCREEN_W//2-200, 22, 400, 26)
@@ -162,10 +172,14 @@ class MultiplayerScene(BaseScene):
             })
         return lights
 
+    def on_exit(self):
+        self._q_manager.close()     # Nhả mmap .qpk → import lại / xoá bộ đề được ngay
+
     # ─── Update ───────────────────────────────────────────────
 
     def update(self, dt, events):
         self._time += dt
+        self._next_robot.bake_step()    # ≤ 1 lớp atlas / frame
 
         # Intro countdown
         if self._intro_t > 0:
@@ -188,7 +202,8 @@ class MultiplayerScene(BaseScene):
                 self._update_map_transition(dt)
             return
 
-        self._robot.update(dt)
+        with profiler.stage("upd.robot"):
+            self._robot.update(dt)
         self._hp_bar.update(dt)
         self._robot_banner_t = max(0.0, self._robot_banner_t - dt)
 
@@ -371,10 +386,12 @@ class MultiplayerScene(BaseScene):
         surf = self.screen
 
         # Background theo map
-        self._draw_bg(surf)
+        with profiler.stage("environment"):
+            self._draw_bg(surf)
 
         # Robot (trung tâm)
-        self._robot.draw(surf)
+        with profiler.stage("robot"):
+            self._robot.draw(surf)
         self._hp_bar.draw(surf)
 
         # Power-up items
@@ -384,14 +401,14 @@ class MultiplayerScene(BaseScene):
         # Damage numbers
         for dn in self._dmg_numbers:
             a = min(255, int(dn["life"]/1.6*255))
-            s = assets.render_text(dn["text"],"md",dn["color"],bold=True,shadow=True)
-            s.set_alpha(a); surf.blit(s,(int(dn["x"])-s.get_width()//2,int(dn["y"])))
+            s = assets.render_text(dn["text"],"md",dn["color"],bold=True,shadow=True,alpha=a)
+            surf.blit(s,(int(dn["x"])-s.get_width()//2,int(dn["y"])))
 
         # Notifs
         for n in self._notifs:
             a = min(255, int(n["life"]/2.0*255))
-            ns = assets.render_text(n["text"],"lg",n["color"],bold=True,shadow=True)
-            ns.set_alpha(a); surf.blit(ns,(int(n["x"])-ns.get_width()//2,int(n["y"])))
+            ns = assets.render_text(n["text"],"lg",n["color"],bold=True,shadow=True,alpha=a)
+            surf.blit(ns,(int(n["x"])-ns.get_width()//2,int(n["y"])))
 
         # P1 crosshair (keyboard - WASD)
         self._draw_crosshair(surf, int(self._p1.cursor_x), int(self._p1.cursor_y),
@@ -413,10 +430,11 @@ class MultiplayerScene(BaseScene):
             self._draw_robot_banner(surf)
 
         # Overlays (P1=trái, P2=phải — vẽ sau)
-        if self._p1.is_answering:
-            self._overlay1.draw()
-        if self._p2.is_answering:
-            self._overlay2.draw()
+        with profiler.stage("overlay"):
+            if self._p1.is_answering:
+                self._overlay1.draw()
+            if self._p2.is_answering:
+                self._overlay2.draw()
 
         # Transitions
         if self._transition_phase != "none":
@@ -512,9 +530,8 @@ class MultiplayerScene(BaseScene):
     def _draw_robot_banner(self, surf):
         t = self._robot_banner_t; a = min(1.0,t/0.5) if t<0.5 else 1.0
         pal = self._robot.palette
-        name_s = assets.render_text(pal["name"],"xl",pal["neon"],bold=True,shadow=True)
-        sub_s  = assets.render_text(pal["title"],"sm",(200,210,240),shadow=True)
-        name_s.set_alpha(int(a*255)); sub_s.set_alpha(int(a*255))
+        name_s = assets.render_text(pal["name"],"xl",pal["neon"],bold=True,shadow=True,alpha=int(a*255))
+        sub_s  = assets.render_text(pal["title"],"sm",(200,210,240),shadow=True,alpha=int(a*255))
         surf.blit(name_s,(SCREEN_W//2-name_s.get_width()//2,SCREEN_H//2-name_s.get_height()-8))
         surf.blit(sub_s, (SCREEN_W//2-sub_s.get_width()//2, SCREEN_H//2+8))
 
@@ -526,17 +543,16 @@ class MultiplayerScene(BaseScene):
             progress=max(0.0,1.0-self._transition_t/FADE_IN)
         a=int(progress*255)
         if a<=0: return
-        fade=pygame.Surface((SCREEN_W,SCREEN_H),pygame.SRCALPHA)
-        fade.fill((0,0,0,a)); surf.blit(fade,(0,0))
+        post_fx.fade(surf,a)
         if self._transition_phase=="out" and progress>0.75:
             from src.robot_renderer import ROBOT_PALETTES
             next_idx=self.ROBOT_ORDER[self._wave_index%self._total_waves]
             pal=ROBOT_PALETTES[next_idx]
             ta=int((progress-0.75)/0.25*255)
-            ns=assets.render_text(f"ENEMY #{self._wave_index+1}","md",pal["neon"],bold=True)
-            ns.set_alpha(ta); surf.blit(ns,(SCREEN_W//2-ns.get_width()//2,SCREEN_H//2-40))
-            ts=assets.render_text(pal["name"],"xl",pal["neon"],bold=True)
-            ts.set_alpha(ta); surf.blit(ts,(SCREEN_W//2-ts.get_width()//2,SCREEN_H//2))
+            ns=assets.render_text(f"ENEMY #{self._wave_index+1}","md",pal["neon"],bold=True,alpha=ta)
+            surf.blit(ns,(SCREEN_W//2-ns.get_width()//2,SCREEN_H//2-40))
+            ts=assets.render_text(pal["name"],"xl",pal["neon"],bold=True,alpha=ta)
+            surf.blit(ts,(SCREEN_W//2-ts.get_width()//2,SCREEN_H//2))
 
     def _draw_map_transition(self, surf):
         MAP_FADE=1.8
@@ -546,23 +562,20 @@ class MultiplayerScene(BaseScene):
             progress=max(0.0,1.0-self._map_transition_t/MAP_FADE)
         a=int(progress*255)
         if a<=0: return
-        fade=pygame.Surface((SCREEN_W,SCREEN_H),pygame.SRCALPHA)
-        fade.fill((0,0,0,a)); surf.blit(fade,(0,0))
+        post_fx.fade(surf,a)
         if progress>0.5:
             map_names=["PHÒNG THÍ NGHIỆM","TRẠM VŨ TRỤ","RỪNG NEON"]
             map_colors=[(0,200,80),(60,140,255),(40,220,80)]
             ta=int((progress-0.5)/0.5*255)
             mc=map_colors[self._current_map]
-            rs=assets.render_text(f"ROUND {self._round+1}","md",(180,180,200),bold=True)
-            rs.set_alpha(ta); surf.blit(rs,(SCREEN_W//2-rs.get_width()//2,SCREEN_H//2-60))
-            ms=assets.render_text(map_names[self._current_map],"xl",mc,bold=True)
-            ms.set_alpha(ta); surf.blit(ms,(SCREEN_W//2-ms.get_width()//2,SCREEN_H//2))
+            rs=assets.render_text(f"ROUND {self._round+1}","md",(180,180,200),bold=True,alpha=ta)
+            surf.blit(rs,(SCREEN_W//2-rs.get_width()//2,SCREEN_H//2-60))
+            ms=assets.render_text(map_names[self._current_map],"xl",mc,bold=True,alpha=ta)
+            surf.blit(ms,(SCREEN_W//2-ms.get_width()//2,SCREEN_H//2))
 
     def _draw_intro(self, surf):
         """Màn intro 4 giây: hướng dẫn điều khiển + countdown."""
-        overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        overlay.fill((0, 0, 8, 210))
-        surf.blit(overlay, (0, 0))
+        post_fx.fade(surf, 210, (0, 0, 8))
 
         t = self._intro_t
         cy = SCREEN_H // 2
@@ -598,8 +611,7 @@ class MultiplayerScene(BaseScene):
         surf.blit(hint, (SCREEN_W//2 - hint.get_width()//2, cy + 185))
 
     def _draw_game_over(self, surf):
-        overlay=pygame.Surface((SCREEN_W,SCREEN_H),pygame.SRCALPHA)
-        overlay.fill((0,0,0,200)); surf.blit(overlay,(0,0))
+        post_fx.fade(surf,200)
 
         # Winner announcement
         if self._winner=="draw":
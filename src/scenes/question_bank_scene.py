@@ -3,8 +3,8 @@ question_bank_scene.py - Màn hình Đẩy Câu Hỏi
 """
 
 import pygame
+import math
 import os
-import json
 import shutil
 import tkinter as tk
 from tkinter import filedialog
@@ -15,6 +15,11 @@ from src.ui_components import (
     Button, Panel, TextInput, ScrollList, draw_title_bar
 )
 from src.question_parser import QuestionParser, ParseError
+from src.question_catalog import question_catalog
+from src.question_importer import ImportJob, BatchImportJob, StoreSyncJob, DuplicateCountJob, find_docx
+from src.question_pack import pack_path_for
+from src.question_dedupe import sig_path_for
+from src.question_store import question_store
 
 
 class QuestionBankScene(BaseScene):
@@ -23,6 +28,10 @@ class QuestionBankScene(BaseScene):
     STEP_CLASS = "class"
     STEP_SUBJECT = "subject"
     STEP_FILES = "files"
+    STEP_SEARCH = "search"
+
+    SEARCH_LIMIT = 200      # Số kết quả hiển thị tối đa
+    SEARCH_DELAY = 0.2      # Giây chờ sau lần gõ cuối rồi mới truy vấn
 
     def __init__(self, screen, manager):
         super().__init__(screen, manager)
@@ -67,6 +76,48 @@ class QuestionBankScene(BaseScene):
             "Xóa đã chọn", bg_normal=RED, bg_hover=RED_BRIGHT,
             color_normal=WHITE, font_size="sm", icon="🗑"
         )
+        self._btn_upload_dir = Button(
+            SCREEN_W - 260, 306, 200, 46,
+            "Upload thư mục", bg_normal=ORANGE, bg_hover=YELLOW,
+            color_normal=DARK_BG, font_size="sm", icon="📁"
+        )
+        # Huỷ import (thay chỗ nút Upload khi đang import)
+        self._btn_cancel = Button(
+            SCREEN_W - 260, 190, 200, 46,
+            "Hủy upload", bg_normal=GRAY_DARK, bg_hover=RED,
+            color_normal=WHITE, font_size="sm"
+        )
+
+        # === Tìm câu hỏi (kho SQLite) ===
+        self._btn_search = Button(
+            SCREEN_W - 260, 190, 200, 46, "Tìm câu hỏi", font_size="sm", icon="🔍"
+        )
+        self._btn_search_here = Button(
+            SCREEN_W - 260, 364, 200, 46, "Tìm trong môn", font_size="sm", icon="🔍"
+        )
+        self._search_input = TextInput(
+            60, 110, 560, 46, placeholder="Tìm nội dung câu hỏi..."
+        )
+        self._btn_type = Button(640, 110, 220, 46, "", font_size="sm")
+        self._btn_diff = Button(870, 110, 220, 46, "", font_size="sm")
+        self._result_list = ScrollList(
+            60, 190, SCREEN_W - 120, 370, item_h=44
+        )
+        self._type_idx = 0
+        self._diff_idx = 0
+        self._search_from  = self.STEP_CLASS   # Bước quay lại khi thoát tìm kiếm
+        self._search_scope = {}                # {"cls", "subject"} khi tìm trong 1 môn
+        self._search_key   = None              # (text, dạng, độ khó) của lần truy vấn gần nhất
+        self._search_timer = 0.0
+        self._search_pending = False
+        self._search_total = 0
+
+        # Import .docx đang chạy nền (None = không có)
+        self._import_job: ImportJob | BatchImportJob | None = None
+        # Lập chỉ mục kho SQLite trước khi tìm (None = không có / đã xong)
+        self._sync_job: StoreSyncJob | None = None
+        # Đếm câu gần trùng của danh sách file đang hiện (None = không có / đã xong)
+        self._dup_job: DuplicateCountJob | None = None
 
         # Status message (feedback)
         self._status_msg = ""
@@ -79,53 +130,96 @@ class QuestionBankScene(BaseScene):
 
     def _load_classes(self):
         items = []
-        if os.path.isdir(DATA_DIR):
-            for name in sorted(os.listdir(DATA_DIR)):
-                path = os.path.join(DATA_DIR, name)
-                if os.path.isdir(path):
-                    n_sub = sum(
-                        1 for s in os.listdir(path)
-                        if os.path.isdir(os.path.join(path, s))
-                    )
-                    items.append({"id": name, "text": f"📁 {name}", "badge": f"{n_sub} môn"})
+        for c in question_catalog.classes():
+            items.append({"id": c["name"], "text": f"📁 {c['name']}", "badge": f"{c['subjects']} môn"})
         self._list.set_items(items)
 
     def _load_subjects(self):
         items = []
-        class_path = os.path.join(DATA_DIR, self._selected_class)
-        if os.path.isdir(class_path):
-            for name in sorted(os.listdir(class_path)):
-                path = os.path.join(class_path, name)
-                if os.path.isdir(path):
-                    n = len([f for f in os.listdir(path) if f.endswith(".json")])
-                    items.append({"id": name, "text": f"📚 {name}", "badge": f"{n} bộ đề"})
+        for s in question_catalog.subjects(self._selected_class):
+            items.append({"id": s["name"], "text": f"📚 {s['name']}", "badge": f"{s['files']} bộ đề"})
         self._list.set_items(items)
 
     def _load_files(self):
+        """Hiện danh sách ngay; số câu trùng đếm trên thread nền rồi điền vào badge sau."""
         items = []
-        subj_path = os.path.join(DATA_DIR, self._selected_class, self._selected_subject)
-        if os.path.isdir(subj_path):
-            for fname in sorted(os.listdir(subj_path)):
-                if fname.endswith(".json"):
-                    fpath = os.path.join(subj_path, fname)
-                    n_q = 0
-                    try:
-                        with open(fpath, encoding="utf-8") as f:
-                            data = json.load(f)
-                        n_q = len(data.get("questions", []))
-                    except Exception:
-                        pass
-                    items.append({
-                        "id": fpath,
-                        "text": f"📄 {fname[:-5]}",
-                        "badge": f"{n_q} câu",
-                    })
+        for e in question_catalog.files(self._selected_class, self._selected_subject):
+            items.append({
+                "id": e["path"],
+                "text": f"📄 {e['name']}",
+                "badge": f"{e['count']} câu",
+                "count": e["count"],
+            })
         self._file_list.set_items(items)
+        if self._dup_job:
+            self._dup_job.cancel()
+        self._dup_job = DuplicateCountJob([it["id"] for it in items]).start() if items else None
+
+    def _poll_dups(self):
+        """Nhận kết quả đếm câu trùng; chỉ nhận nếu danh sách file chưa đổi từ lúc bắt đầu."""
+        job = self._dup_job
+        for msg in job.poll():
+            if msg[0] == "failed":
+                print(f"[Dedupe] {msg[1]}")
+        if job.running:
+            return
+        self._dup_job = None
+        items = self._file_list.items
+        if job.state != job.DONE or job.paths != [it["id"] for it in items]:
+            return
+        for it, k in zip(items, job.counts):
+            # Số câu gần trùng với câu ở bộ đề đứng trước (hoặc trong chính bộ này)
+            if k:
+                it["badge"] = f"{it['count']} câu · {k} trùng"
+
+    # ─── Tìm kiếm ────────────────────────────────────────────────
+
+    def _enter_search(self, scope: dict):
+        """
+        Mở bước tìm kiếm trong phạm vi scope. Kho SQLite đồng bộ với data/ trên thread
+        nền (StoreSyncJob) — tìm kiếm chỉ chạy sau khi lập chỉ mục xong.
+        """
+        if self._sync_job is None:
+            self._sync_job = StoreSyncJob(question_store).start()
+        self._search_from  = self._step
+        self._search_scope = scope
+        self._search_key   = None
+        self._step = self.STEP_SEARCH
+        self._update_filter_labels()
+
+    def _update_filter_labels(self):
+        self._btn_type.text = f"Dạng: {Q_TYPE_FILTERS[self._type_idx][1]}"
+        self._btn_diff.text = f"Độ khó: {DIFFICULTY_FILTERS[self._diff_idx][1]}"
+
+    def _poll_sync(self):
+        """Nhận message từ thread lập chỉ mục; lỗi → quay lại bước trước tìm kiếm."""
+        job = self._sync_job
+        for msg in job.poll():
+            if msg[0] == "failed":
+                self._show_status(msg[1], RED)
+                if self._step == self.STEP_SEARCH:
+                    self._step = self._search_from
+        if not job.running:
+            self._sync_job = None
+
+    def _run_search(self):
+        text, qtype, diff = self._search_key
+        filters = dict(self._search_scope, qtype=qtype, difficulty=diff)
+        rows, self._search_total = question_store.search(text, limit=self.SEARCH_LIMIT, **filters)
+        items = []
+        for i, r in enumerate(rows):
+            q = " ".join(r["question"].split())
+            items.append({
+                "id": i,
+                "text": f"[{r['difficulty']}] {q[:70]}{'…' if len(q) > 70 else ''}",
+                "badge": f"{r['subject']} / {r['file']}",
+            })
+        self._result_list.set_items(items)
 
     # ─── Xử lý upload ────────────────────────────────────────────
 
     def _do_upload(self, src_path: str):
-        """Validate + copy + parse file .docx."""
+        """Kiểm tra đường dẫn rồi parse + lưu file .docx trên thread nền."""
         src_path = src_path.strip().strip('"').strip("'")
 
         if not os.path.isfile(src_path):
@@ -136,12 +230,6 @@ class QuestionBankScene(BaseScene):
             self._show_status("File phải có định dạng .docx!", RED)
             return
 
-        # Validate
-        valid, msg, questions = self._parser.validate_file(src_path)
-        if not valid:
-            self._show_status(msg, RED)
-            return
-
         # Tên file output
         base_name = os.path.splitext(os.path.basename(src_path))[0]
         dest_dir = os.path.join(DATA_DIR, self._selected_class, self._selected_subject)
@@ -154,10 +242,38 @@ class QuestionBankScene(BaseScene):
             "class": self._selected_class,
             "subject": self._selected_subject,
         }
-        self._parser.save_questions(questions, dest_json, metadata)
+        self._import_job = ImportJob(src_path, dest_json, metadata, self._parser).start()
 
-        self._show_status(f"✓ Upload thành công! {msg}", GREEN)
-        self._load_files()
+    def _do_upload_dir(self, folder: str):
+        """Import mọi file .docx trong thư mục (song song nhiều tiến trình)."""
+        files = find_docx([folder])
+        if not files:
+            self._show_status("Không có file .docx nào trong thư mục!", ORANGE)
+            return
+        dest_dir = os.path.join(DATA_DIR, self._selected_class, self._selected_subject)
+        metadata = {"class": self._selected_class, "subject": self._selected_subject}
+        self._import_job = BatchImportJob(files, dest_dir, metadata).start()
+
+    def _poll_import(self):
+        """Nhận message từ thread import; kết thúc job khi xong / lỗi / huỷ."""
+        job = self._import_job
+        for msg in job.poll():
+            kind = msg[0]
+            if kind == "file_done":
+                r = msg[1]
+                if r["error"]:
+                    print(f"[Import] {r['file']}: {r['error']}")
+            elif kind == "done":
+                self._show_status(f"✓ Upload thành công! {msg[1]}", GREEN)
+            elif kind == "failed":
+                self._show_status(msg[1], RED)
+            elif kind == "cancelled":
+                self._show_status("Đã hủy upload", ORANGE)
+        if not job.running:
+            self._import_job = None
+            # Nạp lại danh sách 1 lần khi job kết thúc (huỷ giữa batch vẫn có file đã import)
+            if job.state == job.DONE or job.results:
+                self._load_files()
 
     def _do_delete(self):
         """Xóa các file đã chọn."""
@@ -168,6 +284,9 @@ class QuestionBankScene(BaseScene):
         for item in selected:
             try:
                 os.remove(item["id"])
+                for extra in (pack_path_for(item["id"]), sig_path_for(item["id"])):
+                    if os.path.isfile(extra):
+                        os.remove(extra)
             except Exception as e:
                 self._show_status(f"Lỗi xóa: {e}", RED)
                 return
@@ -205,14 +324,29 @@ class QuestionBankScene(BaseScene):
         self._status_color = color
         self._status_timer = 4.0
 
+    def on_exit(self):
+        if self._dup_job:
+            self._dup_job.cancel()
+
     # ─── Update ──────────────────────────────────────────────────
 
     def update(self, dt: float, events: list):
         self._status_timer = max(0.0, self._status_timer - dt)
+        if self._import_job:
+            self._poll_import()
+        if self._sync_job:
+            self._poll_sync()
+        if self._dup_job:
+            self._poll_dups()
 
         self._btn_back.update(events, dt)
         if self._btn_back.clicked:
+            if self._import_job:
+                # Rời màn hình bộ đề → huỷ import đang chạy
+                self._import_job.cancel()
             if self._step == self.STEP_CLASS:
+                if self._sync_job:
+                    self._sync_job.cancel()
                 self.manager.go_to(SCENE_MENU)
             elif self._step == self.STEP_SUBJECT:
                 self._step = self.STEP_CLASS
@@ -220,6 +354,8 @@ class QuestionBankScene(BaseScene):
             elif self._step == self.STEP_FILES:
                 self._step = self.STEP_SUBJECT
                 self._load_subjects()
+            elif self._step == self.STEP_SEARCH:
+                self._step = self._search_from     # Lập chỉ mục chạy tiếp cho lần tìm sau
             return
 
         if self._step == self.STEP_CLASS:
@@ -228,16 +364,23 @@ class QuestionBankScene(BaseScene):
             self._update_subject(dt, events)
         elif self._step == self.STEP_FILES:
             self._update_files(dt, events)
+        elif self._step == self.STEP_SEARCH:
+            self._update_search(dt, events)
 
     def _update_class(self, dt, events):
         self._list.update(events)
         self._new_input.update(events, dt)
         self._btn_create.update(events, dt)
         self._btn_next.update(events, dt)
+        self._btn_search.update(events, dt)
 
         if self._btn_create.clicked:
             self._create_folder(self.STEP_CLASS)
 
+        if self._btn_search.clicked:
+            self._enter_search({})
+            return
+
         if self._btn_next.clicked:
             sel = self._list.get_selected()
             if not sel:
@@ -267,15 +410,53 @@ class QuestionBankScene(BaseScene):
 
     def _update_files(self, dt, events):
         self._file_list.update(events)
-        self._btn_upload.update(events, dt)
         self._btn_delete.update(events, dt)
 
-        if self._btn_upload.clicked:
-            self._open_file_dialog()
+        if self._import_job:
+            self._btn_cancel.update(events, dt)
+            if self._btn_cancel.clicked:
+                self._import_job.cancel()
+        else:
+            self._btn_upload.update(events, dt)
+            self._btn_upload_dir.update(events, dt)
+            self._btn_search_here.update(events, dt)
+            if self._btn_upload.clicked:
+                self._open_file_dialog()
+            elif self._btn_upload_dir.clicked:
+                self._open_dir_dialog()
+            elif self._btn_search_here.clicked:
+                self._enter_search({"cls": self._selected_class, "subject": self._selected_subject})
+                return
 
         if self._btn_delete.clicked:
             self._do_delete()
 
+    def _update_search(self, dt, events):
+        self._search_input.update(events, dt)
+        self._btn_type.update(events, dt)
+        self._btn_diff.update(events, dt)
+        self._result_list.update(events)
+
+        if self._btn_type.clicked:
+            self._type_idx = (self._type_idx + 1) % len(Q_TYPE_FILTERS)
+            self._update_filter_labels()
+        if self._btn_diff.clicked:
+            self._diff_idx = (self._diff_idx + 1) % len(DIFFICULTY_FILTERS)
+            self._update_filter_labels()
+
+        # Tìm khi gõ: đợi SEARCH_DELAY sau thay đổi cuối (lần đầu chạy ngay)
+        key = (self._search_input.value, Q_TYPE_FILTERS[self._type_idx][0],
+               DIFFICULTY_FILTERS[self._diff_idx][0])
+        if key != self._search_key:
+            self._search_timer = self.SEARCH_DELAY if self._search_key else 0.0
+            self._search_key = key
+            self._search_pending = True
+        if self._search_pending and not self._sync_job:
+            self._search_timer -= dt
+            if self._search_timer <= 0:
+                self._search_pending = False
+                self._run_search()
+
     def _open_file_dialog(self):
         """Mở cửa sổ chọn file .docx của hệ điều hành."""
         root = tk.Tk()
@@ -290,6 +471,17 @@ class QuestionBankScene(BaseScene):
         if file_path:
             self._do_upload(file_path)
 
+    def _open_dir_dialog(self):
+        """Chọn thư mục chứa nhiều file .docx."""
+        root = tk.Tk()
+        root.withdraw()
+        root.attributes("-topmost", True)
+        folder = filedialog.askdirectory(title="Chọn thư mục chứa các file .docx")
+        root.destroy()
+
+        if folder:
+            self._do_upload_dir(folder)
+
     # ─── Draw ────────────────────────────────────────────────────
 
     def draw(self):
@@ -299,6 +491,9 @@ class QuestionBankScene(BaseScene):
             self.STEP_CLASS:   "Đẩy Câu Hỏi > Chọn Lớp",
             self.STEP_SUBJECT: f"Đẩy Câu Hỏi > {self._selected_class} > Chọn Môn",
             self.STEP_FILES:   f"Đẩy Câu Hỏi > {self._selected_class} > {self._selected_subject}",
+            self.STEP_SEARCH:  "Đẩy Câu Hỏi > Tìm câu hỏi" + (
+                f" > {self._search_scope['cls']} > {self._search_scope['subject']}"
+                if self._search_scope else ""),
         }
         draw_title_bar(self.screen, "ĐẨY CÂU HỎI", breadcrumb[self._step])
 
@@ -306,6 +501,8 @@ class QuestionBankScene(BaseScene):
             self._draw_folder_step()
         elif self._step == self.STEP_FILES:
             self._draw_files_step()
+        elif self._step == self.STEP_SEARCH:
+            self._draw_search_step()
 
         # Status message
         if self._status_timer > 0:
@@ -323,6 +520,8 @@ class QuestionBankScene(BaseScene):
         self._new_input.draw(self.screen)
         self._btn_create.draw(self.screen)
         self._btn_next.draw(self.screen)
+        if is_class:
+            self._btn_search.draw(self.screen)
 
     def _draw_files_step(self):
         lbl = assets.render_text(
@@ -346,7 +545,13 @@ class QuestionBankScene(BaseScene):
             self.screen.blit(txt, (guide_x, guide_y + i * 20))
 
         self._file_list.draw(self.screen)
-        self._btn_upload.draw(self.screen)
+        if self._import_job:
+            self._btn_cancel.draw(self.screen)
+            self._draw_import_progress()
+        else:
+            self._btn_upload.draw(self.screen)
+            self._btn_upload_dir.draw(self.screen)
+            self._btn_search_here.draw(self.screen)
         self._btn_delete.draw(self.screen)
 
         # Số file
@@ -354,6 +559,64 @@ class QuestionBankScene(BaseScene):
         info = assets.render_text(f"Tổng: {n} bộ đề", "xs", GRAY)
         self.screen.blit(info, (60, 545))
 
+    def _draw_search_step(self):
+        self._search_input.draw(self.screen)
+        self._btn_type.draw(self.screen)
+        self._btn_diff.draw(self.screen)
+        self._result_list.draw(self.screen)
+
+        job = self._sync_job
+        if job:
+            label = job.stage if job.progress is None else f"{job.stage} {job.done}/{job.total} bộ đề"
+            info = assets.render_text(label, "xs", ORANGE)
+            self.screen.blit(info, (60, 570))
+            return
+
+        n = len(self._result_list.items)
+        if n < self._search_total:
+            label = f"{self._search_total} câu khớp · hiện {n} câu đầu"
+        else:
+            label = f"{self._search_total} câu khớp"
+        if not question_store.has_fts:
+            label += " · tìm không dấu cần SQLite có FTS5"
+        info = assets.render_text(label, "xs", GRAY)
+        self.screen.blit(info, (60, 570))
+
+    def _draw_import_progress(self):
+        job = self._import_job
+        rect = pygame.Rect(SCREEN_W - 260, 312, 200, 18)
+        pygame.draw.rect(self.screen, GRAY_DARK, rect, border_radius=6)
+        p = job.progress
+        if p is None:
+            # Chưa biết tổng số block → vạch chạy qua lại
+            t = pygame.time.get_ticks() / 1000.0
+            seg_w = rect.width // 4
+            x = rect.x + int((rect.width - seg_w) * (0.5 + 0.5 * math.sin(t * 3)))
+            pygame.draw.rect(self.screen, ORANGE, (x, rect.y, seg_w, rect.height), border_radius=6)
+        elif int(rect.width * p) > 4:
+            pygame.draw.rect(self.screen, ORANGE, (rect.x, rect.y, int(rect.width * p), rect.height),
+                             border_radius=6)
+        pygame.draw.rect(self.screen, CYAN_DIM, rect, width=2, border_radius=6)
+
+        unit = "file" if isinstance(job, BatchImportJob) else "block"
+        label = job.stage if p is None else f"{job.done}/{job.total} {unit}"
+        if job.errors:
+            label += f" · {len(job.errors)} lỗi"
+        txt = assets.render_text(label, "xs", GRAY)
+        self.screen.blit(txt, (rect.x, rect.bottom + 6))
+        if job.errors:
+            err = assets.render_text(job.errors[-1][:40], "xs", RED)
+            self.screen.blit(err, (rect.x, rect.bottom + 24))
+
+        # Batch: tóm tắt các file vừa xong (câu hợp lệ / block lỗi)
+        for i, r in enumerate(job.results[-4:]):
+            if r["error"]:
+                line, c = f"✗ {r['file'][:22]}", RED
+            else:
+                line, c = f"✓ {r['file'][:18]}  {r['valid']} câu · {r['failed']} lỗi", GREEN
+            ts = assets.render_text(line, "xs", c)
+            self.screen.blit(ts, (rect.x, rect.bottom + 24 + i * 18))
+
     def _draw_status(self):
         alpha = min(255, int(self._status_timer * 80))
         w = min(700, assets.font("sm").size(self._status_msg)[0] + 30)
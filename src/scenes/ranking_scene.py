@@ -1,16 +1,25 @@
 """
 ranking_scene.py - Màn hình Bảng Xếp Hạng
 ============================================
-Hiển thị top 20 người chơi, sắp xếp theo điểm.
+Hiển thị kết quả theo trang (cuộn qua toàn bộ lịch sử), lọc theo lớp / môn /
+khoảng thời gian / chỉ người chơi hiện tại.
 """
 
 import pygame
 import math
+import time
 from src.scenes.base_scene import BaseScene
 from src.constants import *
 from src.assets import assets
 from src.ui_components import Button, Panel, draw_title_bar
-from src.ranking import RankingSystem
+from src.ranking import ranking, player_key
+
+# Khoảng thời gian lọc: (số ngày, nhãn) — None = tất cả
+DATE_FILTERS = [(None, "Tất cả"), (1, "24 giờ"), (7, "7 ngày"), (30, "30 ngày")]
+
+ROW_H        = 46
+TABLE_Y      = 150
+VISIBLE_ROWS = (SCREEN_H - TABLE_Y - 140) // ROW_H
 
 
 class RankingScene(BaseScene):
@@ -18,10 +27,27 @@ class RankingScene(BaseScene):
 
     def __init__(self, screen, manager):
         super().__init__(screen, manager)
-        self._ranking = RankingSystem()
-        self._entries = self._ranking.get_top(20)
+        self._ranking = ranking
+        self._entries = []      # Trang đang hiện: [(rank, entry), ...]
+        self._total = 0         # Số kết quả khớp bộ lọc
         self._time = 0.0
-        self._scroll = 0
+        self._scroll = 0        # Vị trí hàng đầu tiên của trang
+        self._ready = self._ranking.ready   # Lịch sử đọc nền lúc khởi động — có thể chưa xong
+
+        # Bộ lọc
+        self._classes = [None] + self._ranking.classes()
+        self._subjects = [None]
+        self._cls_idx = 0
+        self._subj_idx = 0
+        self._date_idx = 0
+        self._only_me = False
+        self._btn_cls = Button(40, 92, 220, 42, "", font_size="sm")
+        self._btn_subj = Button(275, 92, 220, 42, "", font_size="sm")
+        self._btn_date = Button(510, 92, 200, 42, "", font_size="sm")
+        self._btn_me = Button(725, 92, 180, 42, "", font_size="sm")
+        self._since = None
+        self._update_filter_labels()
+        self._refresh()
 
         self._btn_back = Button(
             30, SCREEN_H - 65, 140, BUTTON_H, "← Quay lại",
@@ -35,20 +61,81 @@ class RankingScene(BaseScene):
         self._confirm_clear = False
         self._confirm_timer = 0.0
 
+    # ─── Dữ liệu ─────────────────────────────────────────────────
+
+    def _update_filter_labels(self):
+        cls = self._classes[self._cls_idx]
+        subj = self._subjects[self._subj_idx]
+        self._btn_cls.text = f"Lớp: {cls or 'Tất cả'}"
+        self._btn_subj.text = f"Môn: {subj or 'Tất cả'}"
+        self._btn_date.text = f"Thời gian: {DATE_FILTERS[self._date_idx][1]}"
+        self._btn_me.text = "Chỉ tôi: Bật" if self._only_me else "Chỉ tôi: Tắt"
+
+    def _refresh(self):
+        """Lấy lại trang hiện tại theo bộ lọc + vị trí cuộn."""
+        filters = {
+            "cls": self._classes[self._cls_idx],
+            "subject": self._subjects[self._subj_idx],
+            "since": self._since,
+            "player": self.state.player_name if self._only_me else None,
+        }
+        self._entries, self._total = self._ranking.query(self._scroll, VISIBLE_ROWS, **filters)
+        max_scroll = max(0, self._total - VISIBLE_ROWS)
+        if self._scroll > max_scroll:
+            self._scroll = max_scroll
+            self._entries, self._total = self._ranking.query(self._scroll, VISIBLE_ROWS, **filters)
+
+    def _set_filter(self):
+        days = DATE_FILTERS[self._date_idx][0]
+        # Chốt mốc thời gian khi đổi bộ lọc — cuộn không làm bộ lọc "trôi"
+        self._since = time.time() - days * 86400 if days else None
+        self._scroll = 0
+        self._update_filter_labels()
+        self._refresh()
+
+    # ─── Update ──────────────────────────────────────────────────
+
     def update(self, dt: float, events: list):
         self._time += dt
         self._confirm_timer = max(0.0, self._confirm_timer - dt)
+        if not self._ready and self._ranking.ready:
+            self._ready = True
+            self._classes = [None] + self._ranking.classes()
+            self._refresh()
 
         self._btn_back.update(events, dt)
         self._btn_clear.update(events, dt)
+        self._btn_cls.update(events, dt)
+        self._btn_subj.update(events, dt)
+        self._btn_date.update(events, dt)
+        if self.state.player_name:
+            self._btn_me.update(events, dt)
 
         if self._btn_back.clicked:
             self.manager.go_to(SCENE_MENU)
 
-        if self._btn_clear.clicked:
+        if self._btn_cls.clicked:
+            self._cls_idx = (self._cls_idx + 1) % len(self._classes)
+            self._subjects = [None] + self._ranking.subjects(self._classes[self._cls_idx])
+            self._subj_idx = 0
+            self._set_filter()
+        if self._btn_subj.clicked:
+            self._subjects = [None] + self._ranking.subjects(self._classes[self._cls_idx])
+            self._subj_idx = (self._subj_idx + 1) % len(self._subjects)
+            self._set_filter()
+        if self._btn_date.clicked:
+            self._date_idx = (self._date_idx + 1) % len(DATE_FILTERS)
+            self._set_filter()
+        if self._btn_me.clicked:
+            self._only_me = not self._only_me
+            self._set_filter()
+
+        if self._btn_clear.clicked and self._ready:
             if self._confirm_clear:
                 self._ranking.clear()
-                self._entries = []
+                self._classes, self._subjects = [None], [None]
+                self._cls_idx = self._subj_idx = 0
+                self._set_filter()
                 self._confirm_clear = False
             else:
                 self._confirm_clear = True
@@ -57,21 +144,57 @@ class RankingScene(BaseScene):
         if self._confirm_timer <= 0:
             self._confirm_clear = False
 
-        # Scroll
+        # Scroll: chuột 3 hàng / nấc, PageUp/PageDown 1 trang, Home/End đầu/cuối bảng
+        scroll = self._scroll
         for event in events:
             if event.type == pygame.MOUSEWHEEL:
-                self._scroll = max(0, self._scroll - event.y)
+                scroll -= event.y * 3
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_PAGEDOWN:
+                    scroll += VISIBLE_ROWS
+                elif event.key == pygame.K_PAGEUP:
+                    scroll -= VISIBLE_ROWS
+                elif event.key == pygame.K_HOME:
+                    scroll = 0
+                elif event.key == pygame.K_END:
+                    scroll = self._total
+        scroll = max(0, min(scroll, self._total - VISIBLE_ROWS))
+        if scroll != self._scroll:
+            self._scroll = scroll
+            self._refresh()
+
+    # ─── Draw ────────────────────────────────────────────────────
 
     def draw(self):
         self.screen.fill(DARK_BG)
-        draw_title_bar(self.screen, "BẢNG XẾP HẠNG", f"Top {len(self._entries)} người chơi")
+        draw_title_bar(self.screen, "BẢNG XẾP HẠNG", f"{self._total} kết quả")
+
+        self._btn_cls.draw(self.screen)
+        self._btn_subj.draw(self.screen)
+        self._btn_date.draw(self.screen)
+        if self.state.player_name:
+            self._btn_me.draw(self.screen)
 
         if not self._entries:
-            empty = assets.render_text("Chưa có kết quả nào. Hãy chơi và lập kỷ lục!", "md", GRAY)
+            if not self._ready:
+                msg = "Đang tải bảng xếp hạng…"
+            elif not self._ranking.count():
+                msg = "Chưa có kết quả nào. Hãy chơi và lập kỷ lục!"
+            else:
+                msg = "Không có kết quả nào khớp bộ lọc."
+            empty = assets.render_text(msg, "md", GRAY)
             self.screen.blit(empty, (SCREEN_W // 2 - empty.get_width() // 2, SCREEN_H // 2))
         else:
             self._draw_table()
 
+        # Hạng tốt nhất của người chơi hiện tại
+        best = self._ranking.get_player_best(self.state.player_name) if self.state.player_name else None
+        if best:
+            me = assets.render_text(
+                f"{self.state.player_name}: hạng #{self._ranking.rank_of(best)} · {best['score']} điểm",
+                "sm", CYAN)
+            self.screen.blit(me, (SCREEN_W // 2 - me.get_width() // 2, SCREEN_H - 52))
+
         self._btn_back.draw(self.screen)
 
         # Clear button với xác nhận
@@ -87,21 +210,17 @@ class RankingScene(BaseScene):
         col_w = [60, 320, 140, 60, 60, 200]
 
         # Header
-        header_y = 105
+        header_y = TABLE_Y
         for i, (hdr, x) in enumerate(zip(headers, col_x)):
             hdr_surf = assets.render_text(hdr, "xs", CYAN, bold=True)
             self.screen.blit(hdr_surf, (x, header_y))
 
-        pygame.draw.line(self.screen, CYAN_DIM, (40, 128), (SCREEN_W - 40, 128), 1)
-
-        # Rows
-        row_h = 46
-        visible_rows = (SCREEN_H - 190) // row_h
-        start = self._scroll
+        pygame.draw.line(self.screen, CYAN_DIM, (40, TABLE_Y + 23), (SCREEN_W - 40, TABLE_Y + 23), 1)
 
-        for i, entry in enumerate(self._entries[start:start + visible_rows]):
-            rank = start + i + 1
-            row_y = 140 + i * row_h
+        # Rows (rank = thứ hạng trong toàn bảng, kể cả khi đang lọc)
+        row_h = ROW_H
+        for i, (rank, entry) in enumerate(self._entries):
+            row_y = TABLE_Y + 35 + i * row_h
 
             # Highlight top 3
             if rank == 1:
@@ -129,7 +248,7 @@ class RankingScene(BaseScene):
             # Tên
             # Highlight nếu là người chơi hiện tại
             is_current = (
-                entry["name"].lower() == self.state.player_name.lower()
+                player_key(entry["name"]) == player_key(self.state.player_name)
             )
             name_color = CYAN if is_current else WHITE
             name_surf = assets.render_text(entry["name"][:28], "sm", name_color,
@@ -154,6 +273,8 @@ class RankingScene(BaseScene):
             self.screen.blit(date_surf, (col_x[5], row_y + 14))
 
         # Scrollbar hint
-        if len(self._entries) > visible_rows:
-            hint = assets.render_text("Cuộn để xem thêm ↕", "xs", GRAY)
+        if self._total > VISIBLE_ROWS:
+            last = min(self._scroll + VISIBLE_ROWS, self._total)
+            hint = assets.render_text(
+                f"{self._scroll + 1}–{last} / {self._total}  ·  Cuộn / PgUp / PgDn ↕", "xs", GRAY)
             self.screen.blit(hint, (SCREEN_W // 2 - hint.get_width() // 2, SCREEN_H - 105))
\ No newline at end of file
@@ -7,14 +7,15 @@ from src.scenes.base_scene import BaseScene
 from src.constants import *
 from src.assets import assets
 from src.ui_components import Button, Panel, ScrollList, draw_title_bar
-from src.ranking import RankingSystem
+from src.ranking import ranking
+from src.progress_store import progress_store
 
 
 class ResultScene(BaseScene):
 
     def __init__(self, screen, manager):
         super().__init__(screen, manager)
-        self._ranking = RankingSystem()
+        self._ranking = ranking
         self._time    = 0.0
         self._mode    = "result"   # "result" | "review"
 
@@ -25,7 +26,10 @@ class ResultScene(BaseScene):
             self.state.correct_count,
             self.state.wrong_count,
             len(answered),
+            cls=self.state.selected_class,
+            subject=self.state.selected_subject,
         )
+        self._entry = self._ranking.last_entry   # Tra hạng lại nếu BXH chưa đọc xong (_rank = 0)
 
         # === Xây danh sách CÂU ĐÃ LÀM (result mode) ===
         items_all = []
@@ -78,6 +82,8 @@ class ResultScene(BaseScene):
 
     def update(self, dt, events):
         self._time += dt
+        if not self._rank and self._ranking.ready:
+            self._rank = self._ranking.rank_of(self._entry)
         target = self.state.current_score
         if self._display_score < target:
             self._display_score = min(target, self._display_score + max(1, int(target * dt * 3)))
@@ -117,12 +123,17 @@ class ResultScene(BaseScene):
     # ─── RESULT MODE ─────────────────────────────────────────
 
     def _draw_result_mode(self):
-        draw_title_bar(self.screen, "KẾT QUẢ", f"Người chơi: {self.state.player_name}")
+        subtitle = f"Người chơi: {self.state.player_name}"
+        # Tiến độ tích luỹ — GameplayScene đã giao đọc nền; chưa xong thì bỏ qua, không chờ
+        progress = progress_store.player(self.state.player_name) if self.state.player_name else None
+        if progress:
+            subtitle += f"  ·  Đã luyện {len(progress)} câu · đúng {progress.accuracy():.0%}"
+        draw_title_bar(self.screen, "KẾT QUẢ", subtitle)
         cx = SCREEN_W // 2
 
         # Rank badge
-        rank_text  = f"#{self._rank}"
-        rank_color = YELLOW if self._rank <= 3 else CYAN
+        rank_text  = f"#{self._rank}" if self._rank else "#…"
+        rank_color = YELLOW if 0 < self._rank <= 3 else CYAN
         rank_surf  = assets.render_text(rank_text, "xl", rank_color, bold=True)
         self.screen.blit(rank_surf, (cx - rank_surf.get_width()//2, 80))
         rl = assets.render_text("Xếp Hạng", "xs", GRAY)
@@ -3,14 +3,15 @@ start_scene.py - Màn hình Bắt Đầu Game
 """
 
 import pygame
-import os
-import json
 from src.scenes.base_scene import BaseScene
 from src.constants import *
 from src.assets import assets
 from src.ui_components import (
     Button, Panel, TextInput, ScrollList, draw_title_bar
 )
+from src.question_catalog import question_catalog
+from src.question_store import question_store
+from src.question_importer import StoreSyncJob
 
 
 class StartScene(BaseScene):
@@ -65,9 +66,23 @@ class StartScene(BaseScene):
             font_size="md", icon=""
         )
 
+        # Lọc câu hỏi trong các bộ đề đã chọn (bước files) — index vào *_FILTERS
+        self._type_idx = 0
+        self._diff_idx = 0
+        self._btn_type = Button(
+            SCREEN_W // 2 + 320, 200, 220, 46, "", font_size="sm"
+        )
+        self._btn_diff = Button(
+            SCREEN_W // 2 + 320, 258, 220, 46, "", font_size="sm"
+        )
+        self._update_filter_labels()
+
         self._error_msg = ""
         self._error_timer = 0.0
 
+        # Lập chỉ mục các bộ đề đã chọn trước khi lọc (None = không có)
+        self._sync_job: StoreSyncJob | None = None
+
         # Load danh sách lớp ngay nếu multiplayer (skip name step)
         if self._step == "class":
             self._load_classes()
@@ -76,68 +91,54 @@ class StartScene(BaseScene):
 
     def _load_classes(self):
         items = []
-        if os.path.isdir(DATA_DIR):
-            for name in sorted(os.listdir(DATA_DIR)):
-                path = os.path.join(DATA_DIR, name)
-                if os.path.isdir(path):
-                    subjects = [
-                        s for s in os.listdir(path)
-                        if os.path.isdir(os.path.join(path, s))
-                    ]
-                    items.append({
-                        "id": name,
-                        "text": f"{name}",
-                        "badge": f"{len(subjects)} môn",
-                    })
+        for c in question_catalog.classes():
+            items.append({
+                "id": c["name"],
+                "text": f"{c['name']}",
+                "badge": f"{c['subjects']} môn",
+            })
         self._list.set_items(items)
 
     def _load_subjects(self, class_name: str):
         items = []
-        class_path = os.path.join(DATA_DIR, class_name)
-        if os.path.isdir(class_path):
-            for name in sorted(os.listdir(class_path)):
-                path = os.path.join(class_path, name)
-                if os.path.isdir(path):
-                    n_files = len([
-                        f for f in os.listdir(path) if f.endswith(".json")
-                    ])
-                    items.append({
-                        "id": name,
-                        "text": f"{name}",
-                        "badge": f"{n_files} bộ đề",
-                    })
+        for s in question_catalog.subjects(class_name):
+            items.append({
+                "id": s["name"],
+                "text": f"{s['name']}",
+                "badge": f"{s['files']} bộ đề",
+            })
         self._list.set_items(items)
 
     def _load_files(self, class_name: str, subject_name: str):
         items = []
-        subject_path = os.path.join(DATA_DIR, class_name, subject_name)
-        if os.path.isdir(subject_path):
-            for fname in sorted(os.listdir(subject_path)):
-                if fname.endswith(".json"):
-                    fpath = os.path.join(subject_path, fname)
-                    n_q = 0
-                    try:
-                        with open(fpath, encoding="utf-8") as f:
-                            data = json.load(f)
-                        n_q = len(data.get("questions", []))
-                    except Exception:
-                        pass
-                    items.append({
-                        "id": fpath,
-                        "text": f"{fname[:-5]}",
-                        "badge": f"{n_q} câu",
-                    })
+        for e in question_catalog.files(class_name, subject_name):
+            items.append({
+                "id": e["path"],
+                "text": f"{e['name']}",
+                "badge": f"{e['count']} câu",
+            })
         self._file_list.set_items(items)
 
+    def _update_filter_labels(self):
+        self._btn_type.text = f"Dạng: {Q_TYPE_FILTERS[self._type_idx][1]}"
+        self._btn_diff.text = f"Độ khó: {DIFFICULTY_FILTERS[self._diff_idx][1]}"
+
     # ─── Update ──────────────────────────────────────────────────
 
     def update(self, dt: float, events: list):
         self._error_timer = max(0.0, self._error_timer - dt)
         self._btn_menu.update(events, dt)
         if self._btn_menu.clicked:
+            if self._sync_job:
+                self._sync_job.cancel()
             self.manager.go_to(SCENE_MENU)
             return
 
+        if self._sync_job:
+            # Đang lập chỉ mục sau khi bấm Bắt Đầu — chờ xong, không nhận thao tác khác
+            self._poll_sync()
+            return
+
         if self._step == "name":
             self._update_name(dt, events)
         elif self._step == "class":
@@ -207,6 +208,15 @@ class StartScene(BaseScene):
         self._file_list.update(events)
         self._btn_start.update(events, dt)
         self._btn_back.update(events, dt)
+        self._btn_type.update(events, dt)
+        self._btn_diff.update(events, dt)
+
+        if self._btn_type.clicked:
+            self._type_idx = (self._type_idx + 1) % len(Q_TYPE_FILTERS)
+            self._update_filter_labels()
+        if self._btn_diff.clicked:
+            self._diff_idx = (self._diff_idx + 1) % len(DIFFICULTY_FILTERS)
+            self._update_filter_labels()
 
         if self._btn_back.clicked:
             self._step = "subject"
@@ -218,16 +228,48 @@ class StartScene(BaseScene):
                 self._show_error("Chọn ít nhất 1 bộ đề!")
                 return
             self.state.selected_question_files = [it["id"] for it in sel]
-            self.state.current_score = 0
-            self.state.correct_count = 0
-            self.state.wrong_count = 0
-            self.state.answered_questions = []
-            self.state.session_wrong = 0
-            # Route theo mode
-            if getattr(self.state, "multiplayer_mode", False):
-                self.manager.go_to(SCENE_MULTIPLAYER)
-            else:
-                self.manager.go_to(SCENE_GAMEPLAY)
+            self.state.selected_class = self._selected_class
+            self.state.selected_subject = self._selected_subject
+            qtype = Q_TYPE_FILTERS[self._type_idx][0]
+            diff  = DIFFICULTY_FILTERS[self._diff_idx][0]
+            # Có lọc → lấy pool từ kho SQLite thay vì nguyên file
+            self.state.question_query = (
+                {"paths": self.state.selected_question_files, "qtype": qtype, "difficulty": diff}
+                if qtype or diff else None
+            )
+            if self.state.question_query:
+                # Đồng bộ kho trên thread nền, đếm + vào game khi xong (_poll_sync)
+                self._sync_job = StoreSyncJob(question_store, self.state.selected_question_files).start()
+                return
+            self._start_game()
+
+    def _poll_sync(self):
+        """Nhận message từ thread lập chỉ mục; xong thì kiểm tra bộ lọc rồi vào game."""
+        job = self._sync_job
+        for msg in job.poll():
+            if msg[0] == "failed":
+                self._show_error(msg[1])
+        if job.running:
+            return
+        self._sync_job = None
+        if job.state != job.DONE:
+            return
+        if not question_store.count(**self.state.question_query):
+            self._show_error("Không có câu hỏi nào khớp bộ lọc!")
+            return
+        self._start_game()
+
+    def _start_game(self):
+        self.state.current_score = 0
+        self.state.correct_count = 0
+        self.state.wrong_count = 0
+        self.state.answered_questions = []
+        self.state.session_wrong = 0
+        # Route theo mode
+        if getattr(self.state, "multiplayer_mode", False):
+            self.manager.go_to(SCENE_MULTIPLAYER)
+        else:
+            self.manager.go_to(SCENE_GAMEPLAY)
 
     def _show_error(self, msg: str):
         self._error_msg = msg
@@ -331,11 +373,18 @@ class StartScene(BaseScene):
         else:
             self._file_list.draw(self.screen)
 
-        # Số đã chọn
+        # Số đã chọn (hoặc tiến độ lập chỉ mục sau khi bấm Bắt Đầu)
         n_sel = len(self._file_list.selected_ids)
-        if n_sel:
+        job = self._sync_job
+        if job:
+            label = job.stage if job.progress is None else f"{job.stage} {job.done}/{job.total} bộ đề"
+            info = assets.render_text(label, "sm", ORANGE)
+            self.screen.blit(info, (SCREEN_W // 2 - info.get_width() // 2, 575))
+        elif n_sel:
             info = assets.render_text(f"Đã chọn: {n_sel} bộ đề", "sm", GREEN)
             self.screen.blit(info, (SCREEN_W // 2 - info.get_width() // 2, 575))
 
+        self._btn_type.draw(self.screen)
+        self._btn_diff.draw(self.screen)
         self._btn_start.draw(self.screen)
         self._btn_back.draw(self.screen)
\ No newline at end of file
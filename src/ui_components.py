@@ -6,6 +6,7 @@ import pygame
 import math
 from src.constants import *
 from src.assets import assets
+from src.post_fx import post_fx
 
 
 class Button:
@@ -173,10 +174,7 @@ class HealthBar:
         # Glow ở đầu thanh máu
         if fill_w > 10:
             glow_x = self.rect.x + fill_w - 6
-            glow_surf = pygame.Surface((12, self.rect.height), pygame.SRCALPHA)
-            glow_color = (*color, 180)
-            pygame.draw.rect(glow_surf, glow_color, glow_surf.get_rect())
-            surface.blit(glow_surf, (glow_x, self.rect.y))
+            post_fx.fade(surface, 180, color, (glow_x, self.rect.y, 12, self.rect.height))
 
         # Viền
         pygame.draw.rect(surface, CYAN_DIM, self.rect, width=2, border_radius=6)